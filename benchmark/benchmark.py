@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import resource
+import tempfile
+import concurrent.futures
+
+os.environ["PYTHONUNBUFFERED"]="1"
+benchmarkPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(benchmarkPath))
+sys.path.append(benchmarkPath)
+import libertyParser
+import genLib
+
+################
+# Main Process #
+################
+def readArgs():
+    """
+    Read arguments.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark libertyParser on synthetic liberty files with several scales.')
+
+    parser.add_argument('-c', '--cells', type=int, nargs='+', default=[100, 1000], help='Cell numbers (scales), default is 100 1000.')
+    parser.add_argument('-p', '--pins', type=int, default=4, help='Input pin number per cell, default is 4.')
+    parser.add_argument('-t', '--table', type=int, nargs=2, default=[7, 7], help='Table dimension, default is 7 7.')
+    parser.add_argument('--ocv', action='store_true', default=False, help='Add OCV tables.')
+    parser.add_argument('--ccs', action='store_true', default=False, help='Add CCS vectors.')
+    parser.add_argument('--bus', type=int, default=2, help='Bus/bundle group number per cell, default is 2.')
+    parser.add_argument('--comments', action='store_true', default=False, help='Add comments.')
+    parser.add_argument('--continuations', action='store_true', default=False, help='Split long attributes with line continuations.')
+    parser.add_argument('-d', '--dir', default='', help='Directory for the synthetic liberty files, default is a temporary directory.')
+    parser.add_argument('-o', '--output', default='', help='Save the benchmark results into the JSON file.')
+    parser.add_argument('--compare', default='', help='Compare with the benchmark results JSON file of another version.')
+
+    args = parser.parse_args()
+
+    return args
+
+
+def timeIt(resultDic, name, function, *args, **kwargs):
+    """
+    Run function, save the wall time (seconds) into resultDic['time'][name].
+    """
+    startTime = time.perf_counter()
+    result = function(*args, **kwargs)
+    resultDic['time'][name] = time.perf_counter() - startTime
+
+    return result
+
+
+def runScale(libFile, lineNum):
+    """
+    Run all of the benchmark items on one liberty file (on a new process, so the peak RSS is for this scale only).
+    """
+    resultDic = {'time': {}}
+    libSize = os.path.getsize(libFile)
+
+    myLibertyParser = timeIt(resultDic, 'libertyParser', libertyParser.libertyParser, libFile)
+    resultDic['lines_per_second'] = lineNum / resultDic['time']['libertyParser']
+    resultDic['bytes_per_second'] = libSize / resultDic['time']['libertyParser']
+    resultDic['metrics'] = getattr(myLibertyParser, 'metrics', {})
+
+    # Parse again to time organizeData separately.
+    groupList = myLibertyParser.libertyParser(libFile)
+    timeIt(resultDic, 'organizeData', myLibertyParser.organizeData, groupList)
+
+    timeIt(resultDic, 'getCellArea', myLibertyParser.getCellArea)
+    timeIt(resultDic, 'getCellLeakagePower', myLibertyParser.getCellLeakagePower)
+    timeIt(resultDic, 'getLibPinInfo', myLibertyParser.getLibPinInfo)
+
+    cellList = myLibertyParser.getCellList()
+    subCellList = cellList[::max(len(cellList)//10, 1)][:10]
+    cellLibFile = timeIt(resultDic, 'genCellLibFile', myLibertyParser.genCellLibFile, libFile, subCellList)
+    os.remove(cellLibFile)
+
+    restoreLibFile = str(libFile) + '.restore'
+
+    if os.path.exists(restoreLibFile):
+        os.remove(restoreLibFile)
+
+    timeIt(resultDic, 'restoreLib', myLibertyParser.restoreLib, restoreLibFile)
+    os.remove(restoreLibFile)
+
+    # ru_maxrss is KB on linux.
+    resultDic['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    return resultDic
+
+
+def compareResults(resultDic, compareResultDic):
+    """
+    Print the time ratio (current / compared) for every benchmark item, ratio > 1 means slower.
+    """
+    print('')
+    print('>>> Compare with ' + str(compareResultDic.get('date', '')) + ' results (current / compared).')
+
+    for option in ('pins', 'table', 'ocv', 'ccs', 'bus', 'comments', 'continuations'):
+        if resultDic['options'].get(option) != compareResultDic.get('options', {}).get(option):
+            print('*Warning*: option "' + str(option) + '" is different, the liberty files are not the same.')
+
+    for (scale, scaleDic) in resultDic['scale'].items():
+        if scale not in compareResultDic.get('scale', {}):
+            continue
+
+        compareScaleDic = compareResultDic['scale'][scale]
+
+        for (name, seconds) in scaleDic['time'].items():
+            if compareScaleDic['time'].get(name):
+                ratio = seconds / compareScaleDic['time'][name]
+                print('    ' + str(scale) + ' cells, ' + str(name).ljust(20) + ' : ' + '%.2f' % ratio + ('  (slower)' if ratio > 1.1 else ''))
+
+        if compareScaleDic.get('peak_rss_mb'):
+            print('    ' + str(scale) + ' cells, ' + 'peak_rss_mb'.ljust(20) + ' : ' + '%.2f' % (scaleDic['peak_rss_mb'] / compareScaleDic['peak_rss_mb']))
+
+
+def main():
+    args = readArgs()
+    libDir = args.dir if args.dir else tempfile.mkdtemp(prefix='libertyParserBenchmark.')
+    resultDic = {
+                 'date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                 'python': platform.python_version(),
+                 'platform': platform.platform(),
+                 'options': vars(args),
+                 'scale': {},
+                }
+
+    for cells in args.cells:
+        libFile = os.path.join(libDir, 'synthetic_' + str(cells) + '.lib')
+        myLibGenerator = genLib.libGenerator(cells=cells, pins=args.pins, table=args.table, ocv=args.ocv, ccs=args.ccs, bus=args.bus, comments=args.comments, continuations=args.continuations)
+        lineNum = myLibGenerator.write(libFile)
+
+        print('')
+        print('>>> ' + str(cells) + ' cells, ' + str(lineNum) + ' lines, ' + str(os.path.getsize(libFile)) + ' bytes : ' + str(libFile))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            scaleDic = executor.submit(runScale, libFile, lineNum).result()
+
+        scaleDic['lines'] = lineNum
+        scaleDic['bytes'] = os.path.getsize(libFile)
+        resultDic['scale'][str(cells)] = scaleDic
+
+        for (name, seconds) in scaleDic['time'].items():
+            print('    ' + str(name).ljust(20) + ' : ' + '%.4f' % seconds + ' s')
+
+        print('    ' + 'lines/sec'.ljust(20) + ' : ' + '%.0f' % scaleDic['lines_per_second'])
+        print('    ' + 'peak RSS'.ljust(20) + ' : ' + '%.1f' % scaleDic['peak_rss_mb'] + ' MB')
+
+        if not args.dir:
+            os.remove(libFile)
+
+            if os.path.exists(libFile + '.index'):
+                os.remove(libFile + '.index')
+
+    if not args.dir:
+        os.rmdir(libDir)
+
+    if args.output:
+        with open(args.output, 'w') as OF:
+            json.dump(resultDic, OF, indent=2)
+
+        print('')
+        print('>>> Save benchmark results into "' + str(args.output) + '".')
+
+    if args.compare:
+        with open(args.compare, 'r') as CF:
+            compareResultDic = json.load(CF)
+
+        compareResults(resultDic, compareResultDic)
+
+if __name__ == '__main__':
+    main()
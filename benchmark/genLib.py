@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import random
+import argparse
+
+os.environ["PYTHONUNBUFFERED"]="1"
+
+################
+# Main Process #
+################
+def readArgs():
+    """
+    Read arguments.
+    """
+    parser = argparse.ArgumentParser(description='Generate a deterministic synthetic liberty file for benchmark.')
+
+    parser.add_argument('-o', '--output', default='./synthetic.lib', help='Output liberty file, default is "./synthetic.lib".')
+    parser.add_argument('-c', '--cells', type=int, default=100, help='Cell number, default is 100.')
+    parser.add_argument('-p', '--pins', type=int, default=4, help='Input pin number per cell (there is one output pin), default is 4.')
+    parser.add_argument('-a', '--arcs', type=int, default=0, help='Timing arc number per output pin, default is the input pin number.')
+    parser.add_argument('-t', '--table', type=int, nargs=2, default=[7, 7], help='Table dimension (index_1 length, index_2 length), default is 7 7.')
+    parser.add_argument('--ocv', action='store_true', default=False, help='Add OCV (ocv_sigma_*) tables.')
+    parser.add_argument('--ccs', action='store_true', default=False, help='Add CCS (output_current_*) vectors.')
+    parser.add_argument('--bus', type=int, default=0, help='Bus/bundle group number per cell, default is 0.')
+    parser.add_argument('--comments', action='store_true', default=False, help='Add comments.')
+    parser.add_argument('--continuations', action='store_true', default=False, help='Split long attributes with line continuations.')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Random seed, default is 0.')
+
+    args = parser.parse_args()
+
+    return args
+
+
+class libGenerator():
+    """
+    Generate synthetic liberty file, the same arguments (include seed) always generate the same liberty file.
+    """
+    def __init__(self, cells=100, pins=4, arcs=0, table=[7, 7], ocv=False, ccs=False, bus=0, comments=False, continuations=False, seed=0):
+        self.cells = cells
+        self.pins = pins
+        self.arcs = arcs if arcs > 0 else pins
+        self.table = table
+        self.ocv = ocv
+        self.ccs = ccs
+        self.bus = bus
+        self.comments = comments
+        self.continuations = continuations
+        self.random = random.Random(seed)
+
+        self.index1 = self.genIndex(table[0], 0.01, 1.5)
+        self.index2 = self.genIndex(table[1], 0.001, 0.6)
+
+    def genIndex(self, length, minValue, maxValue):
+        if length == 1:
+            return [minValue]
+
+        return [minValue + (maxValue - minValue) * i * i / ((length - 1) * (length - 1)) for i in range(length)]
+
+    def formatList(self, valueList):
+        return ', '.join(['%.6g' % value for value in valueList])
+
+    def write(self, libFile):
+        """
+        Write the synthetic liberty file, return the line number.
+        """
+        self.lineNum = 0
+
+        with open(libFile, 'w') as LF:
+            self.LF = LF
+            self.genHead()
+
+            for i in range(self.cells):
+                self.genCell(i)
+
+            self.writeLine(0, '}')
+
+        return self.lineNum
+
+    def writeLine(self, depth, line):
+        self.LF.write('  '*depth + line + '\n')
+        self.lineNum += 1
+
+    def writeAttribute(self, depth, key, value):
+        self.writeLine(depth, key + ' : ' + str(value) + ';')
+
+    def writeIndex(self, depth, key, valueList):
+        if self.continuations and (len(valueList) > 4):
+            self.writeLine(depth, key + ' ( \\')
+            self.writeLine(depth + 1, '"' + self.formatList(valueList) + '" \\')
+            self.writeLine(depth, ');')
+        else:
+            self.writeLine(depth, key + ' ("' + self.formatList(valueList) + '");')
+
+    def writeValues(self, depth, rowList):
+        if self.continuations:
+            self.writeLine(depth, 'values ( \\')
+
+            for (i, row) in enumerate(rowList):
+                if i == len(rowList) - 1:
+                    self.writeLine(depth + 1, '"' + self.formatList(row) + '" \\')
+                else:
+                    self.writeLine(depth + 1, '"' + self.formatList(row) + '", \\')
+
+            self.writeLine(depth, ');')
+        else:
+            self.writeLine(depth, 'values (' + ', '.join(['"' + self.formatList(row) + '"' for row in rowList]) + ');')
+
+    def genTableValues(self, scale):
+        rowList = []
+
+        for transition in self.index1:
+            rowList.append([scale * (0.02 + 0.3 * transition + 2.5 * load) * (1 + 0.02 * self.random.random()) for load in self.index2])
+
+        return rowList
+
+    def genTable(self, depth, tableType, templateName, scale):
+        self.writeLine(depth, tableType + ' (' + templateName + ') {')
+
+        if tableType.startswith('ocv_sigma'):
+            self.writeAttribute(depth + 1, 'sigma_type', 'early')
+
+        self.writeIndex(depth + 1, 'index_1', self.index1)
+        self.writeIndex(depth + 1, 'index_2', self.index2)
+        self.writeValues(depth + 1, self.genTableValues(scale))
+        self.writeLine(depth, '}')
+
+    def genHead(self):
+        self.writeLine(0, 'library (synthetic) {')
+
+        if self.comments:
+            self.writeLine(1, '/* Synthetic liberty file for libertyParser benchmark. */')
+
+        self.writeAttribute(1, 'delay_model', 'table_lookup')
+        self.writeAttribute(1, 'time_unit', '"1ns"')
+        self.writeAttribute(1, 'voltage_unit', '"1V"')
+        self.writeAttribute(1, 'current_unit', '"1mA"')
+        self.writeAttribute(1, 'leakage_power_unit', '"1nW"')
+        self.writeLine(1, 'capacitive_load_unit (1,pf);')
+        self.writeAttribute(1, 'nom_voltage', 0.9)
+        self.writeAttribute(1, 'nom_temperature', 25)
+        self.writeLine(1, 'voltage_map (VDD, 0.9);')
+        self.writeLine(1, 'voltage_map (VSS, 0.0);')
+
+        self.writeLine(1, 'lu_table_template (delay_template) {')
+        self.writeAttribute(2, 'variable_1', 'input_net_transition')
+        self.writeAttribute(2, 'variable_2', 'total_output_net_capacitance')
+        self.writeIndex(2, 'index_1', self.index1)
+        self.writeIndex(2, 'index_2', self.index2)
+        self.writeLine(1, '}')
+
+        self.writeLine(1, 'power_lut_template (power_template) {')
+        self.writeAttribute(2, 'variable_1', 'input_transition_time')
+        self.writeAttribute(2, 'variable_2', 'total_output_net_capacitance')
+        self.writeIndex(2, 'index_1', self.index1)
+        self.writeIndex(2, 'index_2', self.index2)
+        self.writeLine(1, '}')
+
+        if self.ccs:
+            self.writeLine(1, 'output_current_template (ccs_template) {')
+            self.writeAttribute(2, 'variable_1', 'input_net_transition')
+            self.writeAttribute(2, 'variable_2', 'total_output_net_capacitance')
+            self.writeAttribute(2, 'variable_3', 'time')
+            self.writeLine(1, '}')
+
+    def genPin(self, depth, pinName, direction, relatedPinList):
+        self.writeLine(depth, 'pin (' + pinName + ') {')
+        self.writeAttribute(depth + 1, 'direction', direction)
+
+        if direction == 'input':
+            self.writeAttribute(depth + 1, 'capacitance', '%.6g' % (0.001 + 0.002 * self.random.random()))
+            self.writeAttribute(depth + 1, 'related_power_pin', 'VDD')
+            self.writeAttribute(depth + 1, 'related_ground_pin', 'VSS')
+        else:
+            self.writeAttribute(depth + 1, 'function', '"!(' + ' & '.join(relatedPinList) + ')"')
+            self.writeAttribute(depth + 1, 'max_capacitance', 0.6)
+
+            for relatedPin in relatedPinList[:self.arcs]:
+                if self.comments:
+                    self.writeLine(depth + 1, '/* ' + str(relatedPin) + ' -> ' + str(pinName) + ' */')
+
+                self.writeLine(depth + 1, 'timing () {')
+                self.writeAttribute(depth + 2, 'related_pin', '"' + relatedPin + '"')
+                self.writeAttribute(depth + 2, 'timing_sense', 'negative_unate')
+                self.writeAttribute(depth + 2, 'timing_type', 'combinational')
+
+                for tableType in ('cell_rise', 'cell_fall', 'rise_transition', 'fall_transition'):
+                    self.genTable(depth + 2, tableType, 'delay_template', 1.0 + self.random.random())
+
+                if self.ocv:
+                    for tableType in ('ocv_sigma_cell_rise', 'ocv_sigma_cell_fall'):
+                        self.genTable(depth + 2, tableType, 'delay_template', 0.05)
+
+                if self.ccs:
+                    self.genCcs(depth + 2)
+
+                self.writeLine(depth + 1, '}')
+                self.writeLine(depth + 1, 'internal_power () {')
+                self.writeAttribute(depth + 2, 'related_pin', '"' + relatedPin + '"')
+                self.writeAttribute(depth + 2, 'related_pg_pin', 'VDD')
+
+                for tableType in ('rise_power', 'fall_power'):
+                    self.genTable(depth + 2, tableType, 'power_template', 0.1)
+
+                self.writeLine(depth + 1, '}')
+
+        self.writeLine(depth, '}')
+
+    def genCcs(self, depth):
+        for currentType in ('output_current_rise', 'output_current_fall'):
+            self.writeLine(depth, currentType + ' () {')
+
+            for transition in self.index1[:2]:
+                for load in self.index2[:2]:
+                    timeList = [transition + 0.1 * i * (1 + load) for i in range(8)]
+                    self.writeLine(depth + 1, 'vector (ccs_template) {')
+                    self.writeAttribute(depth + 2, 'reference_time', '%.6g' % transition)
+                    self.writeIndex(depth + 2, 'index_1', [transition])
+                    self.writeIndex(depth + 2, 'index_2', [load])
+                    self.writeIndex(depth + 2, 'index_3', timeList)
+                    self.writeValues(depth + 2, [[0.2 * self.random.random() for t in timeList]])
+                    self.writeLine(depth + 1, '}')
+
+            self.writeLine(depth, '}')
+
+    def genCell(self, cellNum):
+        cellName = 'CELL' + str(cellNum)
+        inputPinList = ['A' + str(i) for i in range(self.pins)]
+
+        if self.comments:
+            self.writeLine(1, '/* Cell ' + cellName + ' */')
+
+        self.writeLine(1, 'cell (' + cellName + ') {')
+        self.writeAttribute(2, 'area', '%.6g' % (1 + 10 * self.random.random()))
+        self.writeAttribute(2, 'cell_leakage_power', '%.6g' % (10 * self.random.random()))
+
+        for i in range(2):
+            self.writeLine(2, 'leakage_power () {')
+            self.writeAttribute(3, 'value', '%.6g' % (10 * self.random.random()))
+            self.writeAttribute(3, 'when', '"' + ('' if i else '!') + inputPinList[0] + '"')
+            self.writeAttribute(3, 'related_pg_pin', 'VDD')
+            self.writeLine(2, '}')
+
+        self.writeLine(2, 'pg_pin (VDD) {')
+        self.writeAttribute(3, 'voltage_name', 'VDD')
+        self.writeAttribute(3, 'pg_type', 'primary_power')
+        self.writeLine(2, '}')
+        self.writeLine(2, 'pg_pin (VSS) {')
+        self.writeAttribute(3, 'voltage_name', 'VSS')
+        self.writeAttribute(3, 'pg_type', 'primary_ground')
+        self.writeLine(2, '}')
+
+        for inputPin in inputPinList:
+            self.genPin(2, inputPin, 'input', [])
+
+        self.genPin(2, 'Y', 'output', inputPinList)
+
+        for busNum in range(self.bus):
+            if busNum % 2 == 0:
+                busName = 'D' + str(busNum)
+                self.writeLine(2, 'bus (' + busName + ') {')
+                self.writeAttribute(3, 'bus_type', 'bus2')
+                self.writeAttribute(3, 'direction', 'input')
+                memberPinList = [busName + '[' + str(i) + ']' for i in range(2)]
+            else:
+                busName = 'Q' + str(busNum)
+                self.writeLine(2, 'bundle (' + busName + ') {')
+                memberPinList = [busName + '_' + str(i) for i in range(2)]
+                self.writeLine(3, 'members (' + ', '.join(memberPinList) + ');')
+                self.writeAttribute(3, 'direction', 'output')
+
+            for memberPin in memberPinList:
+                self.genPin(3, memberPin, 'output' if busNum % 2 else 'input', inputPinList[:1])
+
+            self.writeLine(2, '}')
+
+        self.writeLine(1, '}')
+
+
+def main():
+    args = readArgs()
+    myLibGenerator = libGenerator(cells=args.cells, pins=args.pins, arcs=args.arcs, table=args.table, ocv=args.ocv, ccs=args.ccs, bus=args.bus, comments=args.comments, continuations=args.continuations, seed=args.seed)
+    lineNum = myLibGenerator.write(args.output)
+    print('>>> Write ' + str(lineNum) + ' lines into "' + str(args.output) + '".')
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,7 @@ import re
 import sys
 
 os.environ["PYTHONUNBUFFERED"]="1"
-cwd = os.getcwd()
-upperLevelPath = os.path.dirname(cwd)
-sys.path.append(upperLevelPath)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import libertyParser
 
 ################
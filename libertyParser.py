@@ -1,826 +1,4409 @@
+import gc
 import os
 import re
 import sys
+import bz2
+import gzip
+import zlib
+import lzma
+import mmap
 import time
+import json
+import glob
+import queue
+import asyncio
+import codecs
+import bisect
+import pickle
+import socket
+import hashlib
+import argparse
 import datetime
+import tempfile
+import functools
+import threading
+import contextlib
 import collections
+import socketserver
+import collections.abc
+import concurrent.futures
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 os.environ["PYTHONUNBUFFERED"] = "1"
 
+# Whitespaces are not included in the cell index header hash.
+HEADER_HASH_SKIP_BYTES = b' \t\r\n'
+
+# Bump CELL_INDEX_VERSION when the sidecar cell index format changes.
+CELL_INDEX_VERSION = 3
+INDEX_CHUNK_SIZE = 16 * 1024 * 1024
+PARSE_CHUNK_SIZE = 1024 * 1024
+
+# The attribute values which are always unique (such as table values), they are not saved on the string pool.
+DEDUP_SKIP_KEYS = ('values',)
+
+# The complex attribute values which are saved as libertyValueRef on mmapValues mode (the table values).
+LAZY_VALUE_KEYS = ('values',)
+
+# On lazy mode, the gzip decompressor state is saved every SEEK_CHECKPOINT_SIZE decompressed bytes (see gzipLibReader).
+SEEK_CHECKPOINT_SIZE = 1024 * 1024
+
+# Compressed liberty file magic bytes and the decompression modules.
+COMPRESSION_MAGIC_LIST = [
+                          (b'\x1f\x8b', gzip),
+                          (b'BZh', bz2),
+                          (b'\xfd7zXZ\x00', lzma),
+                         ]
+
+# Bump CACHE_VERSION when the parser output (libDic) changes, so the old cache files are not used any more.
+CACHE_VERSION = 2
+CACHE_SIZE = 10 * 1024 * 1024 * 1024
+
+
+class libertyParserError(Exception):
+    """
+    Liberty parser error (missing liberty file/cell, invalid query ...), it is raised instead of exiting the process.
+    """
+    pass
+
+
+class libertyParserCancelled(libertyParserError):
+    """
+    Liberty parsing is cancelled with the cancelEvent of libertyParser.
+    """
+    pass
+
 
 def openWrite(fileName, message):
     with open(fileName, 'a') as FN:
         FN.write(str(message) + '\n')
 
 
-# Liberty parser (start) #
-class libertyParser():
+def getCompressionModule(libFile):
     """
-    Parse liberty file and save a special dictionary data structure.
-    Get specified data with sub-function "getData".
+    Get the decompression module (gzip/bz2/lzma) of compressed liberty file with the magic bytes, return None for plain file.
     """
-    def __init__(self, libFile, cellList=[], debug=False):
-        self.debug = debug
+    with open(libFile, 'rb') as LF:
+        magicBytes = LF.read(6)
 
-        self.debugPrint('* Liberty File : ' + str(libFile))
+    for (magic, compressionModule) in COMPRESSION_MAGIC_LIST:
+        if magicBytes.startswith(magic):
+            return compressionModule
 
-        # Liberty file must exists.
-        if not os.path.exists(libFile):
-            print('*Error*: liberty file "' + str(libFile) + '": No such file!')
-            sys.exit(1)
+    return None
 
-        # If cellList is specified, regenerate the cell-based liberty file as libFile.
-        if len(cellList) > 0:
-            self.debugPrint('* Specified Cell List : ' + str(cellList))
-            libFile = self.genCellLibFile(libFile, cellList)
 
-        # Parse the liberty file and organize the data structure as a dictionary.
-        groupList = self.libertyParser(libFile)
-        self.libDic = self.organizeData(groupList)
+def openLibFile(libFile, mode='r'):
+    """
+    Open liberty file on mode 'r' (text) or 'rb' (binary), compressed liberty file is decompressed transparently.
+    """
+    compressionModule = getCompressionModule(libFile)
 
-    def debugPrint(self, message):
-        """
-        Print debug message.
-        """
-        if self.debug:
-            currentTime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print('DEBUG [' + str(currentTime) + ']: ' + str(message))
+    if compressionModule is None:
+        return open(libFile, mode)
+    elif mode == 'r':
+        return compressionModule.open(libFile, 'rt')
+    else:
+        return compressionModule.open(libFile, mode)
 
-    def genCellLibFile(self, libFile, cellList):
-        """
-        For big liberty files with multi-cells, it will cost too much time to parse the liberty file.
-        This function is used to generate a new liberty file only contains the specified cells, so it can save a lot of time on liberty file parsering.
-        """
-        cellNames = '_'.join(cellList)
-        cellLibFile = str(libFile) + '.' + str(cellNames)
-        self.debugPrint('>>> Generating cell-based liberty file "' + str(cellLibFile) + '" ...')
 
-        libCellDic = collections.OrderedDict()
-        libCellList = []
+def getPeakMemory():
+    """
+    Get the peak resident memory (MB) of current process, return None if it is not supported on the platform.
+    """
+    if resource is None:
+        return None
 
-        # Get lineNum-cellName info on libFile.
-        self.debugPrint('    Getting cells from liberty file "' + str(libFile) + '" ...')
-        cellCompile = re.compile(r'^\s*(\d+):\s*cell\s*\((.*)\)\s*{\s*$')
-        lines = os.popen('grep -n "cell (" ' + str(libFile)).readlines()
+    peakMemory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
 
-        for line in lines:
-            line = line.strip()
+    # ru_maxrss is bytes on macOS, KB on linux.
+    if sys.platform == 'darwin':
+        return peakMemory / 1024 / 1024
+    else:
+        return peakMemory / 1024
 
-            if cellCompile.match(line):
-                myMatch = cellCompile.match(line)
-                lineNum = myMatch.group(1)
-                cellName = myMatch.group(2)
-                libCellDic[cellName] = lineNum
-                libCellList.append(cellName)
 
-        # Make sure all the specified cells are on libFile.
-        self.debugPrint('    Check specified cells missing or not.')
-        cellMissing = False
-
-        for cell in cellList:
-            if cell not in libCellList:
-                print('*Error*: cell "' + str(cell) + '" is not in liberty file "' + str(libFile) + '".')
-                cellMissing = True
-
-        if cellMissing:
-            sys.exit(1)
-
-        # Write cellLibFile - head part.
-        firstCellLineNum = libCellDic[libCellList[0]]
-        self.debugPrint('    Writing cell liberty file head part ...')
-        command = "awk 'NR>0 && NR<" + str(firstCellLineNum) + "' " + str(libFile) + " > " + str(cellLibFile)
-        os.system(command)
-
-        # Write cellLibFile - cell part.
-        for cell in cellList:
-            cellFirstLineNum = libCellDic[cell]
-            cellLastLineNum = 0
-            cellIndex = libCellList.index(cell)
-
-            if cellIndex == len(libCellList) - 1:
-                cellLastLineNum = os.popen("wc -l " + str(libFile) + " | awk '{print $1}'").read().strip()
-            else:
-                nextCellIndex = cellIndex + 1
-                nextCell = libCellList[nextCellIndex]
-                cellLastLineNum = int(libCellDic[nextCell]) - 1
+def copyFileRange(sourceFile, targetFile, startOffset, endOffset, blockSize=1024*1024):
+    """
+    Copy bytes [startOffset, endOffset) from opened sourceFile into opened targetFile with bounded reads.
+    """
+    sourceFile.seek(startOffset)
+    remainSize = endOffset - startOffset
 
-            self.debugPrint('    Writing cell liberty file cell "' + str(cell) + '" part ...')
-            command = "awk 'NR>=" + str(cellFirstLineNum) + " && NR<=" + str(cellLastLineNum) + "' " + str(libFile) + " >> " + str(cellLibFile)
-            os.system(command)
+    while remainSize > 0:
+        block = sourceFile.read(min(blockSize, remainSize))
 
-        with open(cellLibFile, 'a') as CLF:
-            CLF.write('}\n')
+        if not block:
+            break
 
-        return cellLibFile
+        targetFile.write(block)
+        remainSize -= len(block)
 
-    def getLastOpenedGroupNum(self, openedGroupNumList):
+
+class gzipLibReader():
+    """
+    Random access reader of gzip compressed liberty file, it is used to load the cells on lazy mode.
+    The decompressor states (zlib decompressobj copies) are saved as checkpoints every SEEK_CHECKPOINT_SIZE decompressed
+    bytes, so a read starts from the nearest checkpoint before it instead of the beginning of the liberty file.
+    """
+    def __init__(self, libFile, checkpointSize=SEEK_CHECKPOINT_SIZE):
+        self.libFile = libFile
+        self.fileKey = self.getFileKey(libFile)
+        self.checkpointSize = checkpointSize
+
+        # Checkpoints, the decompressed offsets, compressed offsets and decompressor states.
+        self.checkpointOffsetList = [0]
+        self.checkpointList = [(0, zlib.decompressobj(16 + zlib.MAX_WBITS))]
+        self.lock = threading.Lock()
+        self.restore(0)
+
+    def getFileKey(self, libFile):
+        libFileStat = os.stat(libFile)
+        return (os.path.abspath(libFile), libFileStat.st_size, libFileStat.st_mtime_ns)
+
+    def restore(self, checkpointNum):
         """
-        All of the new attribute data are saved on last opened group, so need to get the last opened group num.
+        Restart decompression from the checkpoint.
         """
-        lastOpenedGroupNum = -1
-
-        if len(openedGroupNumList) > 0:
-            lastOpenedGroupNum = openedGroupNumList[-1]
-
-        return lastOpenedGroupNum
+        (self.compressedOffset, decompressor) = self.checkpointList[checkpointNum]
+        self.decompressor = decompressor.copy()
+        self.offset = self.checkpointOffsetList[checkpointNum]
+        self.pending = b''
 
-    def libertyParser(self, libFile):
+    def readBlock(self, LF, blockSize=32*1024):
         """
-        Parse liberty file line in line.
-        Save data block based on "group".
-        Save data blocks into a list.
+        Decompress the next compressed block into self.pending, save a checkpoint if it is far enough from the last one.
+        Return False on the end of the liberty file.
         """
-        # compile #
-        # Group compile.
-        # type (name) {
-        #   ...
-        # }
-        groupCompile = re.compile(r'^(\s*)(\S+)\s*\((.*?)\)\s*{\s*$')
-        groupDoneCompile = re.compile(r'^\s*}\s*$')
-
-        # Simple attribute compile.
-        # key : value;
-        simpleAttributeCompile = re.compile(r'^(\s*)(\S+)\s*:\s*(.+)\s*;.*$')
-        specialSimpleAttributeCompile = re.compile(r'^(\s*)(\S+)\s*:\s*(.+)\s*$')
-
-        # Complex attribute compile.
-        # key (valueList);
-        complexAttributeCompile = re.compile(r'^(\s*)(\S+)\s*(\(.+\))\s*;.*$')
-        specialComplexAttributeCompile = re.compile(r'^(\s*)(\S+)\s*(\(.+\))\s*$')
-
-        # Multi lines compile.
-        # *** \
-        # *** \
-        # ***;
-        multiLinesCompile = re.compile(r'^(.*)\\\s*$')
-        multiLinesDoneCompile = re.compile(r'^(.*;)\s*$')
-
-        # Comment compile.
-        # /* ... */
-        commentStartCompile = re.compile(r'^(\s*)/\*.*$')
-        commentEndCompile = re.compile(r'^.*\*/\s*$')
-
-        # Empty line compile.
-        emptyLineCompile = re.compile(r'^\s*$')
-
-        # For multi lines.
-        multiLinesString = ''
-
-        # For comment (multi-lines).
-        commentMark = False
-
-        # Save group data structure into groupList.
-        groupList = []
-        groupListNum = 0
-
-        # Save opened group list.
-        openedGroupNumList = []
-
-        # Last opened group num on groupList, point to the latest open group.
-        lastOpenedGroupNum = -1
-
-        self.debugPrint('>>> Parsing liberty file "' + str(libFile) + '" ...')
-        startSeconds = int(time.time())
-        libFileLine = 0
+        LF.seek(self.compressedOffset)
+        block = LF.read(blockSize)
 
-        with open(libFile, 'r') as LF:
-            for line in LF.readlines():
-                libFileLine += 1
+        if not block:
+            return False
 
-                # Sort by compile hit rate.
-                if commentMark:
-                    if commentEndCompile.match(line):
-                        commentMark = False
-                else:
-                    if multiLinesCompile.match(line):
-                        myMatch = multiLinesCompile.match(line)
-                        currentLineContent = myMatch.group(1)
-                        multiLinesString = str(multiLinesString) + str(currentLineContent)
-                    else:
-                        if multiLinesString:
-                            if multiLinesDoneCompile.match(line):
-                                myMatch = multiLinesDoneCompile.match(line)
-                                currentLineContent = myMatch.group(1)
-                                line = str(multiLinesString) + str(currentLineContent)
-                            else:
-                                print('*Error*: Line ' + str(libFileLine) + ': multi-lines is not finished rightly!')
-                                print('         ' + str(line))
-                                continue
-
-                        if complexAttributeCompile.match(line):
-                            myMatch = complexAttributeCompile.match(line)
-                            key = myMatch.group(2)
-                            valueList = myMatch.group(3)
-
-                            if key in groupList[lastOpenedGroupNum]:
-                                # For "voltage_map" or such kind items (there are some "voltage_map" on the same group).
-                                if isinstance(groupList[lastOpenedGroupNum][key], list):
-                                    groupList[lastOpenedGroupNum][key].append(valueList)
-                                else:
-                                    groupList[lastOpenedGroupNum][key] = [groupList[lastOpenedGroupNum][key], valueList]
-                            else:
-                                groupList[lastOpenedGroupNum][key] = valueList
-                        elif simpleAttributeCompile.match(line):
-                            myMatch = simpleAttributeCompile.match(line)
-                            key = myMatch.group(2)
-                            value = myMatch.group(3)
-                            groupList[lastOpenedGroupNum][key] = value
-                        elif groupCompile.match(line):
-                            myMatch = groupCompile.match(line)
-                            groupDepth = len(myMatch.group(1))
-                            groupType = myMatch.group(2)
-                            groupName = myMatch.group(3)
-
-                            (lastOpenedGroupNum) = self.getLastOpenedGroupNum(openedGroupNumList)
-
-                            currentGroupDic = {
-                                               'fatherGroupNum': lastOpenedGroupNum,
-                                               'depth': groupDepth,
-                                               'type': groupType,
-                                               'name': groupName,
-                                              }
-
-                            groupList.append(currentGroupDic)
-                            openedGroupNumList.append(groupListNum)
-                            groupListNum += 1
-                            (lastOpenedGroupNum) = self.getLastOpenedGroupNum(openedGroupNumList)
-                        elif groupDoneCompile.match(line):
-                            openedGroupNumList.pop()
-                            (lastOpenedGroupNum) = self.getLastOpenedGroupNum(openedGroupNumList)
-                        elif commentStartCompile.match(line):
-                            if not commentEndCompile.match(line):
-                                commentMark = True
-                        elif emptyLineCompile.match(line):
-                            pass
-                        elif specialComplexAttributeCompile.match(line):
-                            print('*Warning*: Line ' + str(libFileLine) + ': Irregular liberty line!')
-                            print('          ' + str(line))
-                            myMatch = specialComplexAttributeCompile.match(line)
-                            key = myMatch.group(2)
-                            valueList = myMatch.group(3)
-
-                            if key in groupList[lastOpenedGroupNum]:
-                                # For "voltage_map" or such kind items (there are some "voltage_map" on the same group).
-                                if isinstance(groupList[lastOpenedGroupNum][key], list):
-                                    groupList[lastOpenedGroupNum][key].append(valueList)
-                                else:
-                                    groupList[lastOpenedGroupNum][key] = [groupList[lastOpenedGroupNum][key], valueList]
-                            else:
-                                groupList[lastOpenedGroupNum][key] = valueList
-                        elif specialSimpleAttributeCompile.match(line):
-                            print('*Warning*: Line ' + str(libFileLine) + ': Irregular line!')
-                            print('          ' + str(line))
-                            myMatch = specialSimpleAttributeCompile.match(line)
-                            key = myMatch.group(2)
-                            value = myMatch.group(3)
-                            groupList[lastOpenedGroupNum][key] = value
-                        else:
-                            print('*Error*: Line ' + str(libFileLine) + ': Unrecognizable line!')
-                            print('         ' + str(line))
+        self.compressedOffset += len(block)
+        self.pending += self.decompressor.decompress(block)
 
-                        if multiLinesString:
-                            multiLinesString = ''
+        if self.decompressor.eof:
+            # Multi-member gzip file, the next member is decompressed with a new decompressor.
+            unusedData = self.decompressor.unused_data
+            self.compressedOffset -= len(unusedData)
+            self.decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
 
-        endSeconds = int(time.time())
-        parseSeconds = endSeconds - startSeconds
-        self.debugPrint('    Done')
-        self.debugPrint('    Parse time : ' + str(libFileLine) + ' lines, ' + str(parseSeconds) + ' seconds.')
+            if not unusedData.startswith(b'\x1f\x8b'):
+                return False
+        elif self.offset + len(self.pending) >= self.checkpointOffsetList[-1] + self.checkpointSize:
+            self.checkpointOffsetList.append(self.offset + len(self.pending))
+            self.checkpointList.append((self.compressedOffset, self.decompressor.copy()))
 
-        return groupList
+        return True
 
-    def organizeData(self, groupList):
+    def read(self, startOffset, endOffset):
         """
-        Re-organize list data structure (groupList) into a dictionary data structure.
+        Read decompressed bytes [startOffset, endOffset).
         """
-        self.debugPrint('>>> Re-organizing data structure ...')
+        with self.lock, open(self.libFile, 'rb') as LF:
+            checkpointNum = bisect.bisect_right(self.checkpointOffsetList, startOffset) - 1
 
-        for i in range(len(groupList)-1, 0, -1):
-            groupDic = groupList[i]
-            fatherGroupNum = groupDic['fatherGroupNum']
-            groupList[fatherGroupNum].setdefault('group', [])
-            groupList[fatherGroupNum]['group'].insert(0, groupDic)
+            # Restart from the checkpoint if the data is before the current position, or the checkpoint is nearer.
+            if (startOffset < self.offset) or (self.checkpointOffsetList[checkpointNum] > self.offset + len(self.pending)):
+                self.restore(checkpointNum)
 
-        self.debugPrint('    Done')
+            while self.offset + len(self.pending) < endOffset:
+                if self.offset + len(self.pending) <= startOffset:
+                    self.offset += len(self.pending)
+                    self.pending = b''
 
-        return groupList[0]
-# Liberty parser (end) #
+                if not self.readBlock(LF):
+                    break
 
-# Verification functions (start) #
-    def restoreLib(self, libFile, groupDic=''):
-        """
-        This function is used to verify the liberty parser.
-        It converts self.libDic into the original liberty file (comment will be ignored).
-        Please save the output message into a file, then compare it with the original liberty file.
-        """
-        if groupDic == '':
-            groupDic = self.libDic
+            data = self.pending[startOffset - self.offset:endOffset - self.offset]
 
-        groupDepth = groupDic['depth']
-        groupType = groupDic['type']
-        groupName = groupDic['name']
+            # Keep the data after endOffset for the next read (cells are usually loaded on the liberty file order).
+            dropSize = min(max(endOffset - self.offset, 0), len(self.pending))
+            self.pending = self.pending[dropSize:]
+            self.offset += dropSize
 
-        openWrite(libFile, ' '*groupDepth + str(groupType) + ' (' + str(groupName) + ') {')
+        return data
 
-        for key in groupDic:
-            value = groupDic[key]
+    def __reduce__(self):
+        # The decompressor states cannot be pickled, start a new reader.
+        return (gzipLibReader, (self.libFile, self.checkpointSize))
 
-            if (key == 'fatherGroupNum') or (key == 'depth') or (key == 'type') or (key == 'name'):
-                pass
-            elif key == 'group':
-                subGroupList = groupDic['group']
-                for subGroup in subGroupList:
-                    self.restoreLib(libFile, subGroup)
-            elif key == 'values':
-                openWrite(libFile, '  ' + ' '*groupDepth + key + ' ( \\')
-                valueString = re.sub(r'\(', '', value)
-                valueString = re.sub(r'\)', '', valueString)
-                valueString = re.sub(r'"\s*,\s*"', '"#"', valueString)
-                valuesList = re.split('#', valueString)
 
-                for i in range(len(valuesList)):
-                    item = valuesList[i].strip()
+class libertyStringPool():
+    """
+    Shared string pool, the same attribute values/group names are saved as one string object.
+    """
+    def __init__(self):
+        self.poolDic = {}
+        self.hitNum = 0
+        self.savedBytes = 0
 
-                    if i == len(valuesList)-1:
-                        openWrite(libFile, '    ' + ' '*groupDepth + str(item) + ' \\')
-                    else:
-                        openWrite(libFile, '    ' + ' '*groupDepth + str(item) + ', \\')
+    def get(self, string):
+        pooledString = self.poolDic.setdefault(string, string)
 
-                openWrite(libFile, '  ' + ' '*groupDepth + ');')
-            elif key == 'table':
-                valueString = re.sub(r'"', '', value)
-                valueList = re.split(',', valueString)
-                openWrite(libFile, '  ' + ' '*groupDepth + key + ' : "' + str(valueList[0]) + ', \\')
+        if pooledString is not string:
+            self.addHits(1, sys.getsizeof(string))
 
-                for i in range(1, len(valueList)):
-                    item = valueList[i].strip()
+        return pooledString
 
-                    if i == len(valueList)-1:
-                        openWrite(libFile, str(item) + '";')
-                    else:
-                        openWrite(libFile, str(item) + ', \\')
-            elif isinstance(value, list):
-                for item in value:
-                    if re.match(r'\(.*\)', item):
-                        if key == 'define':
-                            openWrite(libFile, '  ' + ' '*groupDepth + key + str(item) + ';')
-                        else:
-                            openWrite(libFile, '  ' + ' '*groupDepth + key + ' ' + str(item) + ';')
-                    else:
-                        openWrite(libFile, '  ' + ' '*groupDepth + key + ' : ' + str(item) + ';')
-            else:
-                if re.match(r'\(.*\)', value):
-                    openWrite(libFile, '  ' + ' '*groupDepth + key + ' ' + str(value) + ';')
-                else:
-                    openWrite(libFile, '  ' + ' '*groupDepth + key + ' : ' + str(value) + ';')
+    def addHits(self, hitNum, savedBytes):
+        self.hitNum += hitNum
+        self.savedBytes += savedBytes
 
-        openWrite(libFile, ' '*groupDepth + '}')
-# Verification functions (end) #
+    def clear(self):
+        """
+        Release the pooled strings (the statistics are kept).
+        """
+        self.poolDic = {}
 
-# Application functions (start) #
-    def getUnit(self):
+    def getStats(self):
         """
-        Get all "unit" setting.
         Return a dict.
         {
-         name1 : unit1,
-         name2 : unit2,
-         ...
+         'unique' : unique string number on the pool,
+         'hits' : deduplicated string number,
+         'saved_bytes' : memory saved by the deduplicated strings,
         }
         """
-        unitDic = collections.OrderedDict()
+        return collections.OrderedDict([('unique', len(self.poolDic)), ('hits', self.hitNum), ('saved_bytes', self.savedBytes)])
 
-        for key in self.libDic.keys():
-            if re.match(r'.*_unit', key):
-                value = self.libDic[key]
-                unitDic[key] = value
 
-        return unitDic
-
-    def getCellList(self):
+class lazyCellDic(dict):
+    """
+    Cell group dict for lazy mode.
+    Only 'fatherGroupNum', 'depth', 'type' and 'name' are available at the beginning, the cell group is parsed from
+    the cell byte range of liberty file the first time any other data is accessed.
+    """
+    def __init__(self, parser, libFile, cellStartOffset, cellEndOffset, cellGroupNum, cellStubDic):
+        dict.__init__(self, cellStubDic)
+        self.parser = parser
+        self.libFile = libFile
+        self.cellStartOffset = cellStartOffset
+        self.cellEndOffset = cellEndOffset
+        self.cellGroupNum = cellGroupNum
+        self.loaded = False
+
+    def load(self):
         """
-        Get all cells.
-        Return a list.
-        [cellName1, cellName2, ...]
+        Parse the cell byte range and fill the cell group data.
         """
-        cellList = []
+        if not self.loaded:
+            self.loaded = True
+            self.parser.debugPrint('    Loading cell "' + str(dict.__getitem__(self, 'name')) + '" ...')
 
-        if 'group' in self.libDic:
-            for libGroupDic in self.libDic['group']:
-                groupType = libGroupDic['type']
+            cellString = self.parser.readLibRange(self.libFile, self.cellStartOffset, self.cellEndOffset).decode()
+            (groupList, libFileLine) = self.parser._parseLibTexts([cellString])
+            cellDic = self.parser.organizeData(groupList)
 
-                if groupType == 'cell':
-                    cellName = libGroupDic['name']
-                    cellList.append(cellName)
+            # Cell is group 0 on groupList, shift the sub-group "fatherGroupNum" to the group num on liberty file.
+            for groupDic in groupList[1:]:
+                groupDic['fatherGroupNum'] += self.cellGroupNum
 
-        return cellList
+            for (key, value) in cellDic.items():
+                if key != 'fatherGroupNum':
+                    dict.__setitem__(self, key, value)
 
-    def getCellArea(self, cellList=[]):
-        """
-        Get cell area information for specified cell list.
-        Return a dict.
-        {
-         cellName1 : area1,
-         cellName2 : area2,
-         ...
-        }
-        """
-        cellAreaDic = collections.OrderedDict()
+    def __getitem__(self, key):
+        if (not self.loaded) and (key not in ('fatherGroupNum', 'depth', 'type', 'name')):
+            self.load()
 
-        if 'group' in self.libDic:
-            for groupDic in self.libDic['group']:
-                groupType = groupDic['type']
+        return dict.__getitem__(self, key)
 
-                if groupType == 'cell':
-                    cellName = groupDic['name']
+    def __contains__(self, key):
+        self.load()
+        return dict.__contains__(self, key)
 
-                    if (len(cellList) == 0) or (cellName in cellList):
-                        if 'area' in groupDic:
-                            cellArea = groupDic['area']
-                            cellAreaDic[cellName] = cellArea
+    def __iter__(self):
+        self.load()
+        return dict.__iter__(self)
 
-        for cellName in cellList:
-            if cellName not in cellAreaDic:
-                cellAreaDic[cellName] = ''
+    def __len__(self):
+        self.load()
+        return dict.__len__(self)
 
-        return cellAreaDic
+    def __eq__(self, other):
+        self.load()
+        return dict.__eq__(self, other)
 
-    def getCellLeakagePower(self, cellList=[]):
-        """
-        Get cell leakage_power information for specified cell list.
-        Return a dict.
-        {
-         cellName1 : [
-                      {
-                       'value' : value,
-                       'when' : when,
-                       'related_pg_pin' : related_pg_pin,
-                      }
-                      ...
-                     ],
-         ...
-        }
-        """
-        cellLeakagePowerDic = collections.OrderedDict()
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
-        if 'group' in self.libDic:
-            for groupDic in self.libDic['group']:
-                groupType = groupDic['type']
+    def __repr__(self):
+        self.load()
+        return dict.__repr__(self)
 
-                if groupType == 'cell':
-                    cellName = groupDic['name']
+    def __reduce__(self):
+        # Save as a plain dict.
+        self.load()
+        return (dict, (dict.copy(self),))
 
-                    if (len(cellList) == 0) or (cellName in cellList):
-                        if 'group' in groupDic:
-                            for cellGroupDic in groupDic['group']:
-                                cellGroupType = cellGroupDic['type']
+    def get(self, key, default=None):
+        self.load()
+        return dict.get(self, key, default)
 
-                                if cellGroupType == 'leakage_power':
-                                    leakagePowerDic = {}
+    def keys(self):
+        self.load()
+        return dict.keys(self)
 
-                                    for (key, value) in cellGroupDic.items():
-                                        if (key == 'value') or (key == 'when') or (key == 'related_pg_pin'):
-                                            leakagePowerDic[key] = value
+    def values(self):
+        self.load()
+        return dict.values(self)
 
-                                    cellLeakagePowerDic.setdefault(cellName, [])
-                                    cellLeakagePowerDic[cellName].append(leakagePowerDic)
+    def items(self):
+        self.load()
+        return dict.items(self)
 
-        return cellLeakagePowerDic
+    def setdefault(self, key, default=None):
+        self.load()
+        return dict.setdefault(self, key, default)
 
-    def _getTimingGroupInfo(self, groupDic):
-        """
-        Split pin timing information from the pin timing dict.
-        Return a dict.
-        {
-         'related_pin' : related_pin,
-         'related_pg_pin' : related_pg_pin,
-         'timing_sense' : timing_sense,
-         'timing_type' : timing_type,
-         'when' : when,
-         'table_type' : {
-                         table_type1 : {
-                                        'index_1' : [index1],
-                                        'index_2' : [index2],
-                                        'values' : [[values]],
-                                       }
-                         ...
-                        },
-        }
-        """
-        timingDic = collections.OrderedDict()
+    def pop(self, *args):
+        self.load()
+        return dict.pop(self, *args)
 
-        if 'type' in groupDic:
-            groupType = groupDic['type']
+    def copy(self):
+        self.load()
+        return dict.copy(self)
 
-            if groupType == 'timing':
-                if 'related_pin' in groupDic:
-                    timingDic['related_pin'] = groupDic['related_pin']
+    __hash__ = None
 
-                if 'related_pg_pin' in groupDic:
-                    timingDic['related_pg_pin'] = groupDic['related_pg_pin']
 
-                if 'timing_sense' in groupDic:
-                    timingDic['timing_sense'] = groupDic['timing_sense']
+class libertyGroup(collections.abc.MutableMapping):
+    """
+    Compact group node for compact mode, it is used as a dict with the same keys as the normal group dict.
+    Attribute names and values are saved as two tuples (the same attribute name tuple is shared by groups),
+    sub-groups are linked on "group" when parsing, so no extra data re-organizing is needed.
+    """
+    __slots__ = ('fatherGroupNum', 'depth', 'type', 'name', 'attributeKeys', 'attributeValues', 'group')
+
+    def __init__(self, fatherGroupNum=-1, depth=0, type='', name=''):
+        self.fatherGroupNum = fatherGroupNum
+        self.depth = depth
+        self.type = type
+        self.name = name
+        self.attributeKeys = ()
+        self.attributeValues = ()
+        self.group = None
+
+    def __getitem__(self, key):
+        if key in self.attributeKeys:
+            value = self.attributeValues[self.attributeKeys.index(key)]
+
+            # Lazy value on mmapValues mode, it is decoded every time it is accessed.
+            if type(value) is libertyValueRef:
+                return value.decode()
+
+            return value
+        elif key in libertyGroup.__slots__[:4]:
+            return getattr(self, key)
+        elif (key == 'group') and self.group:
+            return self.group
+        else:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in libertyGroup.__slots__[:4]:
+            setattr(self, key, value)
+        elif key == 'group':
+            self.group = value
+        elif key in self.attributeKeys:
+            attributeValues = list(self.attributeValues)
+            attributeValues[self.attributeKeys.index(key)] = value
+            self.attributeValues = tuple(attributeValues)
+        else:
+            self.attributeKeys = self.attributeKeys + (key,)
+            self.attributeValues = self.attributeValues + (value,)
+
+    def __delitem__(self, key):
+        if key in self.attributeKeys:
+            i = self.attributeKeys.index(key)
+            self.attributeKeys = self.attributeKeys[:i] + self.attributeKeys[i+1:]
+            self.attributeValues = self.attributeValues[:i] + self.attributeValues[i+1:]
+        elif (key == 'group') and self.group:
+            self.group = None
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return (key in self.attributeKeys) or (key in libertyGroup.__slots__[:4]) or ((key == 'group') and bool(self.group))
+
+    def __iter__(self):
+        yield 'fatherGroupNum'
+        yield 'depth'
+        yield 'type'
+        yield 'name'
+
+        for key in self.attributeKeys:
+            yield key
+
+        if self.group:
+            yield 'group'
+
+    def __len__(self):
+        return 4 + len(self.attributeKeys) + (1 if self.group else 0)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __getstate__(self):
+        return (self.fatherGroupNum, self.depth, self.type, self.name, self.attributeKeys, self.attributeValues, self.group)
+
+    def __setstate__(self, state):
+        (self.fatherGroupNum, self.depth, self.type, self.name, self.attributeKeys, self.attributeValues, self.group) = state
+
+    def copy(self):
+        return dict(self.items())
+
+
+class libertyValueRef():
+    """
+    Lazy complex attribute value for mmapValues mode, it is the byte range of the attribute arguments on the liberty file
+    memory map, so the (big) table text is not saved as python string.
+    The value is not cached, it is decoded every time it is accessed. The memory map is not checked on access, if the
+    liberty file is truncated in place (without libertyParser.update), the access can crash the process (SIGBUS).
+    """
+    __slots__ = ('libMap', 'start', 'end')
 
-                if 'timing_type' in groupDic:
-                    timingDic['timing_type'] = groupDic['timing_type']
+    def __init__(self, libMap, start, end):
+        self.libMap = libMap
+        self.start = start
+        self.end = end
 
-                if 'when' in groupDic:
-                    timingDic['when'] = groupDic['when']
+    def decode(self):
+        args = self.libMap[self.start:self.end].decode()
 
-                if 'group' in groupDic:
-                    timingDic['table_type'] = collections.OrderedDict()
+        if '\\' in args:
+            args = continuationCompile.sub('', args)
 
-                    for timingLevelGroupDic in groupDic['group']:
-                        timingLevelGroupType = timingLevelGroupDic['type']
-                        timingLevelGroupName = timingLevelGroupDic['name']
-                        timingDic['table_type'][timingLevelGroupType] = collections.OrderedDict()
+        return '(' + args + ')'
 
-                        if timingLevelGroupName != '':
-                            timingDic['table_type'][timingLevelGroupType]['template_name'] = timingLevelGroupName
+    def __repr__(self):
+        return repr(self.decode())
 
-                        if 'sigma_type' in timingLevelGroupDic:
-                            # 'sigma_type' is only for ocv lib.
-                            timingDic['table_type'][timingLevelGroupType]['sigma_type'] = timingLevelGroupDic['sigma_type']
+    def __reduce__(self):
+        # Saved as a string (for cache and process pool).
+        return (str, (self.decode(),))
 
-                        if 'index_1' in timingLevelGroupDic:
-                            timingDic['table_type'][timingLevelGroupType]['index_1'] = timingLevelGroupDic['index_1']
 
-                        if 'index_2' in timingLevelGroupDic:
-                            timingDic['table_type'][timingLevelGroupType]['index_2'] = timingLevelGroupDic['index_2']
+def getValueRefList(groupDic):
+    """
+    Get the libertyValueRef values of the compact group node and all of its sub-groups (mmapValues mode).
+    """
+    valueRefList = []
 
-                        if 'values' in timingLevelGroupDic:
-                            timingDic['table_type'][timingLevelGroupType]['values'] = timingLevelGroupDic['values']
+    if isinstance(groupDic, libertyGroup):
+        if groupDic.attributeValues:
+            valueRefList.extend([value for value in groupDic.attributeValues if type(value) is libertyValueRef])
 
-        return timingDic
+        for subGroupDic in (groupDic.group or []):
+            valueRefList.extend(getValueRefList(subGroupDic))
 
-    def _getInternalPowerGroupInfo(self, groupDic):
-        """
-        Split pin internal_power information from the pin internal_power dict.
-        Return a dict.
-        {
-         'related_pin' : related_pin,
-         'related_pg_pin' : related_pg_pin,
-         'when' : when,
-         'table_type' : {
-                         table_type1 : {
-                                        'index_1' : [index1],
-                                        'index_2' : [index2],
-                                        'values' : [[values]],
-                                       }
-                         ...
-                        },
+    return valueRefList
+
+
+def parseCellRanges(libFile, cellRangeList, compact=False, dedup=False):
+    """
+    Parse cell byte ranges [[cellStartOffset, cellEndOffset, cellGroupNum], ...] of liberty file, it is the worker function of parallel mode.
+    Return (cellDicList, metrics), cellDicList is the cell group dicts (without 'fatherGroupNum'), the sub-group
+    "fatherGroupNum" are the group num on liberty file, metrics is the parse metrics (see libertyParser.initMetrics).
+    """
+    # Only the parse functions are used, so the liberty file is not parsed on instantiation.
+    parser = libertyParser.__new__(libertyParser)
+    parser.debug = False
+    parser.compact = compact
+    parser.mmapValues = False
+    parser.cancelEvent = None
+    parser.phaseCallback = None
+    parser.stringPool = libertyStringPool() if dedup else None
+    parser.initMetrics()
+    cellDicList = []
+
+    with openLibFile(libFile, 'rb') as LF:
+        for (cellStartOffset, cellEndOffset, cellGroupNum) in cellRangeList:
+            LF.seek(cellStartOffset)
+            cellString = LF.read(cellEndOffset - cellStartOffset).decode()
+            (groupList, libFileLine) = parser._parseLibTexts([cellString])
+            cellDic = parser.organizeData(groupList)
+
+            for groupDic in groupList[1:]:
+                groupDic['fatherGroupNum'] += cellGroupNum
+
+            if not compact:
+                del cellDic['fatherGroupNum']
+
+            cellDicList.append(cellDic)
+
+    if parser.stringPool:
+        parser.metrics['string_pool'] = parser.stringPool.getStats()
+
+    return (cellDicList, parser.metrics)
+
+
+# Numpy table (start) #
+tableStringCompile = re.compile(r'"([^"]*)"')
+templateKeyCompile = re.compile(r'^(variable|index)_\d+$')
+
+# Table dict keys of getLibPinInfo (timing/internal_power tables, and the tables with the template indexes).
+TIMING_TABLE_KEYS = ('template_name', 'sigma_type', 'index_1', 'index_2', 'values')
+INTERNAL_POWER_TABLE_KEYS = ('index_1', 'index_2', 'values')
+TEMPLATE_TABLE_KEYS = ('template_name', 'sigma_type', 'index_1', 'index_2', 'index_3', 'values')
+
+
+def decodeTableIndex(indexString):
+    """
+    Decode index string (such as '("0.25, 0.5, 0.75")') into a 1-D numpy float array.
+    """
+    indexString = indexString.replace('(', '').replace(')', '').replace('"', '')
+    return numpy.array(indexString.split(','), dtype=float)
+
+
+def decodeTableValues(valuesString, indexLengthList=[]):
+    """
+    Decode values string (such as '("0.1, 0.2", "0.3, 0.4")') into a numpy float array.
+    The array shape follows the index lengths (index_1 [* index_2 [* index_3]]) if indexLengthList is specified.
+    Otherwise it is 1-D array for one row, 2-D array (rows * columns) for multi rows.
+    """
+    rowList = tableStringCompile.findall(valuesString)
+
+    if not rowList:
+        rowList = [valuesString.replace('(', '').replace(')', '')]
+
+    valuesArray = numpy.array(','.join(rowList).split(','), dtype=float)
+
+    if indexLengthList and (numpy.prod(indexLengthList) == valuesArray.size):
+        return valuesArray.reshape(indexLengthList)
+    elif len(rowList) > 1:
+        return valuesArray.reshape(len(rowList), -1)
+    else:
+        return valuesArray
+
+
+class libertyTable(collections.OrderedDict):
+    """
+    Table dict for numpy table mode.
+    Table strings (index_1/index_2/index_3/values) are decoded into numpy float arrays the first time they are accessed,
+    so the parse time is not changed if the tables are not used.
+    """
+    def __getitem__(self, key):
+        value = collections.OrderedDict.__getitem__(self, key)
+
+        if isinstance(value, str):
+            if key in ('index_1', 'index_2', 'index_3'):
+                value = decodeTableIndex(value)
+                collections.OrderedDict.__setitem__(self, key, value)
+            elif key == 'values':
+                indexLengthList = [len(self[indexKey]) for indexKey in ('index_1', 'index_2', 'index_3') if indexKey in self]
+                value = decodeTableValues(value, indexLengthList)
+                collections.OrderedDict.__setitem__(self, key, value)
+
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        else:
+            return default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+# Template variables for the input transition and output load axes.
+TRANSITION_VARIABLES = ('input_net_transition', 'input_transition_time', 'related_pin_transition', 'constrained_pin_transition')
+LOAD_VARIABLES = ('total_output_net_capacitance', 'equal_or_opposite_output_net_capacitance', 'related_out_total_output_net_capacitance')
+
+
+class tableLookup():
+    """
+    Batch NLDM table lookup for many tables and many (input transition, output load) points.
+    The tables are grouped by shape, every group is interpolated (bilinear) and extrapolated (linear, from the
+    boundary segments) with numpy for all of the tables and all of the points at once.
+    """
+    def __init__(self, arcList, tableList, templateDic={}):
+        """
+        arcList   : information of the tables, such as [{'cell' : cell, 'pin' : pin, 'table_type' : table_type, ...}, ...].
+        tableList : table dicts (with 'index_1', 'index_2', 'values', 'template_name').
+        """
+        self.arcList = arcList
+        self.shapeDic = collections.OrderedDict()
+
+        for (i, tableDic) in enumerate(tableList):
+            (transitionIndex, loadIndex, valuesArray) = self._getTableAxes(tableDic, templateDic)
+            shape = (len(transitionIndex), len(loadIndex))
+            self.shapeDic.setdefault(shape, {'arcNum': [], 'transition': [], 'load': [], 'values': []})
+            self.shapeDic[shape]['arcNum'].append(i)
+            self.shapeDic[shape]['transition'].append(transitionIndex)
+            self.shapeDic[shape]['load'].append(loadIndex)
+            self.shapeDic[shape]['values'].append(valuesArray.reshape(shape))
+
+        for shapeGroupDic in self.shapeDic.values():
+            for key in ('arcNum', 'transition', 'load', 'values'):
+                shapeGroupDic[key] = numpy.array(shapeGroupDic[key])
+
+    def _getTableAxes(self, tableDic, templateDic):
+        """
+        Get (transition index, load index, values) of a table, follow the template variable_1/variable_2 order.
+        Missing index is got from the template, missing axis is saved as a one-point axis.
+        """
+        templateName = tableDic.get('template_name', '')
+        templateInfoDic = templateDic.get(templateName, {})
+        indexList = []
+        variableList = []
+
+        for indexKey in ('index_1', 'index_2'):
+            indexValue = tableDic.get(indexKey, templateInfoDic.get(indexKey, None))
+
+            if indexValue is not None:
+                indexList.append(decodeTableIndex(indexValue) if isinstance(indexValue, str) else numpy.asarray(indexValue, dtype=float))
+                variableList.append(templateInfoDic.get('variable_' + indexKey[-1], '').strip())
+
+        valuesArray = tableDic['values']
+
+        if isinstance(valuesArray, str):
+            valuesArray = decodeTableValues(valuesArray)
+
+        valuesArray = numpy.asarray(valuesArray, dtype=float).reshape([len(index) for index in indexList] or [-1])
+
+        if len(indexList) == 2:
+            # Swap the axes if variable_1 is output load or variable_2 is input transition.
+            if (variableList[0] in LOAD_VARIABLES) or (variableList[1] in TRANSITION_VARIABLES):
+                return (indexList[1], indexList[0], valuesArray.T)
+            else:
+                return (indexList[0], indexList[1], valuesArray)
+        elif len(indexList) == 1:
+            if variableList[0] in LOAD_VARIABLES:
+                return (numpy.zeros(1), indexList[0], valuesArray.reshape(1, -1))
+            else:
+                return (indexList[0], numpy.zeros(1), valuesArray.reshape(-1, 1))
+        else:
+            return (numpy.zeros(1), numpy.zeros(1), valuesArray.reshape(1, 1))
+
+    def _getSegments(self, indexArray, pointArray):
+        """
+        For every table (row of indexArray) and every point, get the left/right index of the interpolation segment
+        and the interpolation ratio (out of [0, 1] for extrapolation).
+        """
+        (tableNum, indexLength) = indexArray.shape
+
+        if indexLength == 1:
+            zeroArray = numpy.zeros((tableNum, len(pointArray)), dtype=int)
+            return (zeroArray, zeroArray, numpy.zeros((tableNum, len(pointArray))))
+
+        # Most of the tables share the same indexes, only calculate the segments for the unique indexes.
+        (uniqueIndexArray, inverseArray) = numpy.unique(indexArray, axis=0, return_inverse=True)
+        inverseArray = inverseArray.reshape(-1)
+        leftArray = (uniqueIndexArray[:, None, 1:-1] <= pointArray[None, :, None]).sum(axis=2)
+        rightArray = leftArray + 1
+        rowArray = numpy.arange(len(uniqueIndexArray))[:, None]
+        leftIndexArray = uniqueIndexArray[rowArray, leftArray]
+        rightIndexArray = uniqueIndexArray[rowArray, rightArray]
+        widthArray = rightIndexArray - leftIndexArray
+
+        # Repeated index points make zero-width segments, the ratio is 0 (value of the left point) on them.
+        ratioArray = numpy.divide(pointArray[None, :] - leftIndexArray, widthArray, out=numpy.zeros(widthArray.shape), where=(widthArray != 0))
+
+        return (leftArray[inverseArray], rightArray[inverseArray], ratioArray[inverseArray])
+
+    def lookup(self, transition, load):
+        """
+        Get table values on points (transition[i], load[i]), transition/load are scalars or arrays.
+        Return a numpy array (table number * point number), the row order is the same as arcList.
+        """
+        (transitionArray, loadArray) = numpy.broadcast_arrays(numpy.atleast_1d(numpy.asarray(transition, dtype=float)), numpy.atleast_1d(numpy.asarray(load, dtype=float)))
+        resultArray = numpy.empty((len(self.arcList), len(transitionArray)))
+
+        for shapeGroupDic in self.shapeDic.values():
+            (left1Array, right1Array, ratio1Array) = self._getSegments(shapeGroupDic['transition'], transitionArray)
+            (left2Array, right2Array, ratio2Array) = self._getSegments(shapeGroupDic['load'], loadArray)
+            valuesArray = shapeGroupDic['values']
+            rowArray = numpy.arange(len(valuesArray))[:, None]
+            resultArray[shapeGroupDic['arcNum']] = ((1 - ratio1Array) * (1 - ratio2Array) * valuesArray[rowArray, left1Array, left2Array]
+                                                   + (1 - ratio1Array) * ratio2Array * valuesArray[rowArray, left1Array, right2Array]
+                                                   + ratio1Array * (1 - ratio2Array) * valuesArray[rowArray, right1Array, left2Array]
+                                                   + ratio1Array * ratio2Array * valuesArray[rowArray, right1Array, right2Array])
+
+        return resultArray
+
+
+# Dictionary-encoded arc columns of getArcColumns, every column is saved as integer codes and a string dictionary.
+ARC_COLUMNS = ('cell', 'bus', 'pin', 'group', 'related_pin', 'related_pg_pin', 'timing_type', 'timing_sense', 'when', 'table_type', 'template_name', 'sigma_type')
+
+
+def saveArcColumns(columnDic, outputFile):
+    """
+    Save the arc columns (see libertyParser.getArcColumns) into a ".npz" file, or a directory with one ".npy" file for
+    every column (the ".npy" files can be loaded with memory map).
+    """
+    if str(outputFile).endswith('.npz'):
+        numpy.savez(outputFile, **columnDic)
+    else:
+        os.makedirs(outputFile, exist_ok=True)
+
+        for (name, columnArray) in columnDic.items():
+            numpy.save(os.path.join(outputFile, str(name) + '.npy'), columnArray)
+
+
+def loadArcColumns(inputFile, mmap=True):
+    """
+    Load the arc columns from the ".npz" file or the ".npy" directory (saved by saveArcColumns), the ".npy" files are
+    memory mapped (read-only) if mmap is True. The liberty file is not needed.
+    Return a dict {name: numpy array, ...}.
+    """
+    columnDic = collections.OrderedDict()
+
+    if os.path.isdir(inputFile):
+        for fileName in sorted(os.listdir(inputFile)):
+            if fileName.endswith('.npy'):
+                columnDic[fileName[:-4]] = numpy.load(os.path.join(inputFile, fileName), mmap_mode=('r' if mmap else None))
+    else:
+        with numpy.load(inputFile) as NF:
+            for name in NF.files:
+                columnDic[name] = NF[name]
+
+    return columnDic
+# Numpy table (end) #
+
+
+# Liberty events (start) #
+# Event types of libertyEvent.
+GROUP_OPEN_EVENT = 'group_open'
+ATTRIBUTE_EVENT = 'attribute'
+COMPLEX_ATTRIBUTE_EVENT = 'complex_attribute'
+GROUP_CLOSE_EVENT = 'group_close'
+
+# event   : one of the event types.
+# lineNum : line number on liberty file (the first line for multi-lines statement).
+# key     : group type (group events) or attribute name (attribute events).
+# value   : group name (group events) or attribute value (attribute events).
+# depth   : nesting level, the number of opened groups (the opened group itself is not counted for group open event).
+# indent  : indentation (white space width before the group line) for group open event, None for other events.
+libertyEvent = collections.namedtuple('libertyEvent', ['event', 'lineNum', 'key', 'value', 'depth', 'indent'])
+
+
+# Liberty statement compile.
+# Every match skips white spaces/comments/continuations, then gets one statement (or the "}" of a group).
+#   key : value ;
+#   key (args) ;
+#   key (args) {
+#   }
+# Strings and continuations are matched as a whole, so the statements can share one line or span multiple lines.
+libertyStatementCompile = re.compile(r"""
+    \s*(?:(?:(?P<comment>/\*).*?\*/|\\[ \t]*\r?\n|;)\s*)*
+    (?:
+        (?P<close>\})
+      | (?P<key>[^\s(){}:;,"\\]+)
+        [ \t]*(?:\\[ \t]*\r?\n[ \t]*)*
+        (?:
+            :[ \t]*
+            (?P<value>[^;\n"{}\\]*(?:(?:"[^"\\]*(?:\\.[^"\\]*)*"|\\[ \t]*\r?\n|\\(?![ \t]*\r?\n))[^;\n"{}\\]*)*)
+            (?:(?P<semicolon>;)|(?=[\n}]))
+          | \(
+            (?P<args>[^()"\\]*(?:(?:"[^"\\]*(?:\\.[^"\\]*)*"|\\[ \t]*\r?\n|\([^()"]*\)|\\(?![ \t]*\r?\n))[^()"\\]*)*)
+            \)\s*
+            (?:(?P<open>\{)|(?P<complexSemicolon>;)|(?=[^\s{;]))
+        )
+    )""", re.S | re.X)
+
+# Head of a statement, it is used to tell an unfinished statement (need more data) from an unrecognizable line.
+libertyStatementHeadCompile = re.compile(r'\s*(?:(?:/\*.*?\*/|\\[ \t]*\r?\n|;)\s*)*(?:\}|/\*|[^\s(){}:;,"\\]+[ \t]*(?:\\[ \t]*\r?\n[ \t]*)*[:(])', re.S)
+libertySpaceCompile = re.compile(r'\s*')
+libertySkipCompile = re.compile(r'\s*(?:(?:/\*.*?\*/|\\[ \t]*\r?\n|;)\s*)*', re.S)
+continuationCompile = re.compile(r'\\[ \t]*\r?\n')
+commentCompile = re.compile(r'\s*/\*.*?\*/', re.S)
+
+
+def readChunks(fileObject, chunkSize=PARSE_CHUNK_SIZE):
+    """
+    Read opened file chunk by chunk.
+    """
+    while True:
+        chunk = fileObject.read(chunkSize)
+
+        if not chunk:
+            break
+
+        yield chunk
+
+
+def readChunksThreaded(fileObject, chunkSize=PARSE_CHUNK_SIZE, queueSize=8):
+    """
+    Read opened file chunk by chunk on a background thread, so the file reading (decompression) overlaps with parsing.
+    """
+    chunkQueue = queue.Queue(queueSize)
+    stopEvent = threading.Event()
+
+    def putChunk(chunk):
+        # Give up if the reader is stopped, so the thread is not blocked on a full queue.
+        while not stopEvent.is_set():
+            try:
+                chunkQueue.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def readThread():
+        try:
+            for chunk in readChunks(fileObject, chunkSize):
+                if not putChunk(chunk):
+                    return
+
+            putChunk(None)
+        except Exception as error:
+            putChunk(error)
+
+    thread = threading.Thread(target=readThread, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            chunk = chunkQueue.get()
+
+            if chunk is None:
+                break
+            elif isinstance(chunk, Exception):
+                raise chunk
+
+            yield chunk
+    finally:
+        stopEvent.set()
+        thread.join()
+
+
+def readLibFile(libFile, mode='r', chunkSize=PARSE_CHUNK_SIZE):
+    """
+    Read liberty file chunk by chunk, compressed liberty file is decompressed on a background thread.
+    """
+    compressed = (getCompressionModule(libFile) is not None)
+
+    with openLibFile(libFile, mode) as LF:
+        if compressed:
+            for chunk in readChunksThreaded(LF, chunkSize):
+                yield chunk
+        else:
+            for chunk in readChunks(LF, chunkSize):
+                yield chunk
+
+
+def readMapChunks(libMap, chunkSize=PARSE_CHUNK_SIZE):
+    """
+    Read liberty file memory map chunk by chunk (decoded as utf-8 text).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    for start in range(0, len(libMap), chunkSize):
+        chunk = decoder.decode(libMap[start:start + chunkSize])
+
+        if chunk:
+            yield chunk
+
+
+def libertyEvents(libFile):
+    """
+    Parse liberty file (plain or gzip/bz2/xz compressed), yield libertyEvent for every group open/close and attribute.
+    The liberty file is read as a stream, so the memory does not depend on the liberty file size.
+    """
+    for event in libertyTextEvents(readLibFile(libFile)):
+        yield event
+
+
+def libertyTextEvents(textChunks, statDic=None):
+    """
+    Parse liberty text chunks (whole liberty file or part of it, split anywhere), yield libertyEvent one by one.
+    If statDic is specified, the number of parsed lines is saved as statDic['lineNum'] when finished, the number of
+    characters is saved as statDic['charNum'], the statement category counts are saved as statDic['statement'].
+    """
+    return map(libertyEvent._make, scanLibertyText(textChunks, statDic))
+
+
+def scanLibertyText(textChunks, statDic=None, lineNumbers=True, libMap=None):
+    """
+    Tokenize liberty text chunks with one scan of libertyStatementCompile, yield (event, lineNum, key, value, depth, indent)
+    tuples (the same fields with libertyEvent).
+    A statement can be split into several chunks, the chunks are joined until the statement is finished.
+    If lineNumbers is False, lineNum is None (line numbers are only counted for warning/error messages), it is faster.
+    If libMap (memory map of the liberty file, textChunks are read from it) is specified, LAZY_VALUE_KEYS complex
+    attribute values are libertyValueRef (until the first non-ASCII chunk, where the text offsets are not byte offsets).
+    """
+    statementMatch = libertyStatementCompile.match
+    chunkIterator = iter(textChunks)
+    buffer = ''
+    position = 0
+
+    # The text offset of buffer on liberty text.
+    bufferOffset = 0
+    endOfText = False
+    endsWithNewline = True
+
+    # Save opened group (type, name) list, for group close event.
+    openedGroupList = []
+
+    # lineNum is the line number of buffer position lineCountPosition.
+    lineNum = 1
+    lineCountPosition = 0
+    eventLineNum = None
+
+    # Statement category counts (only saved into statDic).
+    simpleNum = 0
+    complexNum = 0
+    groupNum = 0
+    multiLineNum = 0
+    commentNum = 0
+    irregularNum = 0
+    unrecognizedNum = 0
+    unmatchedCloseNum = 0
+    charNum = 0
+
+    while True:
+        myMatch = statementMatch(buffer, position)
+
+        if myMatch is None:
+            # Skip white spaces and comments, check the end of the liberty text.
+            skipEnd = libertySkipCompile.match(buffer, position).end()
+
+            if buffer.find('/*', position, skipEnd) != -1:
+                commentNum += len(commentCompile.findall(buffer, position, skipEnd))
+
+            position = skipEnd
+
+            if endOfText and (position >= len(buffer)):
+                break
+
+            if not endOfText:
+                headMatch = libertyStatementHeadCompile.match(buffer, position)
+
+                # The statement is not finished (or the line is not complete), read more data.
+                if headMatch or (buffer.find('\n', position) == -1):
+                    keepStart = buffer.rfind('\n', 0, position) + 1
+                    lineNum += buffer.count('\n', lineCountPosition, keepStart)
+                    bufferOffset += keepStart
+                    buffer = buffer[keepStart:]
+                    position -= keepStart
+                    lineCountPosition = 0
+
+                    try:
+                        chunk = next(chunkIterator)
+                        buffer += chunk
+                        endsWithNewline = chunk.endswith('\n')
+                        charNum += len(chunk)
+
+                        if (libMap is not None) and (not chunk.isascii()):
+                            libMap = None
+                    except StopIteration:
+                        # Add an end line, so the last statement without ";" can be finished.
+                        endOfText = True
+                        buffer += '\n'
+
+                    continue
+
+            # Unrecognizable line, skip it.
+            lineEnd = buffer.find('\n', position)
+
+            if lineEnd == -1:
+                lineEnd = len(buffer)
+
+            lineNum += buffer.count('\n', lineCountPosition, position)
+            lineCountPosition = position
+            print('*Error*: Line ' + str(lineNum) + ': Unrecognizable line!')
+            print('         ' + str(buffer[position:lineEnd]))
+            position = lineEnd
+            unrecognizedNum += 1
+            continue
+
+        (comment, close, key, value, semicolon, args, groupOpen, complexSemicolon) = myMatch.groups()
+
+        # Only the comments before the statement are counted (comments in values/strings are kept on the values).
+        if comment is not None:
+            commentNum += len(commentCompile.findall(buffer, position, myMatch.start('key') if (close is None) else (myMatch.end() - 1)))
+
+        position = myMatch.end()
+
+        if lineNumbers:
+            statementStart = myMatch.start('key') if (close is None) else (position - 1)
+            lineNum += buffer.count('\n', lineCountPosition, statementStart)
+            lineCountPosition = statementStart
+            eventLineNum = lineNum
+
+        if value is not None:
+            # The value is kept as it is on the liberty file (with the trailing white spaces and comments before ";").
+            if '\\' in value:
+                value = continuationCompile.sub('', value)
+                multiLineNum += 1
+
+            if semicolon is None:
+                lineNum += buffer.count('\n', lineCountPosition, myMatch.start('key'))
+                lineCountPosition = myMatch.start('key')
+                print('*Warning*: Line ' + str(lineNum) + ': Irregular line!')
+                print('          ' + str(myMatch.group().strip()))
+                irregularNum += 1
+
+            simpleNum += 1
+            yield (ATTRIBUTE_EVENT, eventLineNum, key, value, len(openedGroupList), None)
+        elif close is not None:
+            if openedGroupList:
+                (groupType, groupName) = openedGroupList.pop()
+                yield (GROUP_CLOSE_EVENT, eventLineNum, groupType, groupName, len(openedGroupList), None)
+            else:
+                lineNum += buffer.count('\n', lineCountPosition, position - 1)
+                lineCountPosition = position - 1
+                print('*Error*: Line ' + str(lineNum) + ': No opened group for "}"!')
+                unmatchedCloseNum += 1
+        else:
+            if '\\' in args:
+                args = continuationCompile.sub('', args)
+                multiLineNum += 1
+
+            if groupOpen is not None:
+                # Group indent is the indentation of the group line.
+                statementStart = myMatch.start('key')
+                lineStart = buffer.rfind('\n', 0, statementStart) + 1
+                groupIndent = libertySpaceCompile.match(buffer, lineStart, statementStart).end() - lineStart
+                groupNum += 1
+                yield (GROUP_OPEN_EVENT, eventLineNum, key, args, len(openedGroupList), groupIndent)
+                openedGroupList.append((key, args))
+            else:
+                if complexSemicolon is None:
+                    lineNum += buffer.count('\n', lineCountPosition, myMatch.start('key'))
+                    lineCountPosition = myMatch.start('key')
+                    print('*Warning*: Line ' + str(lineNum) + ': Irregular liberty line!')
+                    print('          ' + str(myMatch.group().strip()))
+                    irregularNum += 1
+
+                complexNum += 1
+
+                if (libMap is not None) and (key in LAZY_VALUE_KEYS):
+                    yield (COMPLEX_ATTRIBUTE_EVENT, eventLineNum, key, libertyValueRef(libMap, bufferOffset + myMatch.start('args'), bufferOffset + myMatch.end('args')), len(openedGroupList), None)
+                else:
+                    yield (COMPLEX_ATTRIBUTE_EVENT, eventLineNum, key, '(' + args + ')', len(openedGroupList), None)
+
+    if statDic is not None:
+        # The end line added on the end of text is not a line of liberty file.
+        statDic['lineNum'] = lineNum + buffer.count('\n', lineCountPosition, len(buffer) - 1) - (1 if endsWithNewline else 0)
+        statDic['charNum'] = charNum
+        statDic['statement'] = collections.OrderedDict([
+                                                        ('simple', simpleNum),
+                                                        ('complex', complexNum),
+                                                        ('group', groupNum),
+                                                        ('multi_line', multiLineNum),
+                                                        ('comment', commentNum),
+                                                        ('irregular', irregularNum),
+                                                        ('unrecognized', unrecognizedNum),
+                                                        ('unmatched_close', unmatchedCloseNum),
+                                                       ])
+# Liberty events (end) #
+
+
+# Liberty query (start) #
+# Query string is group steps split by "/", such as 'cell[name=~"DFF.*"]/pin[direction=output]/timing[related_pin=CK]/cell_rise'.
+#   type              : sub-groups with the group type ("*" for any type).
+#   [key=value]       : attribute (or group "name") is value (the quotes of attribute values are ignored).
+#   [key!=value]      : attribute is not value.
+#   [key=~regex]      : attribute matches the regular expression (re.search).
+#   [key]             : attribute exists.
+#   @key              : the attribute value (only for the last step).
+libertyQueryStepCompile = re.compile(r'\s*(?:(?P<attribute>@[^\s/\[\]]+)|(?P<type>[^\s/\[\]@]+))\s*')
+libertyQueryPredicateCompile = re.compile(r'\[\s*(?P<key>[^\s=!~\]]+)\s*(?:(?P<operator>=~|!=|=)\s*(?:"(?P<quotedValue>[^"]*)"|(?P<value>[^\]]*?))\s*)?\]\s*')
+libertyQueryCacheDic = {}
+
+
+def normalizeName(name):
+    """
+    Get the group name/attribute value without quotes (the same as the query values), such as 'AND2' for '"AND2"'.
+    """
+    return str(name).strip().strip('"')
+
+
+class libertyQueryStep():
+    """
+    One step of the compiled query, match sub-groups with group type and predicates (or get an attribute value).
+    """
+    def __init__(self, stepString, groupType='', attribute='', predicateList=[]):
+        self.stepString = stepString
+        self.groupType = groupType
+        self.attribute = attribute
+        self.predicateList = predicateList
+
+        # Name value for the name indexes.
+        self.name = None
+
+        for (key, operator, value) in predicateList:
+            if (key == 'name') and (operator == '='):
+                self.name = value
+
+    def matchValue(self, value, operator, expectedValue):
+        if isinstance(value, list):
+            return any([self.matchValue(item, operator, expectedValue) for item in value])
+
+        value = normalizeName(value)
+
+        if operator == '=':
+            return value == expectedValue
+        elif operator == '!=':
+            return value != expectedValue
+        else:
+            return expectedValue.search(value) is not None
+
+    def match(self, groupDic):
+        """
+        Check the group with group type and predicates.
+        """
+        if (self.groupType != '*') and (groupDic['type'] != self.groupType):
+            return False
+
+        for (key, operator, value) in self.predicateList:
+            if key not in groupDic:
+                if operator != '!=':
+                    return False
+            elif (operator is not None) and (not self.matchValue(groupDic[key], operator, value)):
+                return False
+
+        return True
+
+
+def compileQuery(queryString):
+    """
+    Compile query string into libertyQueryStep list, the compiled queries are cached.
+    """
+    if queryString in libertyQueryCacheDic:
+        return libertyQueryCacheDic[queryString]
+
+    stepList = []
+    position = 0
+    queryString = queryString.strip()
+
+    if queryString.startswith('/'):
+        position = 1
+
+    while position < len(queryString):
+        stepMatch = libertyQueryStepCompile.match(queryString, position)
+
+        if not stepMatch:
+            raise libertyParserError('invalid query "' + str(queryString) + '" on position ' + str(position) + '.')
+
+        stepStart = position
+        position = stepMatch.end()
+        predicateList = []
+
+        while True:
+            predicateMatch = libertyQueryPredicateCompile.match(queryString, position)
+
+            if not predicateMatch:
+                break
+
+            position = predicateMatch.end()
+            (key, operator, quotedValue, value) = predicateMatch.group('key', 'operator', 'quotedValue', 'value')
+
+            if quotedValue is not None:
+                value = quotedValue
+
+            if operator == '=~':
+                try:
+                    value = re.compile(value)
+                except re.error as error:
+                    raise libertyParserError('invalid regular expression "' + str(value) + '" on query "' + str(queryString) + '": ' + str(error))
+
+            predicateList.append((key, operator, value))
+
+        if (position < len(queryString)) and (queryString[position] != '/'):
+            raise libertyParserError('invalid query "' + str(queryString) + '" on position ' + str(position) + '.')
+
+        stepString = queryString[stepStart:position].strip()
+
+        if stepMatch.group('attribute'):
+            if predicateList or (position < len(queryString)):
+                raise libertyParserError('invalid query "' + str(queryString) + '", attribute step "' + str(stepString) + '" must be the last step without predicates.')
+
+            stepList.append(libertyQueryStep(stepString, attribute=stepMatch.group('attribute')[1:]))
+        else:
+            stepList.append(libertyQueryStep(stepString, groupType=stepMatch.group('type'), predicateList=predicateList))
+
+        position += 1
+
+    if not stepList:
+        raise libertyParserError('empty query "' + str(queryString) + '".')
+
+    libertyQueryCacheDic[queryString] = stepList
+
+    return stepList
+# Liberty query (end) #
+
+
+# Liberty writer (start) #
+class libertyWriter():
+    """
+    Write liberty data structure (libDic or any sub-group) into liberty format with one buffered file handle.
+    outputFile can be a file name (compressed with gzip/bz2/xz if it ends with ".gz"/".bz2"/".xz") or an opened text stream.
+    """
+    def __init__(self, outputFile, mode='w'):
+        if isinstance(outputFile, str):
+            if outputFile.endswith('.gz'):
+                self.fileObject = gzip.open(outputFile, mode + 't')
+            elif outputFile.endswith('.bz2'):
+                self.fileObject = bz2.open(outputFile, mode + 't')
+            elif outputFile.endswith('.xz'):
+                self.fileObject = lzma.open(outputFile, mode + 't')
+            else:
+                self.fileObject = open(outputFile, mode, buffering=1024*1024)
+
+            self.closeFile = True
+        else:
+            self.fileObject = outputFile
+            self.closeFile = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        if self.closeFile:
+            self.fileObject.close()
+        else:
+            self.fileObject.flush()
+
+    def writeGroup(self, groupDic, cellList=[]):
+        """
+        Write group (with all sub-groups), if cellList is specified, only the specified cell groups are written.
+        """
+        cellSet = set(cellList)
+        lineList = []
+        self._writeGroup(groupDic, cellSet, lineList)
+        self.fileObject.write('\n'.join(lineList) + '\n')
+
+    def _writeGroup(self, groupDic, cellSet, lineList):
+        groupDepth = groupDic['depth']
+        groupType = groupDic['type']
+        groupName = groupDic['name']
+        indent = ' '*groupDepth
+
+        lineList.append(indent + str(groupType) + ' (' + str(groupName) + ') {')
+
+        for (key, value) in groupDic.items():
+            if (key == 'fatherGroupNum') or (key == 'depth') or (key == 'type') or (key == 'name'):
+                pass
+            elif key == 'group':
+                for subGroup in value:
+                    if cellSet and (subGroup['type'] == 'cell') and (subGroup['name'] not in cellSet):
+                        continue
+
+                    self._writeGroup(subGroup, cellSet, lineList)
+
+                    # Flush big groups (such as cells) as soon as possible.
+                    if len(lineList) > 100000:
+                        self.fileObject.write('\n'.join(lineList) + '\n')
+                        del lineList[:]
+            elif key == 'values':
+                lineList.append('  ' + indent + key + ' ( \\')
+                valueString = value.replace('(', '').replace(')', '')
+                valueString = re.sub(r'"\s*,\s*"', '"#"', valueString)
+                valuesList = valueString.split('#')
+
+                for i in range(len(valuesList)):
+                    item = valuesList[i].strip()
+
+                    if i == len(valuesList)-1:
+                        lineList.append('    ' + indent + str(item) + ' \\')
+                    else:
+                        lineList.append('    ' + indent + str(item) + ', \\')
+
+                lineList.append('  ' + indent + ');')
+            elif key == 'table':
+                valueString = value.replace('"', '')
+                valueList = valueString.split(',')
+                lineList.append('  ' + indent + key + ' : "' + str(valueList[0]) + ', \\')
+
+                for i in range(1, len(valueList)):
+                    item = valueList[i].strip()
+
+                    if i == len(valueList)-1:
+                        lineList.append(str(item) + '";')
+                    else:
+                        lineList.append(str(item) + ', \\')
+            elif isinstance(value, list):
+                for item in value:
+                    if re.match(r'\(.*\)', item):
+                        if key == 'define':
+                            lineList.append('  ' + indent + key + str(item) + ';')
+                        else:
+                            lineList.append('  ' + indent + key + ' ' + str(item) + ';')
+                    else:
+                        lineList.append('  ' + indent + key + ' : ' + str(item) + ';')
+            else:
+                if re.match(r'\(.*\)', value):
+                    lineList.append('  ' + indent + key + ' ' + str(value) + ';')
+                else:
+                    lineList.append('  ' + indent + key + ' : ' + str(value) + ';')
+
+        lineList.append(indent + '}')
+# Liberty writer (end) #
+
+
+# Liberty cache (start) #
+class libertyCache():
+    """
+    Save parsed liberty data structure (libDic) into binary cache files, re-use it if the liberty file is not changed.
+    The cache key is liberty file path, size, mtime, CACHE_VERSION (and liberty file content hash if contentHash is True).
+    The cache directory size is limited to maxSize, the least recently used cache files are removed first.
+    """
+    def __init__(self, cacheDir='', maxSize=CACHE_SIZE, contentHash=False):
+        if not cacheDir:
+            cacheDir = os.environ.get('LIBERTY_PARSER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'libertyParser'))
+
+        self.cacheDir = cacheDir
+        self.maxSize = maxSize
+        self.contentHash = contentHash
+        self.cacheHead = b'LIBERTY_PARSER_CACHE ' + str(CACHE_VERSION).encode() + b'\n'
+
+    def getCacheFile(self, libFile, compact=False):
+        """
+        Get the cache file path of libFile (compact mode data is saved on another cache file).
+        """
+        libFile = os.path.abspath(libFile)
+        libFileStat = os.stat(libFile)
+        keyString = str(CACHE_VERSION) + ':' + str(libFile) + ':' + str(libFileStat.st_size) + ':' + str(libFileStat.st_mtime_ns) + ':' + str(bool(compact))
+
+        if self.contentHash:
+            libFileHash = hashlib.sha1()
+
+            with open(libFile, 'rb') as LF:
+                for block in readChunks(LF):
+                    libFileHash.update(block)
+
+            keyString = keyString + ':' + libFileHash.hexdigest()
+
+        return os.path.join(self.cacheDir, hashlib.sha1(keyString.encode()).hexdigest() + '.libcache')
+
+    def getLatestFile(self, libFile, compact=False):
+        """
+        Get the file which saves the latest cache file name of libFile (any size/mtime), it is used for incremental mode.
+        """
+        keyString = str(CACHE_VERSION) + ':' + str(os.path.abspath(libFile)) + ':' + str(bool(compact))
+
+        return os.path.join(self.cacheDir, hashlib.sha1(keyString.encode()).hexdigest() + '.liblatest')
+
+    def readCacheFile(self, cacheFile):
+        """
+        Read (libDic, cellIndexDic) from the cache file, return None if the cache file is missing or invalid.
+        """
+        if not os.path.exists(cacheFile):
+            return None
+
+        gcEnabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            with open(cacheFile, 'rb') as CF:
+                if CF.readline() != self.cacheHead:
+                    return None
+
+                libDic = pickle.load(CF)
+                cellIndexDic = pickle.load(CF)
+        except Exception:
+            return None
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+        # Update mtime for LRU.
+        try:
+            os.utime(cacheFile)
+        except OSError:
+            pass
+
+        return (libDic, cellIndexDic)
+
+    def load(self, libFile, compact=False, withIndex=False):
+        """
+        Load libDic from the cache file, return None if the cache file is missing or invalid.
+        Return (libDic, cellIndexDic) if withIndex is True, cellIndexDic is None if it is not saved.
+        """
+        cacheData = self.readCacheFile(self.getCacheFile(libFile, compact))
+
+        if (cacheData is None) or withIndex:
+            return cacheData
+        else:
+            return cacheData[0]
+
+    def loadPrevious(self, libFile, compact=False):
+        """
+        Load (libDic, cellIndexDic) of the latest saved version of libFile (for incremental mode).
+        Return None if it is missing or the cell index is not saved.
+        """
+        latestFile = self.getLatestFile(libFile, compact)
+
+        try:
+            with open(latestFile, 'r') as LF:
+                cacheFile = os.path.join(self.cacheDir, LF.read().strip())
+        except OSError:
+            return None
+
+        # The cache file is evicted (or removed by hand), it is a cache miss, remove the dangling latest file.
+        if not os.path.exists(cacheFile):
+            try:
+                os.remove(latestFile)
+            except OSError:
+                pass
+
+            return None
+
+        cacheData = self.readCacheFile(cacheFile)
+
+        if (cacheData is None) or (cacheData[1] is None):
+            return None
+
+        return cacheData
+
+    def save(self, libFile, libDic, compact=False, cellIndexDic=None):
+        """
+        Save libDic (and the cell index for incremental mode) into the cache file (write a temporary file then rename it),
+        then limit the cache directory size.
+        """
+        cacheFile = self.getCacheFile(libFile, compact)
+
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            (fileDescriptor, tempFile) = tempfile.mkstemp(dir=self.cacheDir, suffix='.tmp')
+
+            try:
+                with os.fdopen(fileDescriptor, 'wb') as TF:
+                    TF.write(self.cacheHead)
+                    pickle.dump(libDic, TF, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(cellIndexDic, TF, protocol=pickle.HIGHEST_PROTOCOL)
+
+                os.replace(tempFile, cacheFile)
+            except BaseException:
+                os.remove(tempFile)
+                raise
+
+            with open(self.getLatestFile(libFile, compact), 'w') as LF:
+                LF.write(os.path.basename(cacheFile))
+        except OSError:
+            return False
+
+        self.evict(keepFile=cacheFile)
+
+        return True
+
+    def evict(self, keepFile=''):
+        """
+        Remove the least recently used cache files until the cache directory size is not bigger than maxSize, keepFile
+        (the cache file just saved) is never removed.
+        The latest files (.liblatest) which point to the removed cache files are removed too.
+        """
+        cacheFileList = []
+        latestFileList = []
+        removedFileSet = set()
+        cacheSize = 0
+        keepFileName = os.path.basename(keepFile)
+
+        for fileName in os.listdir(self.cacheDir):
+            if fileName.endswith('.libcache'):
+                try:
+                    cacheFileStat = os.stat(os.path.join(self.cacheDir, fileName))
+                except OSError:
+                    continue
+
+                cacheFileList.append((cacheFileStat.st_mtime_ns, cacheFileStat.st_size, fileName))
+                cacheSize += cacheFileStat.st_size
+            elif fileName.endswith('.liblatest'):
+                latestFileList.append(fileName)
+
+        for (cacheFileMtime, cacheFileSize, fileName) in sorted(cacheFileList):
+            if cacheSize <= self.maxSize:
+                break
+
+            if fileName == keepFileName:
+                continue
+
+            try:
+                os.remove(os.path.join(self.cacheDir, fileName))
+                cacheSize -= cacheFileSize
+                removedFileSet.add(fileName)
+            except OSError:
+                pass
+
+        if removedFileSet:
+            for fileName in latestFileList:
+                latestFile = os.path.join(self.cacheDir, fileName)
+
+                try:
+                    with open(latestFile, 'r') as LF:
+                        if LF.read().strip() in removedFileSet:
+                            os.remove(latestFile)
+                except OSError:
+                    pass
+# Liberty cache (end) #
+
+
+# Liberty parser (start) #
+class libertyParser():
+    """
+    Parse liberty file and save a special dictionary data structure.
+    Get specified data with sub-function "getData".
+    """
+    def __init__(self, libFile, cellList=[], debug=False, lazy=False, numpyTable=False, cache=None, jobs=1, compact=False, phaseCallback=None, dedup=None, incremental=False, mmapValues=False, cancelEvent=None):
+        self.debug = debug
+
+        # cancelEvent (threading.Event) can be set on another thread to stop the parsing (libertyParserCancelled).
+        self.cancelEvent = cancelEvent
+        self.numpyTable = numpyTable
+
+        # On mmapValues mode, the table values are decoded from the liberty file memory map when they are accessed,
+        # it needs the compact group nodes.
+        self.mmapValues = mmapValues
+        self.compact = compact or mmapValues
+        compact = self.compact
+
+        # The same attribute values/group names are saved as one string object if dedup is True (it costs parse time).
+        # dedup is enabled by default on compact mode, where the memory matters more than the parse time.
+        if dedup is None:
+            dedup = compact
+
+        self.stringPool = libertyStringPool() if dedup else None
+
+        # phaseCallback(phase, 'start'/'end', self.metrics) is called on the start/end of every phase.
+        self.phaseCallback = phaseCallback
+        self.initMetrics()
+        self.startPhase('total')
+
+        self.debugPrint('* Liberty File : ' + str(libFile))
+
+        # Liberty file must exists.
+        if not os.path.exists(libFile):
+            raise libertyParserError('liberty file "' + str(libFile) + '": No such file!')
+
+        # numpy is required for numpy table mode.
+        if numpyTable and (numpy is None):
+            raise libertyParserError('numpy is required for numpyTable mode, please install numpy first.')
+
+        # If cellList is specified, regenerate the cell-based liberty file as libFile.
+        if len(cellList) > 0:
+            self.debugPrint('* Specified Cell List : ' + str(cellList))
+            self.startPhase('subset')
+            libFile = self.genCellLibFile(libFile, cellList)
+            self.endPhase('subset')
+
+        # cache can be True (default libertyCache) or a libertyCache object, it is only used for the whole liberty file parsing.
+        if cache is True:
+            cache = libertyCache()
+
+        if lazy or (len(cellList) > 0):
+            cache = None
+
+        # Only gzip compressed liberty file can be read randomly (see gzipLibReader), bz2/xz compressed liberty file is
+        # parsed on normal mode, otherwise every cell loading decompresses the liberty file from the beginning.
+        if lazy and (getCompressionModule(libFile) not in (None, gzip)):
+            print('*Warning*: lazy mode is not supported for bz2/xz compressed liberty file "' + str(libFile) + '", parse it on normal mode.')
+            lazy = False
+
+        self.libFile = libFile
+        self.lazy = lazy
+        self.jobs = jobs
+        self.libReader = None
+        self.cache = cache
+
+        # On incremental mode, the cell index (with cell hashes) is kept, so update() only parses the changed cells.
+        # It is also kept on lazy/parallel mode, where the cell index is always generated.
+        self.incremental = incremental
+        self.libIndexDic = None
+
+        # Parse the liberty file and organize the data structure as a dictionary.
+        # For lazy mode, only liberty head part is parsed, cell groups are parsed on demand.
+        self.libDic = None
+
+        cacheData = None
+
+        if cache:
+            self.startPhase('cache_load')
+            cacheData = cache.load(libFile, compact, withIndex=True)
+
+            if cacheData:
+                (self.libDic, self.libIndexDic) = cacheData
+            elif incremental:
+                # Re-use the unchanged cells of the latest cached version, only the changed cells are parsed.
+                cacheData = cache.loadPrevious(libFile, compact)
+
+                if cacheData:
+                    (self.libDic, self.libIndexDic) = cacheData
+
+                    if self.updateLibDic(libFile) is None:
+                        self.libDic = None
+
+            self.endPhase('cache_load')
+            self.debugPrint('* Load liberty data from cache : ' + str(self.libDic is not None))
+
+        if self.libDic is None:
+            self.libDic = self.genLibDic(libFile)
+
+        if incremental and (self.libIndexDic is None):
+            self.startPhase('index')
+            self.libIndexDic = self.genCellIndex(libFile)
+            self.endPhase('index')
+
+        if cache and ((cacheData is None) or (cacheData[1] is not self.libIndexDic)):
+            self.startPhase('cache_save')
+            cache.save(libFile, self.libDic, compact, self.libIndexDic)
+            self.endPhase('cache_save')
+
+        # The string pool is only kept for lazy mode (cells are parsed later).
+        if self.stringPool:
+            self.metrics['string_pool'] = self.stringPool.getStats()
+
+            if not lazy:
+                self.stringPool.clear()
+
+        # Get cell name index, pin/bundle/bus indexes are generated on demand (cell by cell).
+        self.startPhase('name_index')
+        self.genNameIndex()
+        self.endPhase('name_index')
+
+        self.endPhase('total')
+
+    def initMetrics(self):
+        """
+        Initialize self.metrics.
+        {
+         'time' : {phase1: seconds1, phase2: seconds2, ...},
+         'lines' : lines,
+         'chars' : chars,
+         'lines_per_second' : lines_per_second,
+         'chars_per_second' : chars_per_second,
+         'statement' : {'simple': num, 'complex': num, 'group': num, 'multi_line': num, 'comment': num, 'irregular': num, 'unrecognized': num, 'unmatched_close': num},
+         'group' : {groupType1: num1, groupType2: num2, ...},
+         'peak_memory_mb' : peak_memory_mb,
+        }
+        Phases are "total", "subset" (cellList mode), "index" (cell index), "cache_load", "cache_save", "read", "parse",
+        "organize" and "name_index", the time of the phases which run several times (such as lazy mode cell loading) are accumulated.
+        "read" is the liberty file reading (decompression) time on parsing, it is not included on "parse".
+        """
+        self.metrics = collections.OrderedDict()
+        self.metrics['time'] = collections.OrderedDict()
+        self.metrics['lines'] = 0
+        self.metrics['chars'] = 0
+        self.metrics['lines_per_second'] = 0
+        self.metrics['chars_per_second'] = 0
+        self.metrics['statement'] = collections.OrderedDict()
+        self.metrics['group'] = collections.OrderedDict()
+        self.metrics['peak_memory_mb'] = getPeakMemory()
+        self.phaseStartTimeDic = {}
+
+    def startPhase(self, phase):
+        """
+        Save the start time of phase, call phaseCallback.
+        """
+        self.checkCancel()
+        self.phaseStartTimeDic[phase] = time.perf_counter()
+
+        if self.phaseCallback:
+            self.phaseCallback(phase, 'start', self.metrics)
+
+    def checkCancel(self):
+        """
+        Raise libertyParserCancelled if cancelEvent is set, it is checked on every phase start and text chunk.
+        """
+        if self.cancelEvent and self.cancelEvent.is_set():
+            raise libertyParserCancelled('liberty parsing is cancelled.')
+
+    def endPhase(self, phase):
+        """
+        Accumulate the phase time into self.metrics['time'], update peak memory, call phaseCallback.
+        """
+        phaseSeconds = time.perf_counter() - self.phaseStartTimeDic.pop(phase)
+        self.metrics['time'][phase] = self.metrics['time'].get(phase, 0) + phaseSeconds
+        self.metrics['peak_memory_mb'] = getPeakMemory()
+
+        if self.phaseCallback:
+            self.phaseCallback(phase, 'end', self.metrics)
+
+    def addParseMetrics(self, statDic, groupTypeDic):
+        """
+        Accumulate the parse statistics (lines/chars/statement categories/group types) into self.metrics.
+        """
+        self.metrics['lines'] += statDic['lineNum']
+        self.metrics['chars'] += statDic['charNum']
+
+        for (category, num) in statDic['statement'].items():
+            self.metrics['statement'][category] = self.metrics['statement'].get(category, 0) + num
+
+        for (groupType, num) in groupTypeDic.items():
+            self.metrics['group'][groupType] = self.metrics['group'].get(groupType, 0) + num
+
+        parseSeconds = self.metrics['time'].get('read', 0) + self.metrics['time'].get('parse', 0)
+
+        if parseSeconds > 0:
+            self.metrics['lines_per_second'] = self.metrics['lines'] / parseSeconds
+            self.metrics['chars_per_second'] = self.metrics['chars'] / parseSeconds
+
+    def debugPrint(self, message):
+        """
+        Print debug message.
+        """
+        if self.debug:
+            currentTime = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            print('DEBUG [' + str(currentTime) + ']: ' + str(message))
+
+    def genCellIndex(self, libFile):
+        """
+        Scan liberty file once, get the byte offset of liberty head part and every top-level cell group.
+        The index is saved into sidecar file "<libFile>.index", it is re-used until liberty file size or mtime changes.
+        Return a dict.
+        {
+         'size' : size,
+         'mtime' : mtime,
+         'header' : headerEndOffset,
+         'cell' : [
+                   [cellName1, cellStartOffset1, cellEndOffset1, cellGroupNum1],
+                   [cellName2, cellStartOffset2, cellEndOffset2, cellGroupNum2],
+                   ...
+                  ],
+         'hash' : [cellHash1, cellHash2, ...],
+         'groupNum' : [cellFirstGroupNum1, cellFirstGroupNum2, ...],
+         'headerHash' : headerHash,
+        }
+        cellGroupNum is the group number of the cell (include the cell group itself).
+        cellHash is the sha1 of the cell byte range, cellFirstGroupNum is the group num of the cell group on liberty file,
+        headerHash is the sha1 of all other (not cell) bytes without whitespaces (so the blank lines between cells are
+        ignored), they are used to find the changed cells (see updateLibDic).
+        """
+        indexFile = str(libFile) + '.index'
+        libFileStat = os.stat(libFile)
+
+        # Re-use the sidecar index if liberty file is not changed.
+        if os.path.exists(indexFile):
+            try:
+                with open(indexFile, 'r') as IF:
+                    cellIndexDic = json.load(IF)
+
+                if (cellIndexDic.get('version') == CELL_INDEX_VERSION) and (cellIndexDic.get('size') == libFileStat.st_size) and (cellIndexDic.get('mtime') == libFileStat.st_mtime_ns):
+                    self.debugPrint('    Load cell index from "' + str(indexFile) + '".')
+                    return cellIndexDic
+            except (OSError, ValueError):
+                pass
+
+        self.debugPrint('    Generating cell index for liberty file "' + str(libFile) + '" ...')
+
+        # Every match eats strings/comments/other characters and stops on a brace, so only braces are handled in python.
+        braceCompile = re.compile(rb'(?:[^{}"/]|"[^"]*"|/\*.*?\*/|/(?=[^*]))*([{}])', re.S)
+        cellCompile = re.compile(rb'\s*cell\s*\((.*?)\)\s*$')
+
+        cellList = []
+        cellHashList = []
+        cellFirstGroupNumList = []
+        headerEndOffset = -1
+        depth = 0
+        cellName = None
+        cellStartOffset = 0
+        cellGroupNum = 0
+        groupNum = 0
+
+        # Bytes before hashedOffset are hashed, into cellHash if they are on a cell, otherwise into headerHash.
+        headerHash = hashlib.sha1()
+        cellHash = None
+        hashedOffset = 0
+
+        buffer = b''
+        bufferOffset = 0
+        position = 0
+
+        for chunk in readLibFile(libFile, 'rb', INDEX_CHUNK_SIZE):
+            self.checkCancel()
+            buffer += chunk
+
+            while True:
+                # No match means no more brace or an unfinished string/comment, read more data.
+                myMatch = braceCompile.match(buffer, position)
+
+                if not myMatch:
+                    break
+
+                position = myMatch.end()
+                bracePosition = position - 1
+
+                if myMatch.group(1) == b'{':
+                    if depth == 1:
+                        lineStart = buffer.rfind(b'\n', 0, bracePosition) + 1
+                        cellMatch = cellCompile.match(buffer, lineStart, bracePosition)
+
+                        if cellMatch:
+                            cellName = cellMatch.group(1).decode()
+                            cellStartOffset = bufferOffset + lineStart
+                            cellGroupNum = 0
+                            cellFirstGroupNumList.append(groupNum)
+
+                            if headerEndOffset == -1:
+                                headerEndOffset = cellStartOffset
+
+                            headerHash.update(buffer[hashedOffset - bufferOffset:lineStart].translate(None, HEADER_HASH_SKIP_BYTES))
+                            cellHash = hashlib.sha1()
+                            hashedOffset = max(hashedOffset, cellStartOffset)
+
+                    if cellName is not None:
+                        cellGroupNum += 1
+
+                    groupNum += 1
+                    depth += 1
+                else:
+                    depth -= 1
+
+                    if (depth == 1) and (cellName is not None):
+                        cellList.append([cellName, cellStartOffset, bufferOffset + position, cellGroupNum])
+                        cellHash.update(buffer[hashedOffset - bufferOffset:position])
+                        cellHashList.append(cellHash.hexdigest())
+                        hashedOffset = bufferOffset + position
+                        cellName = None
+
+            # Keep the tail from the line start, so the cell head line is still available on next scan.
+            keepStart = buffer.rfind(b'\n', 0, position) + 1
+
+            if hashedOffset < bufferOffset + keepStart:
+                if cellName is None:
+                    headerHash.update(buffer[hashedOffset - bufferOffset:keepStart].translate(None, HEADER_HASH_SKIP_BYTES))
+                else:
+                    cellHash.update(buffer[hashedOffset - bufferOffset:keepStart])
+
+                hashedOffset = bufferOffset + keepStart
+
+            bufferOffset += keepStart
+            buffer = buffer[keepStart:]
+            position -= keepStart
+
+        # The liberty file size after decompression.
+        libFileSize = bufferOffset + len(buffer)
+        headerHash.update(buffer[hashedOffset - bufferOffset:].translate(None, HEADER_HASH_SKIP_BYTES))
+
+        if headerEndOffset == -1:
+            headerEndOffset = libFileSize
+
+        cellIndexDic = {
+                        'version': CELL_INDEX_VERSION,
+                        'size': libFileStat.st_size,
+                        'mtime': libFileStat.st_mtime_ns,
+                        'header': headerEndOffset,
+                        'cell': cellList,
+                        'hash': cellHashList,
+                        'groupNum': cellFirstGroupNumList,
+                        'headerHash': headerHash.hexdigest(),
+                       }
+
+        try:
+            with open(indexFile, 'w') as IF:
+                json.dump(cellIndexDic, IF)
+        except OSError:
+            self.debugPrint('    Cannot write cell index file "' + str(indexFile) + '", skip it.')
+
+        return cellIndexDic
+
+    def genCellLibFile(self, libFile, cellList):
+        """
+        For big liberty files with multi-cells, it will cost too much time to parse the liberty file.
+        This function is used to generate a new liberty file only contains the specified cells, so it can save a lot of time on liberty file parsering.
+        """
+        cellNames = '_'.join(cellList)
+        cellLibFile = str(libFile) + '.' + str(cellNames)
+        self.debugPrint('>>> Generating cell-based liberty file "' + str(cellLibFile) + '" ...')
+
+        # Get cellName-offset info on libFile.
+        self.debugPrint('    Getting cells from liberty file "' + str(libFile) + '" ...')
+        self.startPhase('index')
+        cellIndexDic = self.genCellIndex(libFile)
+        self.endPhase('index')
+        libCellDic = collections.OrderedDict()
+
+        for (cellName, cellStartOffset, cellEndOffset, cellGroupNum) in cellIndexDic['cell']:
+            libCellDic[cellName] = (cellStartOffset, cellEndOffset)
+
+        # Make sure all the specified cells are on libFile.
+        self.debugPrint('    Check specified cells missing or not.')
+
+        missingCellList = [cell for cell in cellList if cell not in libCellDic]
+
+        if missingCellList:
+            raise libertyParserError('cell "' + '", "'.join(missingCellList) + '" is not in liberty file "' + str(libFile) + '".')
+
+        # Compressed liberty file cannot seek backward without decompressing from the beginning again,
+        # so read the specified cells on one forward pass (cell offset order) first.
+        cellStringDic = {}
+
+        if getCompressionModule(libFile) is not None:
+            self.debugPrint('    Reading cells from compressed liberty file ...')
+
+            with openLibFile(libFile, 'rb') as LF:
+                for cell in sorted(set(cellList), key=lambda cell: libCellDic[cell][0]):
+                    (cellStartOffset, cellEndOffset) = libCellDic[cell]
+                    LF.seek(cellStartOffset)
+                    cellStringDic[cell] = LF.read(cellEndOffset - cellStartOffset)
+
+        with openLibFile(libFile, 'rb') as LF, open(cellLibFile, 'wb') as CLF:
+            # Write cellLibFile - head part.
+            self.debugPrint('    Writing cell liberty file head part ...')
+            copyFileRange(LF, CLF, 0, cellIndexDic['header'])
+
+            # Write cellLibFile - cell part.
+            for cell in cellList:
+                self.debugPrint('    Writing cell liberty file cell "' + str(cell) + '" part ...')
+
+                if cell in cellStringDic:
+                    CLF.write(cellStringDic[cell])
+                else:
+                    (cellStartOffset, cellEndOffset) = libCellDic[cell]
+                    copyFileRange(LF, CLF, cellStartOffset, cellEndOffset)
+
+                CLF.write(b'\n')
+
+            CLF.write(b'}\n')
+
+        return cellLibFile
+
+    def genLibDic(self, libFile):
+        """
+        Parse the whole liberty file (on lazy/parallel/serial mode), return libDic.
+        """
+        if self.lazy:
+            return self.genLazyLibDic(libFile)
+        elif (self.jobs > 1) and (getCompressionModule(libFile) is None):
+            return self.genParallelLibDic(libFile, self.jobs)
+        else:
+            if self.jobs > 1:
+                # Every worker would decompress the liberty file from the beginning to seek its cells.
+                self.debugPrint('    Compressed liberty file "' + str(libFile) + '" is parsed on serial mode.')
+
+            groupList = self.libertyParser(libFile)
+            return self.organizeData(groupList)
+
+    def readLibRange(self, libFile, startOffset, endOffset):
+        """
+        Read bytes [startOffset, endOffset) of liberty file, gzip compressed liberty file is read with gzipLibReader.
+        """
+        if getCompressionModule(libFile) is gzip:
+            if (self.libReader is None) or (self.libReader.fileKey != self.libReader.getFileKey(libFile)):
+                self.libReader = gzipLibReader(libFile)
+
+            return self.libReader.read(startOffset, endOffset)
+
+        with openLibFile(libFile, 'rb') as LF:
+            LF.seek(startOffset)
+            return LF.read(endOffset - startOffset)
+
+    def genLazyLibDic(self, libFile):
+        """
+        Parse liberty file without cell contents, every cell is replaced with an empty stub group.
+        Then replace the cell stub groups with lazyCellDic, which parses the cell byte range on demand.
+        """
+        self.debugPrint('>>> Parsing liberty file "' + str(libFile) + '" on lazy mode ...')
+        self.startPhase('index')
+        cellIndexDic = self.genCellIndex(libFile)
+        self.libIndexDic = cellIndexDic
+        self.endPhase('index')
+        libSkeletonList = []
+        lastEndOffset = 0
+        stubLength = 0
+
+        with openLibFile(libFile, 'rb') as LF:
+            for (cellName, cellStartOffset, cellEndOffset, cellGroupNum) in cellIndexDic['cell']:
+                libSkeletonList.append(LF.read(cellStartOffset - lastEndOffset))
+
+                # Keep cell head line (with indentation) as the stub group.
+                cellHeadString = LF.read(min(cellEndOffset - cellStartOffset, 1024))
+                cellHeadString = cellHeadString[:cellHeadString.find(b'{') + 1]
+                cellDepthString = cellHeadString[:len(cellHeadString) - len(cellHeadString.lstrip())]
+                libSkeletonList.append(cellHeadString + b'\n' + cellDepthString + b'}')
+                stubLength += len(libSkeletonList[-1].decode())
+
+                LF.seek(cellEndOffset)
+                lastEndOffset = cellEndOffset
+
+            libSkeletonList.append(LF.read())
+
+        libSkeletonString = b''.join(libSkeletonList).decode()
+        (groupList, libFileLine) = self._parseLibTexts([libSkeletonString])
+
+        # The cell stub groups (2 lines for every cell) are counted again when the cells are parsed.
+        stubNum = len(cellIndexDic['cell'])
+
+        if stubNum > 0:
+            self.metrics['lines'] -= 2*stubNum
+            self.metrics['chars'] -= stubLength
+            self.metrics['statement']['group'] -= stubNum
+            self.metrics['group']['cell'] -= stubNum
+
+            if self.metrics['group']['cell'] == 0:
+                del self.metrics['group']['cell']
+
+        # Get the group num of every skeleton group on the complete liberty file, so "fatherGroupNum" is the same as normal mode.
+        groupNumList = []
+        cellGroupNumList = []
+        groupNumShift = 0
+
+        for groupDic in groupList:
+            groupNumList.append(len(groupNumList) + groupNumShift)
+
+            if (groupDic['fatherGroupNum'] == 0) and (groupDic['type'] == 'cell'):
+                cellGroupNumList.append(groupNumList[-1])
+                groupNumShift += cellIndexDic['cell'][len(cellGroupNumList) - 1][3] - 1
+
+        libDic = self.organizeData(groupList)
+
+        for groupDic in groupList[1:]:
+            groupDic['fatherGroupNum'] = groupNumList[groupDic['fatherGroupNum']]
+
+        if 'group' in libDic:
+            cellNum = 0
+
+            for (i, groupDic) in enumerate(libDic['group']):
+                if groupDic['type'] == 'cell':
+                    (cellName, cellStartOffset, cellEndOffset, cellGroupNum) = cellIndexDic['cell'][cellNum]
+                    libDic['group'][i] = lazyCellDic(self, libFile, cellStartOffset, cellEndOffset, cellGroupNumList[cellNum], groupDic)
+                    cellNum += 1
+
+        self.debugPrint('    Done')
+
+        return libDic
+
+    def genParallelLibDic(self, libFile, jobs):
+        """
+        Parse liberty file with multi-processes, get the same libDic with the serial parsing.
+        The liberty file is split on top-level cell groups, cell ranges are parsed on a process pool with "jobs" workers,
+        then the cell groups are merged back on the original order.
+        """
+        libDic = self.genLazyLibDic(libFile)
+        cellNumList = []
+
+        for (i, groupDic) in enumerate(libDic.get('group', [])):
+            if isinstance(groupDic, lazyCellDic):
+                cellNumList.append(i)
+
+        if not cellNumList:
+            return libDic
+
+        self.debugPrint('>>> Parsing ' + str(len(cellNumList)) + ' cells with ' + str(jobs) + ' jobs ...')
+
+        # Split cells into continuous chunks with similar size, several chunks for every job to balance the load.
+        cellRangeSize = 0
+
+        for i in cellNumList:
+            cellRangeSize += libDic['group'][i].cellEndOffset - libDic['group'][i].cellStartOffset
+
+        chunkSize = max(cellRangeSize // (jobs * 4), 1)
+        chunkList = [[]]
+        chunkCellNumList = [[]]
+        currentChunkSize = 0
+
+        for i in cellNumList:
+            cellDic = libDic['group'][i]
+
+            if currentChunkSize >= chunkSize:
+                chunkList.append([])
+                chunkCellNumList.append([])
+                currentChunkSize = 0
+
+            chunkList[-1].append([cellDic.cellStartOffset, cellDic.cellEndOffset, cellDic.cellGroupNum])
+            chunkCellNumList[-1].append(i)
+            currentChunkSize += cellDic.cellEndOffset - cellDic.cellStartOffset
+
+        self.startPhase('parse')
+        gcEnabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                for (cellNumList, (cellDicList, metrics)) in zip(chunkCellNumList, executor.map(parseCellRanges, [libFile]*len(chunkList), chunkList, [self.compact]*len(chunkList), [self.stringPool is not None]*len(chunkList))):
+                    self.addParseMetrics({'lineNum': metrics['lines'], 'charNum': metrics['chars'], 'statement': metrics['statement']}, metrics['group'])
+
+                    # The strings are only deduplicated on every worker.
+                    if 'string_pool' in metrics:
+                        self.stringPool.addHits(metrics['string_pool']['hits'], metrics['string_pool']['saved_bytes'])
+
+                    for (i, cellDic) in zip(cellNumList, cellDicList):
+                        if self.compact:
+                            cellDic.fatherGroupNum = dict.__getitem__(libDic['group'][i], 'fatherGroupNum')
+                            groupDic = cellDic
+                        else:
+                            groupDic = {'fatherGroupNum': dict.__getitem__(libDic['group'][i], 'fatherGroupNum')}
+                            groupDic.update(cellDic)
+
+                        libDic['group'][i] = groupDic
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+        self.endPhase('parse')
+
+        self.debugPrint('    Done')
+
+        return libDic
+
+    def updateLibDic(self, libFile):
+        """
+        Splice the added/changed cells of libFile into self.libDic, which is parsed from the previous version of libFile
+        (with cell index self.libIndexDic). The changed cells are found with the cell hashes (see genCellIndex), only
+        their byte ranges are parsed, the unchanged cells are re-used (only the group nums are shifted).
+        Return a dict, or None if the liberty head part is changed (then the whole liberty file must be parsed again).
+        {
+         'added' : [cellName1, cellName2, ...],
+         'removed' : [cellName1, cellName2, ...],
+         'changed' : [cellName1, cellName2, ...],
+        }
+        """
+        self.debugPrint('>>> Updating liberty data with the changed cells of "' + str(libFile) + '" ...')
+        oldCellIndexDic = self.libIndexDic
+        self.startPhase('index')
+        cellIndexDic = self.genCellIndex(libFile)
+        self.libIndexDic = cellIndexDic
+        self.endPhase('index')
+
+        if (not oldCellIndexDic) or ('headerHash' not in oldCellIndexDic) or (oldCellIndexDic['headerHash'] != cellIndexDic['headerHash']):
+            self.debugPrint('    Liberty head part is changed.')
+            return None
+
+        # The cell groups must be continuous on the library group list, so they can be replaced together.
+        libGroupList = self.libDic.get('group', [])
+        cellNumList = [i for (i, groupDic) in enumerate(libGroupList) if groupDic['type'] == 'cell']
+
+        if (not cellNumList) or (len(cellNumList) != len(oldCellIndexDic['cell'])) or (cellNumList[-1] - cellNumList[0] + 1 != len(cellNumList)):
+            self.debugPrint('    Cell groups are not continuous on the liberty file.')
+            return None
+
+        # On mmapValues mode, the table values of the re-used cells are byte ranges on the memory map of the previous
+        # version, which is invalid after the liberty file is rewritten, so they are moved onto the new memory map (the
+        # cell bytes are not changed, only the cell offset). The liberty head part values cannot be moved.
+        libMap = None
+
+        if self.mmapValues:
+            for (i, groupDic) in enumerate(libGroupList):
+                if ((i < cellNumList[0]) or (i > cellNumList[-1])) and getValueRefList(groupDic):
+                    self.debugPrint('    Table values are found on liberty head part.')
+                    return None
+
+            libMap = self.openLibMap(libFile)
+
+            if libMap is None:
+                return None
+
+        # Old cell groups with (cellName, cellHash), the same cells may be repeated.
+        oldCellDic = {}
+        oldCellNameSet = set()
+
+        for (i, (cellInfoList, cellHash, cellFirstGroupNum)) in enumerate(zip(oldCellIndexDic['cell'], oldCellIndexDic['hash'], oldCellIndexDic['groupNum'])):
+            oldCellDic.setdefault((cellInfoList[0], cellHash), []).append((libGroupList[cellNumList[i]], cellFirstGroupNum, cellInfoList[1]))
+            oldCellNameSet.add(cellInfoList[0])
+
+        updateDic = collections.OrderedDict([('added', []), ('removed', []), ('changed', [])])
+        cellGroupList = []
+        cellRangeList = []
+        parseCellNumList = []
+        cellNameSet = set()
+
+        for (cellInfoList, cellHash, cellFirstGroupNum) in zip(cellIndexDic['cell'], cellIndexDic['hash'], cellIndexDic['groupNum']):
+            (cellName, cellStartOffset, cellEndOffset, cellGroupNum) = cellInfoList
+            cellNameSet.add(cellName)
+
+            if oldCellDic.get((cellName, cellHash)):
+                (cellDic, oldCellFirstGroupNum, oldCellStartOffset) = oldCellDic[(cellName, cellHash)].pop(0)
+
+                if libMap is not None:
+                    for valueRef in getValueRefList(cellDic):
+                        valueRef.libMap = libMap
+                        valueRef.start += cellStartOffset - oldCellStartOffset
+                        valueRef.end += cellStartOffset - oldCellStartOffset
+
+                if isinstance(cellDic, lazyCellDic):
+                    cellDic.libFile = libFile
+                    cellDic.cellStartOffset = cellStartOffset
+                    cellDic.cellEndOffset = cellEndOffset
+                    cellDic.cellGroupNum = cellFirstGroupNum
+
+                self.shiftGroupNum(cellDic, cellFirstGroupNum - oldCellFirstGroupNum)
+                cellGroupList.append(cellDic)
+            else:
+                if cellName in oldCellNameSet:
+                    updateDic['changed'].append(cellName)
+                else:
+                    updateDic['added'].append(cellName)
+
+                if self.lazy:
+                    cellStubDic = {'fatherGroupNum': 0, 'depth': libGroupList[cellNumList[0]]['depth'], 'type': 'cell', 'name': cellName}
+                    cellGroupList.append(lazyCellDic(self, libFile, cellStartOffset, cellEndOffset, cellFirstGroupNum, cellStubDic))
+                else:
+                    cellGroupList.append(None)
+                    cellRangeList.append([cellStartOffset, cellEndOffset, cellFirstGroupNum])
+                    parseCellNumList.append(len(cellGroupList) - 1)
+
+        for cellInfoList in oldCellIndexDic['cell']:
+            if cellInfoList[0] not in cellNameSet:
+                updateDic['removed'].append(cellInfoList[0])
+                cellNameSet.add(cellInfoList[0])
+
+        if cellRangeList:
+            self.startPhase('parse')
+            (cellDicList, metrics) = parseCellRanges(libFile, cellRangeList, self.compact, self.stringPool is not None)
+            self.addParseMetrics({'lineNum': metrics['lines'], 'charNum': metrics['chars'], 'statement': metrics['statement']}, metrics['group'])
+
+            for (i, cellDic) in zip(parseCellNumList, cellDicList):
+                if self.compact:
+                    cellDic.fatherGroupNum = 0
+                    cellGroupList[i] = cellDic
+                else:
+                    cellGroupList[i] = {'fatherGroupNum': 0}
+                    cellGroupList[i].update(cellDic)
+
+            self.endPhase('parse')
+
+        # The groups after the cells are shifted with the group num change of all cells.
+        groupNumShift = sum([cellInfoList[3] for cellInfoList in cellIndexDic['cell']]) - sum([cellInfoList[3] for cellInfoList in oldCellIndexDic['cell']])
+
+        for groupDic in libGroupList[cellNumList[-1]+1:]:
+            self.shiftGroupNum(groupDic, groupNumShift)
+
+        libGroupList[cellNumList[0]:cellNumList[-1]+1] = cellGroupList
+        self.libFile = libFile
+
+        self.debugPrint('    Added ' + str(len(updateDic['added'])) + ' cells, removed ' + str(len(updateDic['removed'])) + ' cells, changed ' + str(len(updateDic['changed'])) + ' cells.')
+
+        return updateDic
+
+    def shiftGroupNum(self, groupDic, groupNumShift):
+        """
+        Shift "fatherGroupNum" of all sub-groups of groupDic (the cell is moved on the liberty file).
+        """
+        if (groupNumShift == 0) or (isinstance(groupDic, lazyCellDic) and (not groupDic.loaded)):
+            return
+
+        for subGroupDic in groupDic.get('group', []):
+            subGroupDic['fatherGroupNum'] += groupNumShift
+            self.shiftGroupNum(subGroupDic, groupNumShift)
+
+    def update(self, libFile=''):
+        """
+        Update self.libDic after the liberty file (or the new liberty file libFile) is changed, only the added/changed
+        cells are parsed if the cell index is kept (incremental/lazy/parallel mode), see updateLibDic.
+        Return the updateLibDic dict, or None if the whole liberty file is parsed again.
+        """
+        if not libFile:
+            libFile = self.libFile
+
+        self.startPhase('total')
+        updateDic = None
+
+        if self.libIndexDic:
+            updateDic = self.updateLibDic(libFile)
+
+        if updateDic is None:
+            self.libDic = self.genLibDic(libFile)
+            self.libFile = libFile
+
+            if self.incremental and (self.libIndexDic is None):
+                self.startPhase('index')
+                self.libIndexDic = self.genCellIndex(libFile)
+                self.endPhase('index')
+
+        if self.cache:
+            self.startPhase('cache_save')
+            self.cache.save(libFile, self.libDic, self.compact, self.libIndexDic)
+            self.endPhase('cache_save')
+
+        if self.stringPool and (not self.lazy):
+            self.stringPool.clear()
+
+        self.startPhase('name_index')
+        self.genNameIndex()
+        self.endPhase('name_index')
+
+        self.endPhase('total')
+
+        return updateDic
+
+    def getLastOpenedGroupNum(self, openedGroupNumList):
+        """
+        All of the new attribute data are saved on last opened group, so need to get the last opened group num.
+        """
+        lastOpenedGroupNum = -1
+
+        if len(openedGroupNumList) > 0:
+            lastOpenedGroupNum = openedGroupNumList[-1]
+
+        return lastOpenedGroupNum
+
+    def libertyParser(self, libFile):
+        """
+        Parse liberty file line in line.
+        Save data block based on "group".
+        Save data blocks into a list.
+        """
+        self.debugPrint('>>> Parsing liberty file "' + str(libFile) + '" ...')
+        startTime = time.perf_counter()
+
+        libMap = self.openLibMap(libFile) if self.mmapValues else None
+
+        if libMap is not None:
+            (groupList, libFileLine) = self._parseLibTexts(readMapChunks(libMap), libMap)
+        else:
+            (groupList, libFileLine) = self._parseLibTexts(readLibFile(libFile))
+
+        parseSeconds = time.perf_counter() - startTime
+        self.debugPrint('    Done')
+        self.debugPrint('    Parse time : ' + str(libFileLine) + ' lines, ' + str('%.3f' % parseSeconds) + ' seconds.')
+
+        return groupList
+
+    def openLibMap(self, libFile):
+        """
+        Get the read-only memory map of liberty file for mmapValues mode.
+        Return None if the liberty file is compressed, empty or with "\\r" newlines (the text offsets are not the same
+        as the text mode reading), then the liberty file is read as text.
+        """
+        if getCompressionModule(libFile) is not None:
+            return None
+
+        try:
+            with open(libFile, 'rb') as LF:
+                libMap = mmap.mmap(LF.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        if libMap.find(b'\r') != -1:
+            self.debugPrint('    "\\r" newlines are found, mmapValues is disabled.')
+            return None
+
+        return libMap
+
+    def _parseLibTexts(self, libTexts, libMap=None):
+        """
+        Parse liberty text chunks (whole liberty file or part of it), see scanLibertyText for libMap.
+        Return groupList and the number of parsed lines.
+        """
+        statDic = {}
+        readTimeList = [0]
+
+        def timeLibTexts():
+            # Time the liberty text reading separately.
+            libTextIterator = iter(libTexts)
+
+            while True:
+                startTime = time.perf_counter()
+                libText = next(libTextIterator, None)
+                readTimeList[0] += time.perf_counter() - startTime
+
+                if libText is None:
+                    break
+
+                self.checkCancel()
+                yield libText
+
+        self.startPhase('parse')
+
+        # Garbage collection is useless for the new created groups, but costs much time on big liberty file.
+        gcEnabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            if self.compact:
+                groupList = self._buildGroupTree(scanLibertyText(timeLibTexts(), statDic, lineNumbers=False, libMap=libMap))
+            else:
+                groupList = self._buildGroupList(scanLibertyText(timeLibTexts(), statDic, lineNumbers=False))
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+        self.endPhase('parse')
+        self.metrics['time']['parse'] -= readTimeList[0]
+        self.metrics['time']['read'] = self.metrics['time'].get('read', 0) + readTimeList[0]
+
+        groupTypeDic = {}
+
+        for groupDic in groupList:
+            groupType = groupDic['type']
+            groupTypeDic[groupType] = groupTypeDic.get(groupType, 0) + 1
+
+        self.addParseMetrics(statDic, groupTypeDic)
+
+        return (groupList, statDic['lineNum'])
+
+    def _buildGroupList(self, events):
+        """
+        Save liberty events into groupList.
+        """
+        # Save group data structure into groupList.
+        groupList = []
+
+        # Save opened group list.
+        openedGroupNumList = []
+
+        # Last opened group num on groupList, point to the latest open group.
+        lastOpenedGroupNum = -1
+        lastOpenedGroupDic = None
+
+        # Keys are interned, values are saved on the string pool (if dedup is enabled).
+        intern = sys.intern
+        poolDic = self.stringPool.poolDic if self.stringPool else None
+        poolHitNum = 0
+        poolSavedBytes = 0
+
+        for (event, lineNum, key, value, depth, indent) in events:
+            if (poolDic is not None) and (key not in DEDUP_SKIP_KEYS):
+                pooledValue = poolDic.setdefault(value, value)
+
+                if pooledValue is not value:
+                    poolHitNum += 1
+                    poolSavedBytes += sys.getsizeof(value)
+                    value = pooledValue
+
+            if event == ATTRIBUTE_EVENT:
+                lastOpenedGroupDic[intern(key)] = value
+            elif event == COMPLEX_ATTRIBUTE_EVENT:
+                key = intern(key)
+
+                if key in lastOpenedGroupDic:
+                    # For "voltage_map" or such kind items (there are some "voltage_map" on the same group).
+                    if isinstance(lastOpenedGroupDic[key], list):
+                        lastOpenedGroupDic[key].append(value)
+                    else:
+                        lastOpenedGroupDic[key] = [lastOpenedGroupDic[key], value]
+                else:
+                    lastOpenedGroupDic[key] = value
+            elif event == GROUP_OPEN_EVENT:
+                lastOpenedGroupDic = {
+                                      'fatherGroupNum': lastOpenedGroupNum,
+                                      'depth': indent,
+                                      'type': intern(key),
+                                      'name': value,
+                                     }
+
+                lastOpenedGroupNum = len(groupList)
+                groupList.append(lastOpenedGroupDic)
+                openedGroupNumList.append(lastOpenedGroupNum)
+            else:
+                openedGroupNumList.pop()
+                (lastOpenedGroupNum) = self.getLastOpenedGroupNum(openedGroupNumList)
+                lastOpenedGroupDic = groupList[lastOpenedGroupNum] if openedGroupNumList else None
+
+        if poolDic is not None:
+            self.stringPool.addHits(poolHitNum, poolSavedBytes)
+
+        return groupList
+
+    def _buildGroupTree(self, events):
+        """
+        Save liberty events into groupList with compact group nodes (libertyGroup), sub-groups are linked on parsing.
+        """
+        groupList = []
+        openedGroupList = []
+        lastOpenedGroup = None
+        attributeDic = None
+
+        # Attribute name tuples are shared by the groups with the same attributes.
+        attributeKeysDic = {}
+        intern = sys.intern
+        poolDic = self.stringPool.poolDic if self.stringPool else None
+        poolHitNum = 0
+        poolSavedBytes = 0
+
+        for (event, lineNum, key, value, depth, indent) in events:
+            if (poolDic is not None) and (key not in DEDUP_SKIP_KEYS):
+                pooledValue = poolDic.setdefault(value, value)
+
+                if pooledValue is not value:
+                    poolHitNum += 1
+                    poolSavedBytes += sys.getsizeof(value)
+                    value = pooledValue
+
+            if event == ATTRIBUTE_EVENT:
+                attributeDic[intern(key)] = value
+            elif event == COMPLEX_ATTRIBUTE_EVENT:
+                key = intern(key)
+
+                if key in attributeDic:
+                    # The repeated lazy values are decoded.
+                    if type(value) is libertyValueRef:
+                        value = value.decode()
+
+                    if isinstance(attributeDic[key], list):
+                        attributeDic[key].append(value)
+                    elif type(attributeDic[key]) is libertyValueRef:
+                        attributeDic[key] = [attributeDic[key].decode(), value]
+                    else:
+                        attributeDic[key] = [attributeDic[key], value]
+                else:
+                    attributeDic[key] = value
+            elif event == GROUP_OPEN_EVENT:
+                if lastOpenedGroup is None:
+                    group = libertyGroup(-1, indent, intern(key), value)
+                else:
+                    group = libertyGroup(openedGroupList[-1][1], indent, intern(key), value)
+
+                    if lastOpenedGroup.group is None:
+                        lastOpenedGroup.group = [group]
+                    else:
+                        lastOpenedGroup.group.append(group)
+
+                openedGroupList.append((group, len(groupList), attributeDic))
+                groupList.append(group)
+                lastOpenedGroup = group
+                attributeDic = {}
+            else:
+                self._closeGroupTree(lastOpenedGroup, attributeDic, attributeKeysDic)
+                (group, groupNum, attributeDic) = openedGroupList.pop()
+                lastOpenedGroup = openedGroupList[-1][0] if openedGroupList else None
+
+        # Save the attributes of unclosed groups.
+        while openedGroupList:
+            self._closeGroupTree(lastOpenedGroup, attributeDic, attributeKeysDic)
+            (group, groupNum, attributeDic) = openedGroupList.pop()
+            lastOpenedGroup = openedGroupList[-1][0] if openedGroupList else None
+
+        if poolDic is not None:
+            self.stringPool.addHits(poolHitNum, poolSavedBytes)
+
+        return groupList
+
+    def _closeGroupTree(self, group, attributeDic, attributeKeysDic):
+        """
+        Save the attributes of a closed group into the compact group node.
+        """
+        if attributeDic:
+            attributeKeys = tuple(attributeDic)
+            group.attributeKeys = attributeKeysDic.setdefault(attributeKeys, attributeKeys)
+            group.attributeValues = tuple(attributeDic.values())
+
+    def organizeData(self, groupList):
+        """
+        Re-organize list data structure (groupList) into a dictionary data structure.
+        """
+        self.debugPrint('>>> Re-organizing data structure ...')
+        self.startPhase('organize')
+
+        # Compact group nodes are linked on parsing.
+        if groupList and (not isinstance(groupList[0], libertyGroup)):
+            for groupDic in groupList[1:]:
+                fatherGroupDic = groupList[groupDic['fatherGroupNum']]
+
+                if 'group' in fatherGroupDic:
+                    fatherGroupDic['group'].append(groupDic)
+                else:
+                    fatherGroupDic['group'] = [groupDic]
+
+        self.endPhase('organize')
+        self.debugPrint('    Done')
+
+        return groupList[0]
+# Liberty parser (end) #
+
+# Verification functions (start) #
+    def restoreLib(self, libFile, groupDic='', cellList=[]):
+        """
+        This function is used to verify the liberty parser.
+        It converts self.libDic into the original liberty file (comment will be ignored).
+        Please save the output message into a file, then compare it with the original liberty file.
+        If cellList is specified, only the specified cells are written.
+        """
+        if groupDic == '':
+            groupDic = self.libDic
+
+        with libertyWriter(libFile, 'a') as LW:
+            LW.writeGroup(groupDic, cellList)
+# Verification functions (end) #
+
+# Application functions (start) #
+    def genNameIndex(self):
+        """
+        Generate cell name index and table template registry for self.libDic.
+        self.cellIndexDic : {cellName: cellGroupDic, ...} (liberty order, the first one for duplicate cell names)
+        self.cellGroupList : [(cellName, cellGroupDic), ...] (all cell groups on liberty order)
+        self.cellNumDic : {cellName: [cellNum, ...], ...} (cell order on liberty, cellGroupList index)
+        self.templateDic : {templateName: templateInfoDic, ...} (see getTemplateInfo)
+        self.axisDic : {indexString: axis, ...} (table axes, see getTableAxis)
+        self.queryCellDic : {normalizedCellName: [cellGroupDic, ...], ...} (names without quotes, for query)
+        """
+        self.cellIndexDic = collections.OrderedDict()
+        self.cellGroupList = []
+        self.cellNumDic = {}
+        self.queryCellDic = {}
+        self.pinIndexDic = {}
+        self.templateDic = collections.OrderedDict()
+        self.axisDic = {}
+
+        if 'group' in self.libDic:
+            for libGroupDic in self.libDic['group']:
+                libGroupType = libGroupDic['type']
+
+                if libGroupType == 'cell':
+                    cellName = libGroupDic['name']
+
+                    if cellName in self.cellNumDic:
+                        print('*Warning*: cell "' + str(cellName) + '" is defined more than once, getCellGroup/getPinGroup get the first one.')
+                        self.cellNumDic[cellName].append(len(self.cellGroupList))
+                    else:
+                        self.cellIndexDic[cellName] = libGroupDic
+                        self.cellNumDic[cellName] = [len(self.cellGroupList)]
+
+                    self.cellGroupList.append((cellName, libGroupDic))
+                    self.queryCellDic.setdefault(normalizeName(cellName), []).append(libGroupDic)
+                elif libGroupType.endswith('_template'):
+                    templateName = libGroupDic['name']
+                    self.templateDic[templateName] = collections.OrderedDict()
+                    self.templateDic[templateName]['type'] = libGroupType
+
+                    for (key, value) in libGroupDic.items():
+                        if templateKeyCompile.match(key):
+                            self.templateDic[templateName][key] = value
+
+    def _getCellPinIndex(self, cellName):
+        """
+        Get (generate it for the first time) pin/bundle/bus index of the specified cell.
+        Return a dict.
+        {
+         'pin' : {pinName: pinGroupDic, ...},
+         'bus' : {bundleOrBusName: bundleOrBusGroupDic, ...},
+         'busPin' : {(bundleOrBusName, pinName): pinGroupDic, ...},
+         'queryPin' : {normalizedPinName: [pinGroupDic, ...], ...},
+        }
+        """
+        if cellName not in self.pinIndexDic:
+            cellPinIndexDic = {'pin': {}, 'bus': {}, 'busPin': {}, 'queryPin': {}}
+
+            if cellName in self.cellIndexDic:
+                for cellGroupDic in self.cellIndexDic[cellName].get('group', []):
+                    cellGroupType = cellGroupDic['type']
+
+                    if cellGroupType == 'pin':
+                        cellPinIndexDic['pin'][cellGroupDic['name']] = cellGroupDic
+                        cellPinIndexDic['queryPin'].setdefault(normalizeName(cellGroupDic['name']), []).append(cellGroupDic)
+                    elif (cellGroupType == 'bundle') or (cellGroupType == 'bus'):
+                        busName = cellGroupDic['name']
+                        cellPinIndexDic['bus'][busName] = cellGroupDic
+
+                        for busGroupDic in cellGroupDic.get('group', []):
+                            if busGroupDic['type'] == 'pin':
+                                cellPinIndexDic['busPin'][(busName, busGroupDic['name'])] = busGroupDic
+
+            self.pinIndexDic[cellName] = cellPinIndexDic
+
+        return self.pinIndexDic[cellName]
+
+    def getCellGroup(self, cellName):
+        """
+        Get the cell group dict with cell name, return None if the cell is missing.
+        """
+        return self.cellIndexDic.get(cellName)
+
+    def getPinGroup(self, cellName, pinName):
+        """
+        Get the pin group dict with (cell name, pin name), return None if the pin is missing.
+        """
+        return self._getCellPinIndex(cellName)['pin'].get(pinName)
+
+    def getBusGroup(self, cellName, busName):
+        """
+        Get the bundle/bus group dict with (cell name, bundle/bus name), return None if the bundle/bus is missing.
+        """
+        return self._getCellPinIndex(cellName)['bus'].get(busName)
+
+    def getBusPinGroup(self, cellName, busName, pinName):
+        """
+        Get the bundle/bus member pin group dict with (cell name, bundle/bus name, pin name), return None if the pin is missing.
+        """
+        return self._getCellPinIndex(cellName)['busPin'].get((busName, pinName))
+
+    def _getCellGroupList(self, cellList=[]):
+        """
+        Get [(cellName, cellGroupDic), ...] for specified cells (all cells if cellList is empty) on liberty order.
+        """
+        if len(cellList) == 0:
+            return list(self.cellGroupList)
+
+        cellNumList = sorted([cellNum for cellName in set(cellList) for cellNum in self.cellNumDic.get(cellName, [])])
+
+        return [self.cellGroupList[cellNum] for cellNum in cellNumList]
+
+    def getUnit(self):
+        """
+        Get all "unit" setting.
+        Return a dict.
+        {
+         name1 : unit1,
+         name2 : unit2,
+         ...
+        }
+        """
+        unitDic = collections.OrderedDict()
+
+        for key in self.libDic.keys():
+            if re.match(r'.*_unit', key):
+                value = self.libDic[key]
+                unitDic[key] = value
+
+        return unitDic
+
+    def getCellList(self):
+        """
+        Get all cells.
+        Return a list.
+        [cellName1, cellName2, ...]
+        """
+        cellList = [cellName for (cellName, cellGroupDic) in self.cellGroupList]
+
+        return cellList
+
+    def getCellArea(self, cellList=[]):
+        """
+        Get cell area information for specified cell list.
+        Return a dict.
+        {
+         cellName1 : area1,
+         cellName2 : area2,
+         ...
+        }
+        """
+        cellAreaDic = collections.OrderedDict()
+
+        for (cellName, groupDic) in self._getCellGroupList(cellList):
+            if 'area' in groupDic:
+                cellArea = groupDic['area']
+                cellAreaDic[cellName] = cellArea
+
+        for cellName in cellList:
+            if cellName not in cellAreaDic:
+                cellAreaDic[cellName] = ''
+
+        return cellAreaDic
+
+    def getCellLeakagePower(self, cellList=[]):
+        """
+        Get cell leakage_power information for specified cell list.
+        Return a dict.
+        {
+         cellName1 : [
+                      {
+                       'value' : value,
+                       'when' : when,
+                       'related_pg_pin' : related_pg_pin,
+                      }
+                      ...
+                     ],
+         ...
+        }
+        """
+        cellLeakagePowerDic = collections.OrderedDict()
+
+        for (cellName, groupDic) in self._getCellGroupList(cellList):
+            if 'group' in groupDic:
+                for cellGroupDic in groupDic['group']:
+                    cellGroupType = cellGroupDic['type']
+
+                    if cellGroupType == 'leakage_power':
+                        leakagePowerDic = {}
+
+                        for (key, value) in cellGroupDic.items():
+                            if (key == 'value') or (key == 'when') or (key == 'related_pg_pin'):
+                                leakagePowerDic[key] = value
+
+                        cellLeakagePowerDic.setdefault(cellName, [])
+                        cellLeakagePowerDic[cellName].append(leakagePowerDic)
+
+        return cellLeakagePowerDic
+
+    def _newTableDic(self):
+        """
+        Table dict for timing/internal_power tables, it is libertyTable on numpyTable mode.
+        """
+        if self.numpyTable:
+            return libertyTable()
+        else:
+            return collections.OrderedDict()
+
+    def _getTableInfo(self, tableGroupDic, keyList, withTemplate=False):
+        """
+        Get table dict from the table group (cell_rise/rise_power ...), only the keys on keyList are saved.
+        If withTemplate is True, the keys are TEMPLATE_TABLE_KEYS, the missing indexes are inherited from the table template.
+        The indexes are got with getTableAxis.
+        """
+        tableDic = self._newTableDic()
+        templateName = tableGroupDic['name']
+        templateInfoDic = {}
+
+        if withTemplate:
+            keyList = TEMPLATE_TABLE_KEYS
+            templateInfoDic = self.templateDic.get(templateName, {})
+
+        for key in keyList:
+            if key == 'template_name':
+                if templateName != '':
+                    tableDic['template_name'] = templateName
+            elif key.startswith('index_'):
+                indexString = tableGroupDic.get(key, templateInfoDic.get(key))
+
+                if indexString is not None:
+                    tableDic[key] = self.getTableAxis(indexString)
+            elif key in tableGroupDic:
+                # 'sigma_type' is only for ocv lib.
+                tableDic[key] = tableGroupDic[key]
+
+        return tableDic
+
+    def _getTimingGroupInfo(self, groupDic, withTemplate=False):
+        """
+        Split pin timing information from the pin timing dict.
+        Return a dict.
+        {
+         'related_pin' : related_pin,
+         'related_pg_pin' : related_pg_pin,
+         'timing_sense' : timing_sense,
+         'timing_type' : timing_type,
+         'when' : when,
+         'table_type' : {
+                         table_type1 : {
+                                        'template_name' : template_name,
+                                        'sigma_type' : sigma_type,
+                                        'index_1' : [index1],
+                                        'index_2' : [index2],
+                                        'values' : [[values]],
+                                       }
+                         ...
+                        },
+        }
+        The table dicts are TEMPLATE_TABLE_KEYS (with the template indexes) if withTemplate is True.
+        """
+        timingDic = collections.OrderedDict()
+
+        if 'type' in groupDic:
+            groupType = groupDic['type']
+
+            if groupType == 'timing':
+                if 'related_pin' in groupDic:
+                    timingDic['related_pin'] = groupDic['related_pin']
+
+                if 'related_pg_pin' in groupDic:
+                    timingDic['related_pg_pin'] = groupDic['related_pg_pin']
+
+                if 'timing_sense' in groupDic:
+                    timingDic['timing_sense'] = groupDic['timing_sense']
+
+                if 'timing_type' in groupDic:
+                    timingDic['timing_type'] = groupDic['timing_type']
+
+                if 'when' in groupDic:
+                    timingDic['when'] = groupDic['when']
+
+                if 'group' in groupDic:
+                    timingDic['table_type'] = collections.OrderedDict()
+
+                    for timingLevelGroupDic in groupDic['group']:
+                        timingDic['table_type'][timingLevelGroupDic['type']] = self._getTableInfo(timingLevelGroupDic, TIMING_TABLE_KEYS, withTemplate)
+
+        return timingDic
+
+    def _getInternalPowerGroupInfo(self, groupDic, withTemplate=False):
+        """
+        Split pin internal_power information from the pin internal_power dict.
+        Return a dict.
+        {
+         'related_pin' : related_pin,
+         'related_pg_pin' : related_pg_pin,
+         'when' : when,
+         'table_type' : {
+                         table_type1 : {
+                                        'index_1' : [index1],
+                                        'index_2' : [index2],
+                                        'values' : [[values]],
+                                       }
+                         ...
+                        },
+        }
+        The table dicts are TEMPLATE_TABLE_KEYS (with the template indexes) if withTemplate is True.
+        """
+        internalPowerDic = collections.OrderedDict()
+
+        if 'type' in groupDic:
+            groupType = groupDic['type']
+
+            if groupType == 'internal_power':
+                if 'related_pin' in groupDic:
+                    internalPowerDic['related_pin'] = groupDic['related_pin']
+
+                if 'related_pg_pin' in groupDic:
+                    internalPowerDic['related_pg_pin'] = groupDic['related_pg_pin']
+
+                if 'when' in groupDic:
+                    internalPowerDic['when'] = groupDic['when']
+
+                if 'group' in groupDic:
+                    internalPowerDic['table_type'] = collections.OrderedDict()
+
+                    for internalPowerLevelGroupDic in groupDic['group']:
+                        internalPowerDic['table_type'][internalPowerLevelGroupDic['type']] = self._getTableInfo(internalPowerLevelGroupDic, INTERNAL_POWER_TABLE_KEYS, withTemplate)
+
+        return internalPowerDic
+
+    def _getPinInfo(self, groupDic, withTemplate=False):
+        """
+        Split cell pin timing/internal_power information from pin dict.
+        Return a dict.
+        {
+         'timing' : [timingDic1, timingDic2, ...],
+         'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
+        }
+        """
+        pinDic = collections.OrderedDict()
+
+        if 'type' in groupDic:
+            groupType = groupDic['type']
+
+            if groupType == 'pin':
+                if 'group' in groupDic:
+                    for pinGroupDic in groupDic['group']:
+                        pinGroupType = pinGroupDic['type']
+
+                        if pinGroupType == 'timing':
+                            timingDic = self._getTimingGroupInfo(pinGroupDic, withTemplate)
+                            pinDic.setdefault('timing', [])
+                            pinDic['timing'].append(timingDic)
+                        elif pinGroupType == 'internal_power':
+                            internalPowerDic = self._getInternalPowerGroupInfo(pinGroupDic, withTemplate)
+                            pinDic.setdefault('internal_power', [])
+                            pinDic['internal_power'].append(internalPowerDic)
+
+        return pinDic
+
+    def _getBundleInfo(self, groupDic, pinList=[], withTemplate=False):
+        """
+        Split bundle pin timing/internal_power information from the bundle dict.
+        Return a dict.
+        {
+         'pin' : {
+                  pinName1 : {
+                              'timing' : [timingDic1, timingDic2, ...],
+                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
+                             },
+                  pinName2 : {
+                              'timing' : [timingDic1, timingDic2, ...],
+                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
+                             },
+                  ...
+                 }
+        }
+        """
+        bundleDic = collections.OrderedDict()
+
+        if 'members' in groupDic:
+            pinListString = groupDic['members']
+            pinListString = re.sub(r'\(', '', pinListString)
+            pinListString = re.sub(r'\)', '', pinListString)
+            pinListString = re.sub(r'"', '', pinListString)
+            pinList = pinListString.split(',')
+
+            for pinName in pinList:
+                pinName = pinName.strip()
+                bundleDic.setdefault('pin', collections.OrderedDict())
+                bundleDic['pin'].setdefault(pinName, collections.OrderedDict())
+
+        if 'group' in groupDic:
+            for groupDic in groupDic['group']:
+                groupType = groupDic['type']
+
+                if groupType == 'pin':
+                    pinName = groupDic['name']
+
+                    if (len(pinList) > 0) and (pinName not in pinList):
+                        continue
+
+                    bundleDic.setdefault('pin', collections.OrderedDict())
+                    bundleDic['pin'].setdefault(pinName, collections.OrderedDict())
+                    pinDic = self._getPinInfo(groupDic, withTemplate)
+
+                    if pinDic:
+                        bundleDic['pin'][pinName] = pinDic
+                elif groupType == 'timing':
+                    timingDic = self._getTimingGroupInfo(groupDic, withTemplate)
+                    bundleDic.setdefault('timing', [])
+                    bundleDic['timing'].append(timingDic)
+                elif groupType == 'internal_power':
+                    internalPowerDic = self._getInternalPowerGroupInfo(groupDic, withTemplate)
+                    bundleDic.setdefault('internal_power', [])
+                    bundleDic['internal_power'].append(internalPowerDic)
+
+        return bundleDic
+
+    def _getBusInfo(self, groupDic, pinList=[], withTemplate=False):
+        """
+        Split bus pin timing/internal_power information from the bus dict.
+        Return a dict.
+        {
+         'pin' : {
+                  pinName1 : {
+                              'timing' : [timingDic1, timingDic2, ...],
+                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
+                             },
+                  pinName2 : {
+                              'timing' : [timingDic1, timingDic2, ...],
+                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
+                             },
+                  ...
+                 }
+        }
+        """
+        busDic = collections.OrderedDict()
+
+        if 'group' in groupDic:
+            for groupDic in groupDic['group']:
+                groupType = groupDic['type']
+
+                if groupType == 'pin':
+                    pinName = groupDic['name']
+
+                    if (len(pinList) > 0) and (pinName not in pinList):
+                        continue
+
+                    busDic.setdefault('pin', collections.OrderedDict())
+                    busDic['pin'].setdefault(pinName, collections.OrderedDict())
+                    pinDic = self._getPinInfo(groupDic, withTemplate)
+
+                    if pinDic:
+                        busDic['pin'][pinName] = pinDic
+                elif groupType == 'timing':
+                    timingDic = self._getTimingGroupInfo(groupDic, withTemplate)
+                    busDic.setdefault('timing', [])
+                    busDic['timing'].append(timingDic)
+                elif groupType == 'internal_power':
+                    internalPowerDic = self._getInternalPowerGroupInfo(groupDic, withTemplate)
+                    busDic.setdefault('internal_power', [])
+                    busDic['internal_power'].append(internalPowerDic)
+
+        return busDic
+
+    def getTemplateInfo(self):
+        """
+        Get all table templates (lu_table_template/power_lut_template ...) on library level.
+        Return a dict.
+        {
+         templateName1 : {
+                          'type' : type,
+                          'variable_1' : variable_1,
+                          'index_1' : index_1,
+                          ...
+                         },
+         ...
+        }
+        """
+        return self.templateDic
+
+    def getTableAxis(self, indexString):
+        """
+        Get the table axis of the index string.
+        On numpyTable mode, the index string is decoded once, the same index strings share one read-only numpy float array.
+        Otherwise the axis is the index string itself (nothing is decoded).
+        """
+        axis = self.axisDic.get(indexString)
+
+        if axis is None:
+            if self.numpyTable:
+                axis = decodeTableIndex(indexString)
+                axis.setflags(write=False)
+            else:
+                axis = indexString
+
+            self.axisDic[indexString] = axis
+
+        return axis
+
+    def query(self, queryString, withPath=False):
+        """
+        Get the groups (or attribute values for "@key" step) matched by the query string (see libertyQueryStep).
+        Return a list.
+        [result1, result2, ...]
+        If withPath is True, every result is (path, result), path is ((groupType1, groupName1), (groupType2, groupName2), ...).
+        """
+        return self.queryBatch([queryString], withPath)[0]
+
+    def queryBatch(self, queryStringList, withPath=False):
+        """
+        Get the results of several queries with one traversal, the same leading steps of the queries are matched once.
+        Return a list, the results of every query (see query).
+        [[query1Result1, query1Result2, ...], [query2Result1, ...], ...]
+        """
+        # Merge the queries into a step tree, {stepString: [step, subStepTreeDic, queryNumList], ...}.
+        stepTreeDic = collections.OrderedDict()
+
+        for (queryNum, queryString) in enumerate(queryStringList):
+            currentStepTreeDic = stepTreeDic
+            stepList = compileQuery(queryString)
+
+            for (i, step) in enumerate(stepList):
+                currentStepTreeDic.setdefault(step.stepString, [step, collections.OrderedDict(), []])
+
+                if i == len(stepList) - 1:
+                    currentStepTreeDic[step.stepString][2].append(queryNum)
+                else:
+                    currentStepTreeDic = currentStepTreeDic[step.stepString][1]
+
+        resultList = [[] for queryString in queryStringList]
+        self._queryStepTree(self.libDic, stepTreeDic, (), resultList, withPath)
+
+        return resultList
+
+    def _getQueryCandidateList(self, groupDic, step):
+        """
+        Get the sub-groups which may match the step, use the cell/pin name indexes (names without quotes) if possible,
+        all of the sub-groups are checked if the name is missing on the indexes.
+        """
+        if step.name is not None:
+            if (groupDic is self.libDic) and (step.groupType == 'cell'):
+                if step.name in self.queryCellDic:
+                    return self.queryCellDic[step.name]
+
+                return groupDic.get('group', [])
+            elif (step.groupType == 'pin') and (groupDic['type'] == 'cell') and (self.getCellGroup(groupDic['name']) is groupDic):
+                queryPinDic = self._getCellPinIndex(groupDic['name'])['queryPin']
+
+                if step.name in queryPinDic:
+                    return queryPinDic[step.name]
+
+                return groupDic.get('group', [])
+
+        if (groupDic is self.libDic) and (step.groupType == 'cell'):
+            return self.cellIndexDic.values()
+
+        return groupDic.get('group', [])
+
+    def _queryStepTree(self, groupDic, stepTreeDic, path, resultList, withPath):
+        for (step, subStepTreeDic, queryNumList) in stepTreeDic.values():
+            if step.attribute:
+                if step.attribute in groupDic:
+                    for queryNum in queryNumList:
+                        resultList[queryNum].append((path, groupDic[step.attribute]) if withPath else groupDic[step.attribute])
+
+                continue
+
+            for subGroupDic in self._getQueryCandidateList(groupDic, step):
+                if step.match(subGroupDic):
+                    subPath = path + ((subGroupDic['type'], subGroupDic['name']),) if withPath else path
+
+                    for queryNum in queryNumList:
+                        resultList[queryNum].append((subPath, subGroupDic) if withPath else subGroupDic)
+
+                    if subStepTreeDic:
+                        self._queryStepTree(subGroupDic, subStepTreeDic, subPath, resultList, withPath)
+
+    def getArcTableList(self, cellList=[], pinList=[], tableTypeList=['cell_rise', 'cell_fall', 'rise_transition', 'fall_transition', 'rise_power', 'fall_power']):
+        """
+        Collect the timing/internal_power tables of specified cells/pins (include bus/bundle pins) and table types (all
+        table types if tableTypeList is empty).
+        Return (arcList, tableList), arcList is the table information (see getTableLookup), tableList is the table dicts.
+        """
+        libPinDic = self.getLibPinInfo(cellList=cellList, pinList=pinList, withTemplate=True)
+        arcList = []
+        tableList = []
+
+        for (cellName, cellDic) in libPinDic.get('cell', {}).items():
+            pinDicList = [(collections.OrderedDict(), cellDic.get('pin', {}))]
+
+            for busType in ('bundle', 'bus'):
+                for (busName, busDic) in cellDic.get(busType, {}).items():
+                    pinDicList.append((collections.OrderedDict([(busType, busName)]), busDic.get('pin', {})))
+
+            for (busInfoDic, pinDic) in pinDicList:
+                for (pinName, pinInfoDic) in pinDic.items():
+                    for groupType in ('timing', 'internal_power'):
+                        for groupDic in pinInfoDic.get(groupType, []):
+                            for (tableType, tableDic) in groupDic.get('table_type', {}).items():
+                                if ((len(tableTypeList) == 0) or (tableType in tableTypeList)) and ('values' in tableDic):
+                                    arcDic = collections.OrderedDict([('cell', cellName)])
+                                    arcDic.update(busInfoDic)
+                                    arcDic['pin'] = pinName
+                                    arcDic['group'] = groupType
+
+                                    for (key, value) in groupDic.items():
+                                        if key != 'table_type':
+                                            arcDic[key] = value
+
+                                    arcDic['table_type'] = tableType
+                                    arcList.append(arcDic)
+                                    tableList.append(tableDic)
+
+        return (arcList, tableList)
+
+    def getTableLookup(self, cellList=[], pinList=[], tableTypeList=['cell_rise', 'cell_fall', 'rise_transition', 'fall_transition', 'rise_power', 'fall_power']):
+        """
+        Collect the timing/internal_power tables of specified cells/pins (include bus/bundle pins).
+        Return a tableLookup object, tableLookup.lookup(transition, load) gets all of the table values on all of
+        the (transition, load) points at once, tableLookup.arcList is the table information.
+        [
+         {
+          'cell' : cellName,
+          'pin' : pinName,
+          'group' : 'timing' or 'internal_power',
+          'related_pin' : related_pin,
+          ...
+          'table_type' : table_type,
+         },
+         ...
+        ]
+        """
+        if numpy is None:
+            raise libertyParserError('numpy is required for table lookup, please install numpy first.')
+
+        (arcList, tableList) = self.getArcTableList(cellList, pinList, tableTypeList)
+
+        return tableLookup(arcList, tableList, self.templateDic)
+
+    def getArcColumns(self, cellList=[], tableTypeList=[]):
+        """
+        Walk the timing/internal_power tables of specified cells (all tables if tableTypeList is empty) once, include
+        the bus/bundle (and their pins) tables, save them as columnar numpy arrays (one row for every table).
+        Return a dict.
+        {
+         column : int32 codes, column + '_dict' : string dictionary of the codes (for every column on ARC_COLUMNS),
+         'arc' : int32 timing/internal_power group num (the tables of the same arc have the same num),
+         'index_1'/'index_2'/'index_3' : int32 axis num (-1 for no index), the indexes are inherited from the templates,
+         'axis_offsets' : int64 array, axis i is axis_data[axis_offsets[i]:axis_offsets[i+1]],
+         'axis_data' : float64 array,
+         'values_offsets' : int64 array, values of table i is values_data[values_offsets[i]:values_offsets[i+1]],
+         'values_data' : float64 array,
+        }
+        """
+        if numpy is None:
+            raise libertyParserError('numpy is required for arc columns, please install numpy first.')
+
+        tableTypeSet = set(tableTypeList)
+        columnCodeDic = {column: {} for column in ARC_COLUMNS}
+        columnListDic = {column: [] for column in ARC_COLUMNS}
+        arcNumList = []
+        arcNum = -1
+        axisNumDic = {}
+        axisStringList = []
+        indexListDic = {'index_1': [], 'index_2': [], 'index_3': []}
+        valuesStringList = []
+        valuesLengthList = []
+
+        for (cellName, cellGroupDic) in self._getCellGroupList(cellList):
+            # (busName, pinName, pinGroupDic), bus/bundle level tables are saved with empty pin name.
+            pinGroupList = []
+
+            for cellSubGroupDic in cellGroupDic.get('group', []):
+                cellSubGroupType = cellSubGroupDic['type']
+
+                if cellSubGroupType == 'pin':
+                    pinGroupList.append(('', cellSubGroupDic['name'], cellSubGroupDic))
+                elif (cellSubGroupType == 'bundle') or (cellSubGroupType == 'bus'):
+                    busName = cellSubGroupDic['name']
+                    pinGroupList.append((busName, '', cellSubGroupDic))
+
+                    for busSubGroupDic in cellSubGroupDic.get('group', []):
+                        if busSubGroupDic['type'] == 'pin':
+                            pinGroupList.append((busName, busSubGroupDic['name'], busSubGroupDic))
+
+            for (busName, pinName, pinGroupDic) in pinGroupList:
+                for arcGroupDic in pinGroupDic.get('group', []):
+                    arcGroupType = arcGroupDic['type']
+
+                    if (arcGroupType != 'timing') and (arcGroupType != 'internal_power'):
+                        continue
+
+                    arcNum += 1
+
+                    for tableGroupDic in arcGroupDic.get('group', []):
+                        tableType = tableGroupDic['type']
+
+                        if (tableTypeSet and (tableType not in tableTypeSet)) or ('values' not in tableGroupDic):
+                            continue
+
+                        templateName = tableGroupDic['name']
+                        rowValueDic = {
+                                       'cell': cellName,
+                                       'bus': busName,
+                                       'pin': pinName,
+                                       'group': arcGroupType,
+                                       'table_type': tableType,
+                                       'template_name': templateName,
+                                       'sigma_type': tableGroupDic.get('sigma_type', ''),
+                                      }
+
+                        for column in ARC_COLUMNS:
+                            value = rowValueDic[column] if column in rowValueDic else arcGroupDic.get(column, '')
+                            codeDic = columnCodeDic[column]
+                            code = codeDic.get(value)
+
+                            if code is None:
+                                code = len(codeDic)
+                                codeDic[value] = code
+
+                            columnListDic[column].append(code)
+
+                        arcNumList.append(arcNum)
+                        templateInfoDic = self.templateDic.get(templateName, {})
+
+                        for (indexKey, indexList) in indexListDic.items():
+                            indexString = tableGroupDic.get(indexKey, templateInfoDic.get(indexKey))
+
+                            if indexString is None:
+                                indexList.append(-1)
+                            else:
+                                if indexString not in axisNumDic:
+                                    axisNumDic[indexString] = len(axisStringList)
+                                    axisStringList.append(','.join(tableStringCompile.findall(indexString)) or indexString.replace('(', '').replace(')', ''))
+
+                                indexList.append(axisNumDic[indexString])
+
+                        valuesString = tableGroupDic['values']
+                        valuesString = ','.join(tableStringCompile.findall(valuesString)) or valuesString.replace('(', '').replace(')', '')
+                        valuesStringList.append(valuesString)
+                        valuesLengthList.append(valuesString.count(',') + 1)
+
+        # All of the axes/values strings are converted to float on one call.
+        columnDic = collections.OrderedDict()
+
+        for column in ARC_COLUMNS:
+            columnDic[column] = numpy.array(columnListDic[column], dtype=numpy.int32)
+            columnDic[column + '_dict'] = numpy.array(list(columnCodeDic[column]), dtype=str)
+
+        columnDic['arc'] = numpy.array(arcNumList, dtype=numpy.int32)
+
+        for (indexKey, indexList) in indexListDic.items():
+            columnDic[indexKey] = numpy.array(indexList, dtype=numpy.int32)
+
+        columnDic['axis_offsets'] = numpy.zeros(len(axisStringList) + 1, dtype=numpy.int64)
+        columnDic['axis_offsets'][1:] = numpy.cumsum([axisString.count(',') + 1 for axisString in axisStringList])
+        columnDic['axis_data'] = numpy.array(','.join(axisStringList).split(',') if axisStringList else [], dtype=numpy.float64)
+        columnDic['values_offsets'] = numpy.zeros(len(valuesLengthList) + 1, dtype=numpy.int64)
+        columnDic['values_offsets'][1:] = numpy.cumsum(valuesLengthList)
+        columnDic['values_data'] = numpy.array(','.join(valuesStringList).split(',') if valuesStringList else [], dtype=numpy.float64)
+
+        return columnDic
+
+    def exportArcColumns(self, outputFile, cellList=[], tableTypeList=[]):
+        """
+        Save the arc columns (see getArcColumns) into a ".npz" file or a ".npy" directory (see saveArcColumns), they
+        can be loaded with loadArcColumns without the liberty parser.
+        """
+        self.debugPrint('>>> Exporting arc columns into "' + str(outputFile) + '" ...')
+        saveArcColumns(self.getArcColumns(cellList, tableTypeList), outputFile)
+        self.debugPrint('    Done')
+
+    def getLibPinInfo(self, cellList=[], bundleList=[], busList=[], pinList=[], withTemplate=False):
+        """
+        Get all pins (and timing&intern_power info).
+        If withTemplate is True, every table gets template_name/index_1/index_2/index_3 (the missing indexes are
+        inherited from the table template), see _getTableInfo.
+        pin strncture is as below:
+        cell -- pin
+             |
+             -- bundle -- pin
+             |
+             -- bus    -- pin
+        Return a dict.
+        {
+         cellName1 : {
+                      'pin' : [pinDic1, pinDic2, ...],
+                      'bundle' : {
+                                  'pin' : [pinDic1, pinDic2, ...]
+                                 }
+                      'bus' : {
+                               'pin' : [pinDic1, pinDic2, ...]
+                              }
+                     },
+         ...
+        }
+        """
+        libPinDic = collections.OrderedDict()
+        bundleSet = set(bundleList)
+        busSet = set(busList)
+        pinSet = set(pinList)
+
+        for (cellName, libGroupDic) in self._getCellGroupList(cellList):
+            if 'group' in libGroupDic:
+                for cellGroupDic in libGroupDic['group']:
+                    cellGroupType = cellGroupDic['type']
+
+                    if cellGroupType == 'pin':
+                        pinName = cellGroupDic['name']
+
+                        if (len(pinSet) > 0) and (pinName not in pinSet):
+                            continue
+
+                        libPinDic.setdefault('cell', collections.OrderedDict())
+                        libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
+                        libPinDic['cell'][cellName].setdefault('pin', collections.OrderedDict())
+                        libPinDic['cell'][cellName]['pin'].setdefault(pinName, collections.OrderedDict())
+                        pinDic = self._getPinInfo(cellGroupDic, withTemplate)
+
+                        if pinDic:
+                            libPinDic['cell'][cellName]['pin'][pinName] = pinDic
+                    elif cellGroupType == 'bundle':
+                        bundleName = cellGroupDic['name']
+
+                        if (len(bundleSet) > 0) and (bundleName not in bundleSet):
+                            continue
+
+                        bundleDic = self._getBundleInfo(cellGroupDic, pinSet, withTemplate)
+
+                        if bundleDic:
+                            libPinDic.setdefault('cell', collections.OrderedDict())
+                            libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
+                            libPinDic['cell'][cellName].setdefault('bundle', collections.OrderedDict())
+                            libPinDic['cell'][cellName]['bundle'].setdefault(bundleName, collections.OrderedDict())
+                            libPinDic['cell'][cellName]['bundle'][bundleName] = bundleDic
+                    elif cellGroupType == 'bus':
+                        busName = cellGroupDic['name']
+
+                        if (len(busSet) > 0) and (busName not in busSet):
+                            continue
+
+                        busDic = self._getBusInfo(cellGroupDic, pinSet, withTemplate)
+
+                        if busDic:
+                            libPinDic.setdefault('cell', collections.OrderedDict())
+                            libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
+                            libPinDic['cell'][cellName].setdefault('bus', collections.OrderedDict())
+                            libPinDic['cell'][cellName]['bus'].setdefault(busName, collections.OrderedDict())
+                            libPinDic['cell'][cellName]['bus'][busName] = busDic
+
+        return libPinDic
+# Application functions (end) #
+
+
+# Liberty set (start) #
+def loadLibertyCorner(libFile, parserOptionDic={}):
+    """
+    Parse liberty file and get the corner data of libertySet, it is the worker function of libertySet.
+    Only the corner data (not the whole libertyParser object) are sent back from the worker process.
+    Return a dict.
+    {
+     'cell' : {cellName: {attribute: value, ...}, ...},
+     'arc' : (arcList, tableList),
+     'template' : templateDic,
+    }
+    'cell' saves the simple attributes of every cell group (the first one for duplicate cell names), 'arc' is
+    libertyParser.getArcTableList of all cells, pins and table types, 'template' is libertyParser.templateDic.
+    """
+    parser = libertyParser(libFile, **parserOptionDic)
+    cellDic = collections.OrderedDict()
+
+    for (cellName, cellGroupDic) in parser._getCellGroupList():
+        if cellName not in cellDic:
+            cellDic[cellName] = collections.OrderedDict([(key, value) for (key, value) in cellGroupDic.items() if key not in ('type', 'name', 'group', 'depth', 'fatherGroupNum')])
+
+    return {'cell': cellDic, 'arc': parser.getArcTableList(tableTypeList=[]), 'template': parser.templateDic}
+
+
+def getFloat(value):
+    """
+    Convert liberty attribute value into float, return nan if it is missing or not a number.
+    """
+    try:
+        return float(str(value).strip().strip('"'))
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class libertySet():
+    """
+    Load liberty files of multi-corners (same cells) concurrently, and get the cross-corner data as aligned lists/arrays.
+    Every corner is parsed on a worker process, only the corner data (cell attributes, arc tables and table templates,
+    see loadLibertyCorner) are sent back. The shared cell list and arc list are built once from all corners, so all
+    of the corner values are aligned on self.cornerList.
+    self.cellList : shared cell list (liberty order of the first corner, then the cells only on other corners).
+    self.arcList : shared arc list (the same as libertyParser.getArcTableList, first corner arcs, then the arcs only
+                   on other corners).
+    self.cornerTableList : [[corner1TableDic, corner2TableDic, ...], ...] for self.arcList (None if the arc is missing
+                           on the corner).
+    self.templateDicList : [corner1TemplateDic, corner2TemplateDic, ...] (see libertyParser.templateDic).
+    """
+    def __init__(self, libFileList, cornerList=[], jobs=0, **parserOptionDic):
+        if len(cornerList) == 0:
+            cornerList = [os.path.basename(libFile) for libFile in libFileList]
+
+        if len(cornerList) != len(libFileList):
+            raise libertyParserError('the corner number (' + str(len(cornerList)) + ') is different from the liberty file number (' + str(len(libFileList)) + ').')
+
+        self.libFileList = list(libFileList)
+        self.cornerList = list(cornerList)
+        cornerDicList = self.loadLibFiles(jobs, parserOptionDic)
+        self.cellDicList = [cornerDic['cell'] for cornerDic in cornerDicList]
+        self.templateDicList = [cornerDic['template'] for cornerDic in cornerDicList]
+
+        # Shared cell list.
+        self.cellList = []
+        cellSet = set()
+
+        for cellDic in self.cellDicList:
+            for cellName in cellDic.keys():
+                if cellName not in cellSet:
+                    self.cellList.append(cellName)
+                    cellSet.add(cellName)
+
+        # Shared arc list.
+        self.arcList = []
+        self.cornerTableList = []
+        arcNumDic = {}
+
+        for (cornerNum, cornerDic) in enumerate(cornerDicList):
+            (cornerArcList, cornerTableList) = cornerDic['arc']
+            arcKeyCountDic = {}
+
+            for (arcDic, tableDic) in zip(cornerArcList, cornerTableList):
+                # The same arcs (same arc information) on a corner are told apart with the order.
+                arcKey = tuple((key, str(value)) for (key, value) in arcDic.items())
+                arcKeyCountDic[arcKey] = arcKeyCountDic.get(arcKey, 0) + 1
+                arcKey = (arcKey, arcKeyCountDic[arcKey])
+
+                if arcKey not in arcNumDic:
+                    arcNumDic[arcKey] = len(self.arcList)
+                    self.arcList.append(arcDic)
+                    self.cornerTableList.append([None]*len(cornerDicList))
+
+                self.cornerTableList[arcNumDic[arcKey]][cornerNum] = tableDic
+
+    def loadLibFiles(self, jobs, parserOptionDic):
+        """
+        Parse all of the liberty files on a process pool with "jobs" workers (one worker for every liberty file by default).
+        If parserOptionDic cannot be sent to the worker processes (such as cancelEvent and lambda phaseCallback), the
+        liberty files are parsed on the current process.
+        Return the corner data list (see loadLibertyCorner).
+        """
+        if jobs <= 0:
+            jobs = min(len(self.libFileList), os.cpu_count() or 1)
+
+        for libFile in self.libFileList:
+            if not os.path.exists(libFile):
+                raise libertyParserError('liberty file "' + str(libFile) + '": No such file!')
+
+        if (jobs > 1) and (len(self.libFileList) > 1):
+            try:
+                pickle.dumps(parserOptionDic)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                jobs = 1
+
+        if (jobs <= 1) or (len(self.libFileList) <= 1):
+            return [loadLibertyCorner(libFile, parserOptionDic) for libFile in self.libFileList]
+
+        cornerDicList = []
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futureList = [executor.submit(loadLibertyCorner, libFile, parserOptionDic) for libFile in self.libFileList]
+
+            for (libFile, future) in zip(self.libFileList, futureList):
+                try:
+                    cornerDicList.append(future.result())
+                except libertyParserError as error:
+                    raise libertyParserError('failed on parsing liberty file "' + str(libFile) + '": ' + str(error))
+
+        return cornerDicList
+
+    def getCellAttribute(self, attribute, cellList=[]):
+        """
+        Get the float value of a cell attribute (such as "area") on all corners, missing values are nan.
+        Return a dict.
+        {
+         cellName1 : [corner1Value, corner2Value, ...],
+         ...
         }
         """
-        internalPowerDic = collections.OrderedDict()
+        if len(cellList) == 0:
+            cellList = self.cellList
+
+        cellAttributeDic = collections.OrderedDict()
+
+        for cellName in cellList:
+            cellAttributeDic[cellName] = []
+
+            for cellDic in self.cellDicList:
+                cellAttributeDic[cellName].append(getFloat(cellDic.get(cellName, {}).get(attribute)))
+
+        return cellAttributeDic
+
+    def getCellArea(self, cellList=[]):
+        """
+        Get cell area on all corners, return {cellName: [corner1Area, corner2Area, ...], ...}.
+        """
+        return self.getCellAttribute('area', cellList)
+
+    def getCellLeakagePowerValue(self, cellList=[]):
+        """
+        Get the float cell_leakage_power attribute (not the leakage_power groups of libertyParser.getCellLeakagePower)
+        on all corners, return {cellName: [corner1Leakage, corner2Leakage, ...], ...}.
+        """
+        return self.getCellAttribute('cell_leakage_power', cellList)
+
+    def getArcTableList(self, cellList=[], pinList=[], tableTypeList=['cell_rise', 'cell_fall', 'rise_transition', 'fall_transition', 'rise_power', 'fall_power']):
+        """
+        Get the shared arcs of specified cells/pins/table types (all of them if the list is empty) and the aligned tables
+        of all corners.
+        Return (arcList, cornerTableList), arcList is a part of self.arcList, cornerTableList[i] is [corner1TableDic,
+        corner2TableDic, ...] for arcList[i] (None if the arc is missing on the corner).
+        """
+        cellSet = set(cellList)
+        pinSet = set(pinList)
+        tableTypeSet = set(tableTypeList)
+        arcList = []
+        cornerTableList = []
+
+        for (arcDic, tableDicList) in zip(self.arcList, self.cornerTableList):
+            if cellSet and (arcDic['cell'] not in cellSet):
+                continue
+
+            if pinSet and (arcDic['pin'] not in pinSet):
+                continue
+
+            if tableTypeSet and (arcDic['table_type'] not in tableTypeSet):
+                continue
+
+            arcList.append(arcDic)
+            cornerTableList.append(tableDicList)
+
+        return (arcList, cornerTableList)
+
+    def getTableValues(self, tableType, cellList=[], pinList=[]):
+        """
+        Get the table values of all corners for every arc with the table type (such as "cell_rise"), numpy is required.
+        Return (arcList, valuesList), valuesList[i] is a numpy array (corner number * table shape) for arcList[i],
+        the missing corner tables are nan.
+        """
+        if numpy is None:
+            raise libertyParserError('numpy is required for table values, please install numpy first.')
+
+        (arcList, cornerTableList) = self.getArcTableList(cellList, pinList, [tableType])
+        valuesList = []
+
+        for (arcDic, tableDicList) in zip(arcList, cornerTableList):
+            cornerValuesList = []
+
+            for tableDic in tableDicList:
+                if tableDic is None:
+                    cornerValuesList.append(None)
+                else:
+                    values = tableDic['values']
+
+                    # The tables are decoded already on numpyTable mode.
+                    if isinstance(values, str):
+                        indexLengthList = [len(decodeTableIndex(tableDic[indexKey])) for indexKey in ('index_1', 'index_2', 'index_3') if indexKey in tableDic]
+                        values = decodeTableValues(values, indexLengthList)
+
+                    cornerValuesList.append(numpy.asarray(values, dtype=float))
+
+            tableShape = [values.shape for values in cornerValuesList if values is not None][0]
+            valuesArray = numpy.full([len(cornerValuesList)] + list(tableShape), numpy.nan)
+
+            for (cornerNum, values) in enumerate(cornerValuesList):
+                if values is not None:
+                    if values.shape == tableShape:
+                        valuesArray[cornerNum] = values
+                    else:
+                        print('*Warning*: table shape ' + str(values.shape) + ' on corner "' + str(self.cornerList[cornerNum]) + '" is different from ' + str(tableShape) + ', ignore it (cell "' + str(arcDic['cell']) + '", pin "' + str(arcDic['pin']) + '", ' + str(tableType) + ').')
+
+            valuesList.append(valuesArray)
+
+        return (arcList, valuesList)
+
+    def getWorstTable(self, tableType, cellList=[], pinList=[], worst='max'):
+        """
+        Get the worst (element-wise max or min of all corners) table values for every arc with the table type, numpy is required.
+        Return (arcList, worstValuesList, worstCornerList), worstValuesList[i] is a numpy array (table shape) for arcList[i],
+        worstCornerList[i] is the corner number of the worst value on every table point (numpy int array, table shape).
+        """
+        (arcList, valuesList) = self.getTableValues(tableType, cellList, pinList)
+        worstValuesList = []
+        worstCornerList = []
+
+        for valuesArray in valuesList:
+            # Missing corners (nan) are never the worst one.
+            if worst == 'min':
+                worstCornerArray = numpy.argmin(numpy.where(numpy.isnan(valuesArray), numpy.inf, valuesArray), axis=0)
+            else:
+                worstCornerArray = numpy.argmax(numpy.where(numpy.isnan(valuesArray), -numpy.inf, valuesArray), axis=0)
+
+            worstValuesList.append(numpy.take_along_axis(valuesArray, worstCornerArray[numpy.newaxis], axis=0)[0])
+            worstCornerList.append(worstCornerArray)
+
+        return (arcList, worstValuesList, worstCornerList)
+# Liberty set (end) #
+
+
+# Liberty diff (start) #
+# Whitespaces, quotes and continuation characters are ignored on the normalized attribute values.
+diffIgnoreCompile = re.compile(r'[\s"\\]+')
+
+# Structure keys of the group dicts, they are not compared as attributes.
+DIFF_SKIP_KEYS = ('fatherGroupNum', 'depth', 'type', 'name', 'group')
+
+# The sub-groups with the same type and name (such as timing/internal_power) are matched with these attributes.
+DIFF_MATCH_KEYS = ('related_pin', 'related_pg_pin', 'timing_type', 'timing_sense', 'when')
+
+
+def normalizeValue(value):
+    """
+    Normalize attribute value (string, or list for the repeated complex attributes) for comparing.
+    """
+    if isinstance(value, list):
+        return tuple([diffIgnoreCompile.sub('', str(item)) for item in value])
+    else:
+        return diffIgnoreCompile.sub('', str(value))
+
+
+def getNumberList(normalizedValue):
+    """
+    Get float list of the normalized attribute value (such as '(0.1,0.2,0.3)'), return None if it is not numeric.
+    """
+    if isinstance(normalizedValue, tuple):
+        return None
+
+    try:
+        return [float(item) for item in normalizedValue.replace('(', '').replace(')', '').split(',')]
+    except ValueError:
+        return None
+
+
+class libertyDiff():
+    """
+    Compare two liberty files (or libertyParser objects), get the structured delta of the library head part and cells.
+    The cells with the same byte hash on the cell index are skipped directly (they are not parsed on lazy mode, which
+    is the default except for bz2/xz compressed liberty files), other groups are compared with the normalized group hashes (whitespaces, quotes, attribute order
+    and sub-group order are ignored), then attribute by attribute, the numeric attributes (such as the tables) are
+    compared with tolerance (abs(value1 - value2) <= max(tolerance, relTolerance*max(abs(value1), abs(value2)))).
+    """
+    def __init__(self, libFile1, libFile2, tolerance=0.0, relTolerance=0.0, **parserOptionDic):
+        self.parser1 = self.getParser(libFile1, parserOptionDic)
+        self.parser2 = self.getParser(libFile2, parserOptionDic)
+        self.tolerance = tolerance
+        self.relTolerance = relTolerance
+
+        # {id(groupDic): normalized group hash}, the groups are kept by the parsers.
+        self.groupHashDic = {}
+
+    def getParser(self, libFile, parserOptionDic):
+        """
+        Get the libertyParser object of libFile, lazy mode is used by default, except for bz2/xz compressed liberty
+        files (they cannot be read randomly, see gzipLibReader), which are parsed on normal mode.
+        """
+        if isinstance(libFile, libertyParser):
+            return libFile
 
-        if 'type' in groupDic:
-            groupType = groupDic['type']
+        parserOptionDic = dict(parserOptionDic)
 
-            if groupType == 'internal_power':
-                if 'related_pin' in groupDic:
-                    internalPowerDic['related_pin'] = groupDic['related_pin']
+        if 'lazy' not in parserOptionDic:
+            parserOptionDic['lazy'] = (not os.path.exists(libFile)) or (getCompressionModule(libFile) in (None, gzip))
 
-                if 'related_pg_pin' in groupDic:
-                    internalPowerDic['related_pg_pin'] = groupDic['related_pg_pin']
+        return libertyParser(libFile, **parserOptionDic)
 
-                if 'when' in groupDic:
-                    internalPowerDic['when'] = groupDic['when']
+    def getCellHashDic(self, parser):
+        """
+        Get {cellName: cell byte hash} from the cell index of parser (empty if the cell index is not kept).
+        """
+        cellHashDic = {}
 
-                if 'group' in groupDic:
-                    internalPowerDic['table_type'] = collections.OrderedDict()
+        if parser.libIndexDic and ('hash' in parser.libIndexDic):
+            for (cellInfoList, cellHash) in zip(parser.libIndexDic['cell'], parser.libIndexDic['hash']):
+                cellHashDic[cellInfoList[0]] = cellHash
 
-                    for internalPowerLevelGroupDic in groupDic['group']:
-                        internalPowerLevelGroupType = internalPowerLevelGroupDic['type']
-                        internalPowerDic['table_type'][internalPowerLevelGroupType] = collections.OrderedDict()
+        return cellHashDic
 
-                        if 'index_1' in internalPowerLevelGroupDic:
-                            internalPowerDic['table_type'][internalPowerLevelGroupType]['index_1'] = internalPowerLevelGroupDic['index_1']
+    def hashGroup(self, groupDic):
+        """
+        Get the normalized hash of the group (and all of its sub-groups).
+        """
+        groupId = id(groupDic)
 
-                        if 'index_2' in internalPowerLevelGroupDic:
-                            internalPowerDic['table_type'][internalPowerLevelGroupType]['index_2'] = internalPowerLevelGroupDic['index_2']
+        if groupId not in self.groupHashDic:
+            groupHash = hashlib.sha1()
+            groupHash.update(repr((groupDic['type'], normalizeValue(groupDic['name']))).encode())
 
-                        if 'values' in internalPowerLevelGroupDic:
-                            internalPowerDic['table_type'][internalPowerLevelGroupType]['values'] = internalPowerLevelGroupDic['values']
+            for key in sorted([key for key in groupDic.keys() if key not in DIFF_SKIP_KEYS]):
+                groupHash.update(repr((key, normalizeValue(groupDic[key]))).encode())
 
-        return internalPowerDic
+            for subGroupHash in sorted([self.hashGroup(subGroupDic) for subGroupDic in groupDic.get('group', [])]):
+                groupHash.update(subGroupHash)
 
-    def _getPinInfo(self, groupDic):
+            self.groupHashDic[groupId] = groupHash.digest()
+
+        return self.groupHashDic[groupId]
+
+    def getGroupLabelDic(self, groupDic, skipType=''):
         """
-        Split cell pin timing/internal_power information from pin dict.
-        Return a dict.
-        {
-         'timing' : [timingDic1, timingDic2, ...],
-         'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
-        }
+        Get the sub-groups of groupDic as {label: subGroupDic, ...}, label is "type(name)", with the DIFF_MATCH_KEYS
+        attributes as "[key=value,...]" and "#num" for the repeated ones, such as "timing()[related_pin=A]".
         """
-        pinDic = collections.OrderedDict()
+        groupLabelDic = collections.OrderedDict()
 
-        if 'type' in groupDic:
-            groupType = groupDic['type']
+        for subGroupDic in groupDic.get('group', []):
+            subGroupType = subGroupDic['type']
 
-            if groupType == 'pin':
-                if 'group' in groupDic:
-                    for pinGroupDic in groupDic['group']:
-                        pinGroupType = pinGroupDic['type']
+            if subGroupType == skipType:
+                continue
 
-                        if pinGroupType == 'timing':
-                            timingDic = self._getTimingGroupInfo(pinGroupDic)
-                            pinDic.setdefault('timing', [])
-                            pinDic['timing'].append(timingDic)
-                        elif pinGroupType == 'internal_power':
-                            internalPowerDic = self._getInternalPowerGroupInfo(pinGroupDic)
-                            pinDic.setdefault('internal_power', [])
-                            pinDic['internal_power'].append(internalPowerDic)
+            label = str(subGroupType) + '(' + normalizeValue(subGroupDic['name']) + ')'
+            matchList = [str(key) + '=' + str(normalizeValue(subGroupDic[key])) for key in DIFF_MATCH_KEYS if key in subGroupDic]
 
-        return pinDic
+            if matchList:
+                label = label + '[' + ','.join(matchList) + ']'
+
+            if label in groupLabelDic:
+                labelNum = 2
+
+                while (label + '#' + str(labelNum)) in groupLabelDic:
+                    labelNum += 1
 
-    def _getBundleInfo(self, groupDic, pinList=[]):
+                label = label + '#' + str(labelNum)
+
+            groupLabelDic[label] = subGroupDic
+
+        return groupLabelDic
+
+    def isSameValue(self, value1, value2):
         """
-        Split bundle pin timing/internal_power information from the bundle dict.
-        Return a dict.
+        Compare two attribute values, numeric values are compared with tolerance.
+        """
+        normalizedValue1 = normalizeValue(value1)
+        normalizedValue2 = normalizeValue(value2)
+
+        if normalizedValue1 == normalizedValue2:
+            return True
+
+        if (self.tolerance == 0) and (self.relTolerance == 0):
+            return False
+
+        numberList1 = getNumberList(normalizedValue1)
+        numberList2 = getNumberList(normalizedValue2)
+
+        if (numberList1 is None) or (numberList2 is None) or (len(numberList1) != len(numberList2)):
+            return False
+
+        for (number1, number2) in zip(numberList1, numberList2):
+            if abs(number1 - number2) > max(self.tolerance, self.relTolerance*max(abs(number1), abs(number2))):
+                return False
+
+        return True
+
+    def diffGroup(self, groupDic1, groupDic2, skipType=''):
+        """
+        Compare two groups, return None if they are the same, otherwise return a dict (only the not-empty items).
         {
-         'pin' : {
-                  pinName1 : {
-                              'timing' : [timingDic1, timingDic2, ...],
-                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
-                             },
-                  pinName2 : {
-                              'timing' : [timingDic1, timingDic2, ...],
-                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
-                             },
-                  ...
-                 }
+         'attribute' : {
+                        'added' : {key: value2, ...},
+                        'removed' : {key: value1, ...},
+                        'changed' : {key: (value1, value2), ...},
+                       },
+         'group' : {
+                    'added' : [label, ...],
+                    'removed' : [label, ...],
+                    'changed' : {label: sub-group delta dict, ...},
+                   },
         }
+        The sub-groups with type skipType are not compared (the group hash is not used either).
         """
-        bundleDic = collections.OrderedDict()
+        if (not skipType) and (self.hashGroup(groupDic1) == self.hashGroup(groupDic2)):
+            return None
 
-        if 'members' in groupDic:
-            pinListString = groupDic['members']
-            pinListString = re.sub(r'\(', '', pinListString)
-            pinListString = re.sub(r'\)', '', pinListString)
-            pinListString = re.sub(r'"', '', pinListString)
-            pinList = pinListString.split(',')
+        attributeDeltaDic = collections.OrderedDict([('added', collections.OrderedDict()), ('removed', collections.OrderedDict()), ('changed', collections.OrderedDict())])
 
-            for pinName in pinList:
-                pinName = pinName.strip()
-                bundleDic.setdefault('pin', collections.OrderedDict())
-                bundleDic['pin'].setdefault(pinName, collections.OrderedDict())
+        for (key, value1) in groupDic1.items():
+            if key in DIFF_SKIP_KEYS:
+                continue
 
-        if 'group' in groupDic:
-            for groupDic in groupDic['group']:
-                groupType = groupDic['type']
+            if key not in groupDic2:
+                attributeDeltaDic['removed'][key] = value1
+            elif not self.isSameValue(value1, groupDic2[key]):
+                attributeDeltaDic['changed'][key] = (value1, groupDic2[key])
 
-                if groupType == 'pin':
-                    pinName = groupDic['name']
+        for (key, value2) in groupDic2.items():
+            if (key not in DIFF_SKIP_KEYS) and (key not in groupDic1):
+                attributeDeltaDic['added'][key] = value2
 
-                    if (len(pinList) > 0) and (pinName not in pinList):
-                        continue
+        groupDeltaDic = collections.OrderedDict([('added', []), ('removed', []), ('changed', collections.OrderedDict())])
+        groupLabelDic1 = self.getGroupLabelDic(groupDic1, skipType)
+        groupLabelDic2 = self.getGroupLabelDic(groupDic2, skipType)
 
-                    bundleDic.setdefault('pin', collections.OrderedDict())
-                    bundleDic['pin'].setdefault(pinName, collections.OrderedDict())
-                    pinDic = self._getPinInfo(groupDic)
+        for (label, subGroupDic1) in groupLabelDic1.items():
+            if label not in groupLabelDic2:
+                groupDeltaDic['removed'].append(label)
+            else:
+                subGroupDeltaDic = self.diffGroup(subGroupDic1, groupLabelDic2[label])
 
-                    if pinDic:
-                        bundleDic['pin'][pinName] = pinDic
-                elif groupType == 'timing':
-                    timingDic = self._getTimingGroupInfo(groupDic)
-                    bundleDic.setdefault('timing', [])
-                    bundleDic['timing'].append(timingDic)
-                elif groupType == 'internal_power':
-                    internalPowerDic = self._getInternalPowerGroupInfo(groupDic)
-                    bundleDic.setdefault('internal_power', [])
-                    bundleDic['internal_power'].append(internalPowerDic)
+                if subGroupDeltaDic:
+                    groupDeltaDic['changed'][label] = subGroupDeltaDic
 
-        return bundleDic
+        for label in groupLabelDic2.keys():
+            if label not in groupLabelDic1:
+                groupDeltaDic['added'].append(label)
+
+        deltaDic = collections.OrderedDict()
 
-    def _getBusInfo(self, groupDic, pinList=[]):
+        for (item, itemDeltaDic) in (('attribute', attributeDeltaDic), ('group', groupDeltaDic)):
+            itemDeltaDic = collections.OrderedDict([(key, value) for (key, value) in itemDeltaDic.items() if value])
+
+            if itemDeltaDic:
+                deltaDic[item] = itemDeltaDic
+
+        return deltaDic or None
+
+    def diff(self, cellList=[]):
         """
-        Split bus pin timing/internal_power information from the bus dict.
+        Compare the library head part (library attributes and the other groups than cells) and the cells (all cells if
+        cellList is empty).
         Return a dict.
         {
-         'pin' : {
-                  pinName1 : {
-                              'timing' : [timingDic1, timingDic2, ...],
-                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
-                             },
-                  pinName2 : {
-                              'timing' : [timingDic1, timingDic2, ...],
-                              'internal_power' : [internalPowerDic1, internalPowerDic2, ...],
-                             },
-                  ...
-                 }
+         'head' : library head part delta dict (see diffGroup), or None,
+         'cell' : {
+                   'added' : [cellName, ...],
+                   'removed' : [cellName, ...],
+                   'changed' : {cellName: cell delta dict, ...},
+                  },
         }
         """
-        busDic = collections.OrderedDict()
+        cellSet = set(cellList)
+        cellHashDic1 = self.getCellHashDic(self.parser1)
+        cellHashDic2 = self.getCellHashDic(self.parser2)
+        cellDeltaDic = collections.OrderedDict([('added', []), ('removed', []), ('changed', collections.OrderedDict())])
 
-        if 'group' in groupDic:
-            for groupDic in groupDic['group']:
-                groupType = groupDic['type']
+        for cellName in self.parser1.getCellList():
+            if cellSet and (cellName not in cellSet):
+                continue
 
-                if groupType == 'pin':
-                    pinName = groupDic['name']
+            if cellName not in self.parser2.cellNumDic:
+                cellDeltaDic['removed'].append(cellName)
+            elif (cellName not in cellHashDic1) or (cellHashDic1[cellName] != cellHashDic2.get(cellName)):
+                deltaDic = self.diffGroup(self.parser1.getCellGroup(cellName), self.parser2.getCellGroup(cellName))
 
-                    if (len(pinList) > 0) and (pinName not in pinList):
-                        continue
+                if deltaDic:
+                    cellDeltaDic['changed'][cellName] = deltaDic
 
-                    busDic.setdefault('pin', collections.OrderedDict())
-                    busDic['pin'].setdefault(pinName, collections.OrderedDict())
-                    pinDic = self._getPinInfo(groupDic)
+        for cellName in self.parser2.getCellList():
+            if (not cellSet or (cellName in cellSet)) and (cellName not in self.parser1.cellNumDic):
+                cellDeltaDic['added'].append(cellName)
 
-                    if pinDic:
-                        busDic['pin'][pinName] = pinDic
-                elif groupType == 'timing':
-                    timingDic = self._getTimingGroupInfo(groupDic)
-                    busDic.setdefault('timing', [])
-                    busDic['timing'].append(timingDic)
-                elif groupType == 'internal_power':
-                    internalPowerDic = self._getInternalPowerGroupInfo(groupDic)
-                    busDic.setdefault('internal_power', [])
-                    busDic['internal_power'].append(internalPowerDic)
+        return collections.OrderedDict([('head', self.diffGroup(self.parser1.libDic, self.parser2.libDic, skipType='cell')), ('cell', cellDeltaDic)])
+# Liberty diff (end) #
 
-        return busDic
 
-    def getLibPinInfo(self, cellList=[], bundleList=[], busList=[], pinList=[]):
+# Liberty async (start) #
+class libertyAsync():
+    """
+    asyncio front end of libertyParser, the liberty files are parsed (and queried) on an executor (the default thread
+    pool of the event loop, or the specified executor), so the event loop is not blocked.
+    At most maxConcurrency liberty files are parsed at the same time, the other loads wait for their turn.
+    Cancelling a load task stops its parsing on the next phase/text chunk (cooperative), the task is finished (and its
+    maxConcurrency slot is released) after the parsing is stopped, errors are raised as libertyParserError.
+    """
+    def __init__(self, maxConcurrency=4, executor=None):
+        self.semaphore = asyncio.Semaphore(maxConcurrency)
+        self.executor = executor
+
+        # cancelEvent of the running loads.
+        self.cancelEventSet = set()
+
+    async def load(self, libFile, **parserOptionDic):
         """
-        Get all pins (and timing&intern_power info).
-        pin strncture is as below:
-        cell -- pin
-             |
-             -- bundle -- pin
-             |
-             -- bus    -- pin
-        Return a dict.
-        {
-         cellName1 : {
-                      'pin' : [pinDic1, pinDic2, ...],
-                      'bundle' : {
-                                  'pin' : [pinDic1, pinDic2, ...]
-                                 }
-                      'bus' : {
-                               'pin' : [pinDic1, pinDic2, ...]
-                              }
-                     },
-         ...
-        }
+        Parse the liberty file on the executor, return the libertyParser object.
         """
-        libPinDic = collections.OrderedDict()
+        cancelEvent = threading.Event()
+
+        async with self.semaphore:
+            self.cancelEventSet.add(cancelEvent)
+
+            try:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self.executor, functools.partial(libertyParser, libFile, cancelEvent=cancelEvent, **parserOptionDic))
+
+                try:
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # The executor job cannot be cancelled, stop the parsing with cancelEvent, and keep the semaphore
+                    # until the job is finished (so there are at most maxConcurrency jobs on the executor).
+                    cancelEvent.set()
+
+                    while not future.done():
+                        try:
+                            await asyncio.wait([future])
+                        except asyncio.CancelledError:
+                            pass
 
-        if 'group' in self.libDic:
-            for libGroupDic in self.libDic['group']:
-                groupType = libGroupDic['type']
+                    # The job result (or libertyParserCancelled) is dropped.
+                    if not future.cancelled():
+                        future.exception()
 
-                if groupType == 'cell':
-                    cellName = libGroupDic['name']
+                    raise
+            finally:
+                self.cancelEventSet.discard(cancelEvent)
 
-                    if (len(cellList) > 0) and (cellName not in cellList):
-                        continue
+    async def loadAll(self, libFileList, **parserOptionDic):
+        """
+        Parse the liberty files concurrently (limited by maxConcurrency).
+        Return a list on the libFileList order, the item is the libertyParser object or the libertyParserError of the
+        failed liberty file (so one bad liberty file does not stop the others).
+        """
+        taskList = [self.load(libFile, **parserOptionDic) for libFile in libFileList]
+        resultList = await asyncio.gather(*taskList, return_exceptions=True)
+
+        for result in resultList:
+            if isinstance(result, BaseException) and (not isinstance(result, libertyParserError)):
+                raise result
+
+        return resultList
+
+    async def query(self, parser, function, *args, **kwargs):
+        """
+        Call libertyParser function (such as "getCellArea") of the parser on the executor, return the result.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, functools.partial(getattr(parser, function), *args, **kwargs))
 
-                    if 'group' in libGroupDic:
-                        for cellGroupDic in libGroupDic['group']:
-                            cellGroupType = cellGroupDic['type']
+    def cancel(self):
+        """
+        Stop all of the running loads, they raise libertyParserCancelled.
+        """
+        for cancelEvent in list(self.cancelEventSet):
+            cancelEvent.set()
+# Liberty async (end) #
 
-                            if cellGroupType == 'pin':
-                                pinName = cellGroupDic['name']
 
-                                if (len(pinList) > 0) and (pinName not in pinList):
-                                    continue
+# Liberty server (start) #
+# libertyParser functions which are served by libertyServer.
+SERVER_FUNCTIONS = ('getUnit', 'getCellList', 'getCellArea', 'getCellLeakagePower', 'getLibPinInfo')
 
-                                libPinDic.setdefault('cell', collections.OrderedDict())
-                                libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
-                                libPinDic['cell'][cellName].setdefault('pin', collections.OrderedDict())
-                                libPinDic['cell'][cellName]['pin'].setdefault(pinName, collections.OrderedDict())
-                                pinDic = self._getPinInfo(cellGroupDic)
 
-                                if pinDic:
-                                    libPinDic['cell'][cellName]['pin'][pinName] = pinDic
-                            elif cellGroupType == 'bundle':
-                                bundleName = cellGroupDic['name']
+class libertyServerHandler(socketserver.StreamRequestHandler):
+    """
+    Handle the requests of one client connection, one JSON line for every request and response.
+    request  : {"lib": libFile, "function": function, "args": [...], "kwargs": {...}}
+    response : {"result": result} or {"error": message}
+    """
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
 
-                                if (len(bundleList) > 0) and (bundleName not in bundleList):
-                                    continue
+            try:
+                requestDic = json.loads(line)
+                result = self.server.libertyServer.call(requestDic.get('lib', ''), requestDic.get('function', ''), requestDic.get('args', []), requestDic.get('kwargs', {}))
+                responseString = json.dumps({'result': result})
+            except libertyParserError as error:
+                responseString = json.dumps({'error': str(error)})
+            except Exception as error:
+                responseString = json.dumps({'error': type(error).__name__ + ': ' + str(error)})
 
-                                bundleDic = self._getBundleInfo(cellGroupDic, pinList)
+            self.wfile.write(responseString.encode() + b'\n')
+            self.wfile.flush()
 
-                                if bundleDic:
-                                    libPinDic.setdefault('cell', collections.OrderedDict())
-                                    libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
-                                    libPinDic['cell'][cellName].setdefault('bundle', collections.OrderedDict())
-                                    libPinDic['cell'][cellName]['bundle'].setdefault(bundleName, collections.OrderedDict())
-                                    libPinDic['cell'][cellName]['bundle'][bundleName] = bundleDic
-                            elif cellGroupType == 'bus':
-                                busName = cellGroupDic['name']
 
-                                if (len(busList) > 0) and (bundleName not in busList):
-                                    continue
+class libertyServer():
+    """
+    Resident liberty query server on a Unix domain socket, the liberty files are parsed once (on the first request, or
+    libFileList on start) and kept, then the SERVER_FUNCTIONS requests are answered from memory (see libertyClient).
+    If a liberty file is changed on disk (size or mtime), it is updated on the next request (only the changed cells are
+    parsed, see libertyParser.update). The other arguments are passed to every libertyParser.
+    """
+    def __init__(self, socketFile, libFileList=[], **parserOptionDic):
+        parserOptionDic.setdefault('incremental', True)
+        self.socketFile = socketFile
+        self.parserOptionDic = parserOptionDic
+        self.server = None
 
-                                busDic = self._getBusInfo(cellGroupDic, pinList)
+        # {libFile: (parser, libFileStamp)}, and the lock of every liberty file (the parser is used by one request at a time).
+        self.parserDic = {}
+        self.libLockDic = {}
+        self.lock = threading.Lock()
 
-                                if busDic:
-                                    libPinDic.setdefault('cell', collections.OrderedDict())
-                                    libPinDic['cell'].setdefault(cellName, collections.OrderedDict())
-                                    libPinDic['cell'][cellName].setdefault('bus', collections.OrderedDict())
-                                    libPinDic['cell'][cellName]['bus'].setdefault(busName, collections.OrderedDict())
-                                    libPinDic['cell'][cellName]['bus'][busName] = busDic
+        for libFile in libFileList:
+            self.call(libFile, 'getUnit')
 
-        return libPinDic
-# Application functions (end) #
+    def getParser(self, libFile):
+        """
+        Get the parser of libFile (libFile lock must be held), parse it for the first time, update it if it is changed.
+        """
+        libFileStat = os.stat(libFile)
+        libFileStamp = (libFileStat.st_size, libFileStat.st_mtime_ns)
+
+        if libFile not in self.parserDic:
+            parser = libertyParser(libFile, **self.parserOptionDic)
+        elif self.parserDic[libFile][1] != libFileStamp:
+            parser = self.parserDic[libFile][0]
+            parser.update()
+        else:
+            return self.parserDic[libFile][0]
+
+        self.parserDic[libFile] = (parser, libFileStamp)
+
+        return parser
+
+    def call(self, libFile, function, args=[], kwargs={}):
+        """
+        Call the libertyParser function of libFile, return the result.
+        """
+        if function not in SERVER_FUNCTIONS:
+            raise libertyParserError('function "' + str(function) + '" is not supported, it must be one of ' + ', '.join(SERVER_FUNCTIONS) + '.')
+
+        libFile = os.path.abspath(libFile)
+
+        if not os.path.isfile(libFile):
+            raise libertyParserError('liberty file "' + str(libFile) + '": No such file!')
+
+        with self.lock:
+            libLock = self.libLockDic.setdefault(libFile, threading.Lock())
+
+        with libLock:
+            parser = self.getParser(libFile)
+
+            return getattr(parser, function)(*args, **kwargs)
+
+    def serve(self):
+        """
+        Serve the requests until shutdown is called.
+        """
+        if os.path.exists(self.socketFile):
+            # Remove the socket file of a dead server.
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as testSocket:
+                try:
+                    testSocket.connect(self.socketFile)
+                    raise libertyParserError('libertyServer is already running on "' + str(self.socketFile) + '".')
+                except (ConnectionRefusedError, FileNotFoundError):
+                    os.remove(self.socketFile)
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socketFile, libertyServerHandler)
+        self.server.daemon_threads = True
+        self.server.libertyServer = self
+
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+
+            if os.path.exists(self.socketFile):
+                os.remove(self.socketFile)
+
+    def shutdown(self):
+        """
+        Stop serve (from another thread).
+        """
+        if self.server:
+            self.server.shutdown()
+
+
+class libertyClient():
+    """
+    Client of libertyServer, it has the same query functions (SERVER_FUNCTIONS) as libertyParser for libFile, the
+    results are got from the server (dicts are OrderedDict), the errors are raised as libertyParserError.
+    """
+    def __init__(self, socketFile, libFile):
+        self.libFile = os.path.abspath(libFile)
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            self.socket.connect(socketFile)
+        except OSError as error:
+            self.socket.close()
+            raise libertyParserError('cannot connect libertyServer on "' + str(socketFile) + '": ' + str(error))
+
+        self.fileObject = self.socket.makefile('rwb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        self.fileObject.close()
+        self.socket.close()
+
+    def call(self, function, *args, **kwargs):
+        """
+        Send one request, return the result.
+        """
+        requestDic = {'lib': self.libFile, 'function': function, 'args': args, 'kwargs': kwargs}
+        self.fileObject.write(json.dumps(requestDic).encode() + b'\n')
+        self.fileObject.flush()
+        line = self.fileObject.readline()
+
+        if not line:
+            raise libertyParserError('libertyServer is closed.')
+
+        responseDic = json.loads(line, object_pairs_hook=collections.OrderedDict)
+
+        if 'error' in responseDic:
+            raise libertyParserError(responseDic['error'])
+
+        return responseDic['result']
+
+    def getUnit(self):
+        return self.call('getUnit')
+
+    def getCellList(self):
+        return self.call('getCellList')
+
+    def getCellArea(self, cellList=[]):
+        return self.call('getCellArea', cellList=cellList)
+
+    def getCellLeakagePower(self, cellList=[]):
+        return self.call('getCellLeakagePower', cellList=cellList)
+
+    def getLibPinInfo(self, cellList=[], bundleList=[], busList=[], pinList=[], withTemplate=False):
+        return self.call('getLibPinInfo', cellList=cellList, bundleList=bundleList, busList=busList, pinList=pinList, withTemplate=withTemplate)
+# Liberty server (end) #
+
+
+# Command line (start) #
+# Queries of the command line, and the libertyParser functions.
+CLI_QUERIES = collections.OrderedDict([
+                                       ('unit', 'getUnit'),
+                                       ('cells', 'getCellList'),
+                                       ('area', 'getCellArea'),
+                                       ('leakage', 'getCellLeakagePower'),
+                                       ('pin_info', 'getLibPinInfo'),
+                                       ('subset', 'genCellLibFile'),
+                                      ])
+
+
+def readArgs():
+    """
+    Read arguments.
+    """
+    parser = argparse.ArgumentParser(description='Parse liberty files on a process pool, print the query results as JSON lines (one line for every liberty file and query, on the finishing order).')
+
+    parser.add_argument('libFiles', nargs='*', help='Liberty files or glob patterns (such as "libs/*.lib.gz").')
+    parser.add_argument('-q', '--queries', nargs='+', choices=list(CLI_QUERIES.keys()), default=['unit'], help='Queries, default is unit. "subset" generates the liberty file with only the specified cells.')
+    parser.add_argument('-c', '--cells', nargs='+', default=[], help='Specify cells for area/leakage/pin_info/subset, default is all cells.')
+    parser.add_argument('-j', '--jobs', type=int, default=0, help='Process number, default is the CPU number (at most the liberty file number).')
+    parser.add_argument('-o', '--output', default='', help='Save the JSON lines into the file, default is stdout.')
+    parser.add_argument('--lazy', action='store_true', default=False, help='Parse the liberty files on lazy mode.')
+    parser.add_argument('--serve', default='', help='Start libertyServer on the Unix socket file (with the liberty files) instead of the queries.')
+
+    args = parser.parse_args()
+
+    if (not args.libFiles) and (not args.serve):
+        parser.error('no liberty file is specified.')
+
+    if ('subset' in args.queries) and (not args.cells):
+        parser.error('query "subset" needs --cells.')
+
+    return args
+
+
+def runQueries(libFile, queryList, cellList=[], parserOptionDic={}):
+    """
+    Parse libFile and run the queries, errors are saved on the results (so other liberty files are not affected).
+    Warnings are printed on stderr, so stdout is only for the JSON lines.
+    Return a list.
+    [
+     {'lib': libFile, 'query': query, 'result': result} or {'lib': libFile, 'query': query, 'error': message},
+     ...
+    ]
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        return runQueriesCore(libFile, queryList, cellList, parserOptionDic)
+
+
+def runQueriesCore(libFile, queryList, cellList, parserOptionDic):
+    resultList = []
+    parser = None
+    parserError = None
+
+    # If cells are specified, only they are parsed (lazy mode, bz2/xz compressed liberty file cannot be read randomly).
+    lazy = bool(cellList) and os.path.exists(libFile) and (getCompressionModule(libFile) in (None, gzip))
+
+    if lazy:
+        parserOptionDic = dict(parserOptionDic, lazy=True)
+
+    for query in queryList:
+        resultDic = collections.OrderedDict([('lib', libFile), ('query', query)])
+
+        try:
+            if query == 'subset':
+                # The subset liberty file is generated with the cell index, only its head part is parsed.
+                resultDic['result'] = libertyParser(libFile, cellList=cellList, lazy=True).libFile
+            else:
+                # The liberty file is parsed once (on the first query which needs it).
+                if (parser is None) and (parserError is None):
+                    try:
+                        parser = libertyParser(libFile, **parserOptionDic)
+                    except Exception as error:
+                        parserError = error
+
+                if parserError is not None:
+                    raise parserError
+
+                if (query in ('area', 'leakage', 'pin_info')) and cellList:
+                    resultDic['result'] = getattr(parser, CLI_QUERIES[query])(cellList=cellList)
+                else:
+                    resultDic['result'] = getattr(parser, CLI_QUERIES[query])()
+        except Exception as error:
+            resultDic['error'] = str(error)
+
+        resultList.append(resultDic)
+
+    return resultList
+
+
+def main():
+    """
+    Command line entry, return the exit code, 0 if all queries are finished, 1 if any liberty file/query is failed.
+    """
+    args = readArgs()
+    parserOptionDic = {'lazy': args.lazy}
+    libFileList = []
+    exitCode = 0
+
+    for libFile in args.libFiles:
+        if os.path.exists(libFile):
+            libFileList.append(libFile)
+        else:
+            libFileList.extend(sorted(glob.glob(libFile)) or [libFile])
+
+    if args.serve:
+        try:
+            libertyServer(args.serve, libFileList, **parserOptionDic).serve()
+        except KeyboardInterrupt:
+            pass
+        except libertyParserError as error:
+            print('*Error*: ' + str(error), file=sys.stderr)
+            return 1
+
+        return 0
+
+    jobs = args.jobs if (args.jobs > 0) else (os.cpu_count() or 1)
+    jobs = min(jobs, len(libFileList))
+    outputFile = open(args.output, 'w') if args.output else sys.stdout
+
+    def writeResults(resultList):
+        for resultDic in resultList:
+            outputFile.write(json.dumps(resultDic, default=str) + '\n')
+
+        outputFile.flush()
+
+        return all(['error' not in resultDic for resultDic in resultList])
+
+    try:
+        if jobs <= 1:
+            for libFile in libFileList:
+                if not writeResults(runQueries(libFile, args.queries, args.cells, parserOptionDic)):
+                    exitCode = 1
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                futureList = [executor.submit(runQueries, libFile, args.queries, args.cells, parserOptionDic) for libFile in libFileList]
+
+                # Write the results on the finishing order, so they are not buffered.
+                for future in concurrent.futures.as_completed(futureList):
+                    if not writeResults(future.result()):
+                        exitCode = 1
+    finally:
+        if args.output:
+            outputFile.close()
+
+    return exitCode
+# Command line (end) #
+
+
+if __name__ == '__main__':
+    sys.exit(main())
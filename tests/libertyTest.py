@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+testsPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(testsPath))
+import libertyParser
+
+EXAMPLE_LIB = os.path.join(os.path.dirname(testsPath), 'examples', 'example.lib')
+LIBERTY_PARSER = os.path.join(os.path.dirname(testsPath), 'libertyParser.py')
+
+
+def getPlainDic(groupDic):
+    """
+    Convert libDic (dict/lazyCellDic/libertyGroup groups, libertyValueRef values) into plain dicts and lists.
+    """
+    if hasattr(groupDic, 'keys'):
+        return {key: getPlainDic(groupDic[key]) for key in groupDic.keys()}
+    elif isinstance(groupDic, list):
+        return [getPlainDic(item) for item in groupDic]
+    else:
+        return groupDic
+
+
+def getCellList(libDic):
+    return [groupDic for groupDic in libDic['group'] if groupDic['type'] == 'cell']
+
+
+class libertyTestCase(unittest.TestCase):
+    """
+    Test case with a temporary directory, liberty files are copied/written into it (so the sidecar index files are not
+    saved on the examples directory).
+    """
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp(prefix='libertyParserTest.')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir, ignore_errors=True)
+
+    def writeLib(self, fileName, libString):
+        libFile = os.path.join(self.tempDir, fileName)
+
+        with open(libFile, 'w') as LF:
+            LF.write(libString)
+
+        return libFile
+
+    def copyLib(self, fileName='example.lib'):
+        libFile = os.path.join(self.tempDir, fileName)
+        shutil.copy(EXAMPLE_LIB, libFile)
+
+        return libFile
+
+    def readLib(self, libFile=EXAMPLE_LIB):
+        with open(libFile, 'r') as LF:
+            return LF.read()
+
+    def rewriteLib(self, libFile, libString):
+        """
+        Rewrite the liberty file in place (same inode), the mtime is changed even on a fast file system.
+        """
+        libFileStat = os.stat(libFile)
+
+        with open(libFile, 'r+') as LF:
+            LF.write(libString)
+            LF.truncate()
+
+        os.utime(libFile, ns=(libFileStat.st_atime_ns, libFileStat.st_mtime_ns + 1000000000))
+
+    def assertSameLibDic(self, libDic, expectedLibDic):
+        self.assertEqual(getPlainDic(libDic), getPlainDic(expectedLibDic))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import os
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+numpy = libertyParser.numpy
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed.')
+class testArcColumns(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.myLibertyParser = libertyParser.libertyParser(self.copyLib())
+        self.columnDic = self.myLibertyParser.getArcColumns()
+
+    def test_columns(self):
+        # One row for every table, the same order with getArcTableList.
+        (arcList, tableList) = self.myLibertyParser.getArcTableList(tableTypeList=[])
+        columnDic = self.columnDic
+
+        self.assertEqual(len(columnDic['arc']), len(arcList))
+
+        for (i, (arcDic, tableDic)) in enumerate(zip(arcList, tableList)):
+            self.assertEqual(columnDic['cell_dict'][columnDic['cell'][i]], arcDic['cell'])
+            self.assertEqual(columnDic['table_type_dict'][columnDic['table_type'][i]], arcDic['table_type'])
+
+            valuesArray = columnDic['values_data'][columnDic['values_offsets'][i]:columnDic['values_offsets'][i + 1]]
+            numpy.testing.assert_array_equal(valuesArray, libertyParser.decodeTableValues(tableDic['values']).reshape(-1))
+
+            for indexKey in ('index_1', 'index_2'):
+                axisNum = columnDic[indexKey][i]
+
+                if axisNum == -1:
+                    self.assertNotIn(indexKey, tableDic)
+                else:
+                    axisArray = columnDic['axis_data'][columnDic['axis_offsets'][axisNum]:columnDic['axis_offsets'][axisNum + 1]]
+                    numpy.testing.assert_array_equal(axisArray, libertyParser.decodeTableIndex(tableDic[indexKey]))
+
+    def test_round_trip(self):
+        for outputFile in (os.path.join(self.tempDir, 'arc.npz'), os.path.join(self.tempDir, 'arc')):
+            with self.subTest(outputFile=os.path.basename(outputFile)):
+                self.myLibertyParser.exportArcColumns(outputFile)
+                loadedColumnDic = libertyParser.loadArcColumns(outputFile)
+
+                self.assertEqual(sorted(loadedColumnDic.keys()), sorted(self.columnDic.keys()))
+
+                for (name, columnArray) in self.columnDic.items():
+                    numpy.testing.assert_array_equal(loadedColumnDic[name], columnArray)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import asyncio
+import threading
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testAsync(libertyTestCase):
+    def test_concurrency(self):
+        # At most maxConcurrency liberty files are parsed at the same time.
+        libFileList = [self.copyLib('example' + str(i) + '.lib') for i in range(4)]
+        lock = threading.Lock()
+        countDic = {'running': 0, 'max': 0}
+
+        def phaseCallback(phase, state, metrics):
+            if phase == 'total':
+                with lock:
+                    if state == 'start':
+                        countDic['running'] += 1
+                        countDic['max'] = max(countDic['max'], countDic['running'])
+                    else:
+                        countDic['running'] -= 1
+
+            if phase == 'parse':
+                threading.Event().wait(0.05)
+
+        async def run():
+            myLibertyAsync = libertyParser.libertyAsync(maxConcurrency=2)
+            return await myLibertyAsync.loadAll(libFileList + ['missing.lib'], phaseCallback=phaseCallback)
+
+        parserList = asyncio.run(run())
+
+        self.assertEqual(countDic['max'], 2)
+        self.assertTrue(all(isinstance(parser, libertyParser.libertyParser) for parser in parserList[:4]))
+        self.assertIsInstance(parserList[4], libertyParser.libertyParserError)
+
+    def test_cancel(self):
+        # The cancelled load keeps its slot until the executor job is stopped.
+        libFileA = self.copyLib('a.lib')
+        libFileB = self.copyLib('b.lib')
+        parseStartEvent = threading.Event()
+        releaseEvent = threading.Event()
+        stateDic = {'a_stopped': False, 'b_started': False}
+
+        def phaseCallbackA(phase, state, metrics):
+            if (phase == 'parse') and (state == 'start'):
+                parseStartEvent.set()
+                releaseEvent.wait(5)
+
+        def phaseCallbackB(phase, state, metrics):
+            if phase == 'total':
+                stateDic['b_started'] = True
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            myLibertyAsync = libertyParser.libertyAsync(maxConcurrency=1)
+            taskA = asyncio.ensure_future(myLibertyAsync.load(libFileA, phaseCallback=phaseCallbackA))
+            await loop.run_in_executor(None, parseStartEvent.wait, 5)
+
+            taskA.cancel()
+            taskB = asyncio.ensure_future(myLibertyAsync.load(libFileB, phaseCallback=phaseCallbackB))
+            await asyncio.sleep(0.2)
+
+            # Task A is still waiting for its executor job, task B is not started.
+            self.assertFalse(taskA.done())
+            self.assertFalse(stateDic['b_started'])
+
+            releaseEvent.set()
+
+            try:
+                await taskA
+            except asyncio.CancelledError:
+                stateDic['a_stopped'] = True
+
+            return await taskB
+
+        parser = asyncio.run(run())
+
+        self.assertTrue(stateDic['a_stopped'])
+        self.assertTrue(stateDic['b_started'])
+        self.assertEqual(parser.getCellList(), libertyParser.libertyParser(libFileB).getCellList())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import os
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testCache(libertyTestCase):
+    def test_cache_load(self):
+        libFile = self.copyLib()
+        myLibertyCache = libertyParser.libertyCache(os.path.join(self.tempDir, 'cache'))
+        libDic = libertyParser.libertyParser(libFile, cache=myLibertyCache).libDic
+        myLibertyParser = libertyParser.libertyParser(libFile, cache=myLibertyCache)
+
+        self.assertIn('cache_load', myLibertyParser.metrics['time'])
+        self.assertNotIn('parse', myLibertyParser.metrics['time'])
+        self.assertSameLibDic(myLibertyParser.libDic, libDic)
+
+    def test_evict_latest_file(self):
+        # The cache is too small for any cache file, the latest saved one is kept, the other one and its latest file are removed.
+        cacheDir = os.path.join(self.tempDir, 'cache')
+        myLibertyCache = libertyParser.libertyCache(cacheDir, maxSize=1)
+        libFile1 = self.copyLib('a.lib')
+        libFile2 = self.copyLib('b.lib')
+        libertyParser.libertyParser(libFile1, cache=myLibertyCache, incremental=True)
+        libertyParser.libertyParser(libFile2, cache=myLibertyCache, incremental=True)
+
+        self.assertEqual(len([fileName for fileName in os.listdir(cacheDir) if fileName.endswith('.libcache')]), 1)
+        self.assertEqual(len([fileName for fileName in os.listdir(cacheDir) if fileName.endswith('.liblatest')]), 1)
+        self.assertIsNone(myLibertyCache.loadPrevious(libFile1))
+        self.assertIsNotNone(myLibertyCache.loadPrevious(libFile2))
+
+    def test_missing_cache_file(self):
+        cacheDir = os.path.join(self.tempDir, 'cache')
+        myLibertyCache = libertyParser.libertyCache(cacheDir)
+        libFile = self.copyLib()
+        libertyParser.libertyParser(libFile, cache=myLibertyCache, incremental=True)
+
+        for fileName in os.listdir(cacheDir):
+            if fileName.endswith('.libcache'):
+                os.remove(os.path.join(cacheDir, fileName))
+
+        self.assertIsNone(myLibertyCache.loadPrevious(libFile))
+        self.assertFalse([fileName for fileName in os.listdir(cacheDir) if fileName.endswith('.liblatest')])
+
+
+if __name__ == '__main__':
+    unittest.main()
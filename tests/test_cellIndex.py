@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import json
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testCellIndex(libertyTestCase):
+    def test_cell_lib_file(self):
+        libFile = self.copyLib()
+        myLibertyParser = libertyParser.libertyParser(libFile, cellList=['INVX1'])
+
+        self.assertEqual(myLibertyParser.getCellList(), ['INVX1'])
+        self.assertRaises(libertyParser.libertyParserError, libertyParser.libertyParser, libFile, cellList=['MISSING'])
+
+    def test_index_file(self):
+        libFile = self.copyLib()
+        indexFile = libFile + '.index'
+        myLibertyParser = libertyParser.libertyParser(libFile, cellList=['INVX1'])
+
+        with open(indexFile, 'r') as IF:
+            cellIndexDic = json.load(IF)
+
+        self.assertEqual([cellIndex[0] for cellIndex in cellIndexDic['cell']], ['DFFX1', 'INVX1', 'NOR2X1'])
+
+        def writeIndex(**updateDic):
+            # Save a marked index, so it can be told whether the sidecar index is re-used or not.
+            markedCellIndexDic = dict(cellIndexDic, cell=[['MARKED', 0, 0, 0]], **updateDic)
+
+            with open(indexFile, 'w') as IF:
+                json.dump(markedCellIndexDic, IF)
+
+        # The liberty file is not changed, the sidecar index is re-used.
+        writeIndex()
+        self.assertEqual(myLibertyParser.genCellIndex(libFile)['cell'], [['MARKED', 0, 0, 0]])
+
+        # Index format changed.
+        writeIndex(version=libertyParser.CELL_INDEX_VERSION - 1)
+        self.assertEqual(myLibertyParser.genCellIndex(libFile)['cell'], cellIndexDic['cell'])
+
+        # Liberty file mtime changed.
+        writeIndex()
+        self.rewriteLib(libFile, self.readLib(libFile))
+        self.assertEqual(myLibertyParser.genCellIndex(libFile)['cell'], cellIndexDic['cell'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+from libertyTest import libertyParser, libertyTestCase, LIBERTY_PARSER
+
+
+class testCommandLine(libertyTestCase):
+    def runCommand(self, argList):
+        return subprocess.run([sys.executable, LIBERTY_PARSER] + argList, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+    def getResultDic(self, lines):
+        resultDic = {}
+
+        for line in lines.splitlines():
+            lineDic = json.loads(line)
+            resultDic[(lineDic['lib'], lineDic['query'])] = lineDic
+
+        return resultDic
+
+    def test_queries(self):
+        libFile = self.copyLib()
+        missingLibFile = os.path.join(self.tempDir, 'missing.lib')
+        process = self.runCommand([libFile, missingLibFile, '-q', 'cells', 'area', 'subset', '-c', 'INVX1', '-j', '2'])
+        resultDic = self.getResultDic(process.stdout)
+
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(resultDic[(libFile, 'cells')]['result'], ['DFFX1', 'INVX1', 'NOR2X1'])
+        self.assertEqual(resultDic[(libFile, 'area')]['result'], {'INVX1': '0'})
+        self.assertEqual(resultDic[(libFile, 'subset')]['result'], libFile + '.INVX1')
+        self.assertIn('error', resultDic[(missingLibFile, 'cells')])
+
+    def test_glob_output(self):
+        # Glob patterns are expanded, the JSON lines are saved into the output file.
+        libFileList = [self.copyLib('a.lib'), self.copyLib('b.lib')]
+        outputFile = os.path.join(self.tempDir, 'result.json')
+        process = self.runCommand([os.path.join(self.tempDir, '*.lib'), '-q', 'cells', '-j', '1', '-o', outputFile])
+
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stdout, '')
+
+        with open(outputFile, 'r') as OF:
+            resultDic = self.getResultDic(OF.read())
+
+        self.assertEqual(sorted(resultDic.keys()), [(libFile, 'cells') for libFile in libFileList])
+
+    def test_cells(self):
+        # The queries with cells (parsed on lazy mode) get the same results as the full parse.
+        libFile = self.copyLib()
+        myLibertyParser = libertyParser.libertyParser(libFile)
+        resultList = libertyParser.runQueries(libFile, ['area', 'leakage', 'pin_info'], cellList=['INVX1'])
+
+        self.assertEqual(resultList[0]['result'], myLibertyParser.getCellArea(cellList=['INVX1']))
+        self.assertEqual(resultList[1]['result'], myLibertyParser.getCellLeakagePower(cellList=['INVX1']))
+        self.assertEqual(resultList[2]['result'], myLibertyParser.getLibPinInfo(cellList=['INVX1']))
+
+    def test_exit_code(self):
+        libFile = self.copyLib()
+
+        self.assertEqual(self.runCommand([libFile, '-q', 'unit']).returncode, 0)
+        self.assertEqual(self.runCommand([]).returncode, 2)
+        self.assertEqual(self.runCommand([libFile, '-q', 'subset']).returncode, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
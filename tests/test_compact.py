@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, getCellList
+
+
+class testCompact(libertyTestCase):
+    def test_compact(self):
+        libFile = self.copyLib()
+        libDic = libertyParser.libertyParser(libFile).libDic
+
+        for dedup in (None, False):
+            with self.subTest(dedup=dedup):
+                myLibertyParser = libertyParser.libertyParser(libFile, compact=True, dedup=dedup)
+
+                self.assertIsInstance(getCellList(myLibertyParser.libDic)[0], libertyParser.libertyGroup)
+                self.assertSameLibDic(myLibertyParser.libDic, libDic)
+
+                # The string pool is enabled by default on compact mode.
+                self.assertEqual(('string_pool' in myLibertyParser.metrics), (dedup is None))
+
+
+if __name__ == '__main__':
+    unittest.main()
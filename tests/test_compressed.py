@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import os
+import bz2
+import gzip
+import lzma
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, getCellList
+
+
+class testCompressed(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.libFile = self.copyLib()
+        self.libDic = libertyParser.libertyParser(self.libFile).libDic
+
+    def test_compressed(self):
+        for (extension, compressionModule) in (('.gz', gzip), ('.bz2', bz2), ('.xz', lzma)):
+            with self.subTest(extension=extension):
+                compressedLibFile = self.libFile + extension
+
+                with compressionModule.open(compressedLibFile, 'wt') as CF:
+                    CF.write(self.readLib())
+
+                self.assertSameLibDic(libertyParser.libertyParser(compressedLibFile).libDic, self.libDic)
+
+    def test_gzip_lazy(self):
+        gzipLibFile = self.libFile + '.gz'
+
+        with gzip.open(gzipLibFile, 'wt') as GF:
+            GF.write(self.readLib())
+
+        # Load the cells backward, so every cell is read from a checkpoint before the current position.
+        myLibertyParser = libertyParser.libertyParser(gzipLibFile, lazy=True)
+
+        for cellGroupDic in reversed(getCellList(myLibertyParser.libDic)):
+            cellGroupDic.load()
+
+        self.assertSameLibDic(myLibertyParser.libDic, self.libDic)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import gzip
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testDiff(libertyTestCase):
+    def test_diff(self):
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        newLibFile = self.writeLib('new.lib', libString.replace('  cell (INVX1) {', '  cell (INVX1) {\n    dont_use : true ;', 1))
+        sameDeltaDic = libertyParser.libertyDiff(libFile, self.copyLib('same.lib')).diff()
+        deltaDic = libertyParser.libertyDiff(libFile, newLibFile).diff()
+
+        self.assertIsNone(sameDeltaDic['head'])
+        self.assertFalse(sameDeltaDic['cell']['changed'])
+        self.assertEqual(list(deltaDic['cell']['changed'].keys()), ['INVX1'])
+
+    def test_added_removed(self):
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        firstCellStart = libString.index('  cell (')
+        secondCellStart = libString.index('  cell (', firstCellStart + 1)
+        newLibFile = self.writeLib('new.lib', libString[:firstCellStart] + libString[secondCellStart:].replace('(INVX1)', '(INVX2)', 1))
+
+        # The compressed liberty file is parsed on normal mode (lazy for the plain one).
+        gzipNewLibFile = newLibFile + '.gz'
+
+        with gzip.open(gzipNewLibFile, 'wt') as GF:
+            GF.write(self.readLib(newLibFile))
+
+        for myNewLibFile in (newLibFile, gzipNewLibFile):
+            with self.subTest(newLibFile=myNewLibFile):
+                cellDeltaDic = libertyParser.libertyDiff(libFile, myNewLibFile).diff()['cell']
+
+                self.assertEqual(cellDeltaDic['added'], ['INVX2'])
+                self.assertEqual(cellDeltaDic['removed'], ['DFFX1', 'INVX1'])
+                self.assertFalse(cellDeltaDic['changed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
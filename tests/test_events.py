@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, EXAMPLE_LIB
+
+
+class testEvents(libertyTestCase):
+    def test_depth(self):
+        depth = 0
+        groupNum = 0
+
+        for event in libertyParser.libertyEvents(EXAMPLE_LIB):
+            if event.event == libertyParser.GROUP_CLOSE_EVENT:
+                depth -= 1
+
+            self.assertEqual(event.depth, depth)
+
+            if event.event == libertyParser.GROUP_OPEN_EVENT:
+                self.assertIsNotNone(event.indent)
+                depth += 1
+                groupNum += 1
+            else:
+                self.assertIsNone(event.indent)
+
+        self.assertEqual(depth, 0)
+        self.assertGreater(groupNum, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
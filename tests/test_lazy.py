@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, getCellList
+
+
+class testLazy(libertyTestCase):
+    def test_lazy(self):
+        libFile = self.copyLib()
+        myLibertyParser = libertyParser.libertyParser(libFile, lazy=True)
+        cellList = getCellList(myLibertyParser.libDic)
+
+        # Only the head part is parsed, the cells are parsed when they are accessed.
+        self.assertFalse(any([cellGroupDic.loaded for cellGroupDic in cellList]))
+        self.assertEqual(myLibertyParser.getCellArea(['INVX1']), {'INVX1': '0'})
+        self.assertEqual([cellGroupDic.loaded for cellGroupDic in cellList], [False, True, False])
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+
+if __name__ == '__main__':
+    unittest.main()
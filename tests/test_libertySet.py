@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import math
+import threading
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+CORNER_LIB = '''library (%(corner)s) {
+  lu_table_template (delay) {
+    variable_1 : input_net_transition ;
+    variable_2 : total_output_net_capacitance ;
+    index_1 ("0.1, 0.2") ;
+    index_2 ("0.01, 0.02") ;
+  }
+  cell (INV) {
+    area : %(area)s ;
+    cell_leakage_power : "%(leakage)s" ;
+    pin (A) {
+      direction : input ;
+    }
+    pin (Y) {
+      direction : output ;
+      timing () {
+        related_pin : "A" ;
+        cell_rise (delay) {
+          values ("%(delay)s, 2", "3, 4") ;
+        }
+      }
+    }
+  }
+%(extraCell)s}
+'''
+
+EXTRA_CELL = '''  cell (BUF) {
+    area : 2 ;
+    pin (Y) {
+      direction : output ;
+      timing () {
+        related_pin : "A" ;
+        cell_rise (delay) {
+          values ("5, 6", "7, 8") ;
+        }
+      }
+    }
+  }
+'''
+
+
+class testLibertySet(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.libFileList = [
+                            self.writeLib('ss.lib', CORNER_LIB % {'corner': 'ss', 'area': '1', 'leakage': '0.5', 'delay': '1', 'extraCell': ''}),
+                            self.writeLib('ff.lib', CORNER_LIB % {'corner': 'ff', 'area': '1', 'leakage': '0.3', 'delay': '9', 'extraCell': EXTRA_CELL}),
+                           ]
+
+    def checkLibertySet(self, myLibertySet):
+        self.assertEqual(myLibertySet.cellList, ['INV', 'BUF'])
+        self.assertEqual(myLibertySet.getCellLeakagePowerValue(['INV']), {'INV': [0.5, 0.3]})
+
+        areaDic = myLibertySet.getCellArea()
+        self.assertEqual(areaDic['INV'], [1.0, 1.0])
+        self.assertTrue(math.isnan(areaDic['BUF'][0]))
+        self.assertEqual(areaDic['BUF'][1], 2.0)
+
+        # The arcs are aligned on the corners, BUF arc is only on the second corner.
+        (arcList, cornerTableList) = myLibertySet.getArcTableList()
+        self.assertEqual([arcDic['cell'] for arcDic in arcList], ['INV', 'BUF'])
+        self.assertIsNone(cornerTableList[1][0])
+        self.assertEqual(myLibertySet.getArcTableList(cellList=['BUF'])[0], arcList[1:])
+
+        if libertyParser.numpy is not None:
+            (arcList, valuesList) = myLibertySet.getTableValues('cell_rise', cellList=['INV'])
+            self.assertEqual(valuesList[0].tolist(), [[[1, 2], [3, 4]], [[9, 2], [3, 4]]])
+
+            (arcList, worstValuesList, worstCornerList) = myLibertySet.getWorstTable('cell_rise', cellList=['INV'], worst='min')
+            self.assertEqual(worstValuesList[0].tolist(), [[1, 2], [3, 4]])
+            self.assertEqual(worstCornerList[0].tolist(), [[0, 0], [0, 0]])
+
+    def test_libertySet(self):
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                myLibertySet = libertyParser.libertySet(self.libFileList, cornerList=['ss', 'ff'], jobs=jobs)
+
+                self.assertEqual(myLibertySet.cornerList, ['ss', 'ff'])
+                self.assertFalse(hasattr(myLibertySet, 'parserList'))
+                self.checkLibertySet(myLibertySet)
+
+    def test_local_options(self):
+        # The options cannot be sent to the worker processes, the liberty files are parsed on the current process.
+        phaseList = []
+        myLibertySet = libertyParser.libertySet(self.libFileList, jobs=2, cancelEvent=threading.Event(), phaseCallback=lambda phase, state, metrics: phaseList.append(phase))
+
+        self.checkLibertySet(myLibertySet)
+        self.assertEqual(phaseList.count('total'), 4)
+
+    def test_error(self):
+        self.assertRaises(libertyParser.libertyParserError, libertyParser.libertySet, self.libFileList, cornerList=['ss'])
+        self.assertRaises(libertyParser.libertyParserError, libertyParser.libertySet, self.libFileList + [self.tempDir + '/missing.lib'])
+
+
+if __name__ == '__main__':
+    unittest.main()
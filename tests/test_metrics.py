@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+COMMENT_LIB = '''/* head comment */
+library (comment) {
+  a : 1 ; /* trailing comment */
+  b : "/* not a comment */" ;
+  c : 2 /* value comment */ ;
+  /* line comment 1 */ /* line comment 2 */
+  cell (A) {
+    area : 1 ;
+  } /* close comment */
+}
+/* end comment */
+'''
+
+
+class testMetrics(libertyTestCase):
+    def test_metrics(self):
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        phaseList = []
+        myLibertyParser = libertyParser.libertyParser(libFile, phaseCallback=lambda phase, state, metrics: phaseList.append((phase, state)))
+        metrics = myLibertyParser.metrics
+        eventList = list(libertyParser.libertyEvents(libFile))
+
+        self.assertEqual(metrics['lines'], libString.count('\n'))
+        self.assertEqual(metrics['chars'], len(libString))
+        self.assertGreater(metrics['lines_per_second'], 0)
+        self.assertEqual(metrics['statement']['simple'], len([event for event in eventList if event.event == libertyParser.ATTRIBUTE_EVENT]))
+        self.assertEqual(metrics['statement']['complex'], len([event for event in eventList if event.event == libertyParser.COMPLEX_ATTRIBUTE_EVENT]))
+        self.assertEqual(metrics['statement']['group'], len([event for event in eventList if event.event == libertyParser.GROUP_OPEN_EVENT]))
+        self.assertEqual(metrics['group']['cell'], 3)
+
+        # The phases are started and ended in pairs, "total" covers all of the other phases ("read" time is accumulated
+        # on "parse", it is not a callback phase).
+        self.assertEqual(phaseList[0], ('total', 'start'))
+        self.assertEqual(phaseList[-1], ('total', 'end'))
+        self.assertEqual(sorted([phase for (phase, state) in phaseList if state == 'start']), sorted([phase for (phase, state) in phaseList if state == 'end']))
+        self.assertEqual(set(metrics['time'].keys()) - set(['read']), set([phase for (phase, state) in phaseList]))
+        self.assertIn('parse', metrics['time'])
+
+    def test_comment(self):
+        # Comments in strings are not counted, comments in values are kept on the values (not counted).
+        statDic = {}
+        eventList = list(libertyParser.libertyTextEvents([COMMENT_LIB], statDic))
+
+        self.assertEqual(statDic['statement']['comment'], 6)
+        self.assertEqual(statDic['statement']['unrecognized'], 0)
+        self.assertEqual(statDic['lineNum'], COMMENT_LIB.count('\n'))
+        self.assertEqual([event.value for event in eventList if event.key == 'c'], ['2 /* value comment */ '])
+
+
+if __name__ == '__main__':
+    unittest.main()
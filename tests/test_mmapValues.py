@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import os
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, getCellList
+
+
+class testMmapValues(libertyTestCase):
+    def test_update_in_place(self):
+        # The unchanged cells are moved on the liberty file (a changed cell before them, then a removed cell), the
+        # liberty file is rewritten in place.
+        libFile = self.copyLib()
+
+        libString = self.readLib(libFile)
+
+        myLibertyParser = libertyParser.libertyParser(libFile, mmapValues=True, incremental=True)
+        libString = libString.replace('area : ', 'area : 12', 1)
+        self.rewriteLib(libFile, libString)
+
+        self.assertEqual(myLibertyParser.update()['changed'], ['DFFX1'])
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+        firstCellStart = libString.index('  cell (')
+        secondCellStart = libString.index('  cell (', firstCellStart + 1)
+        self.rewriteLib(libFile, libString[:firstCellStart] + libString[secondCellStart:])
+
+        self.assertEqual(myLibertyParser.update()['removed'], ['DFFX1'])
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+    def test_server_update_in_place(self):
+        libFile = self.copyLib()
+
+        libString = self.readLib(libFile)
+
+        myLibertyServer = libertyParser.libertyServer(os.path.join(self.tempDir, 'server.sock'), [libFile], mmapValues=True)
+        self.rewriteLib(libFile, libString.replace('area : ', 'area : 12', 1))
+
+        self.assertEqual(myLibertyServer.call(libFile, 'getLibPinInfo'), libertyParser.libertyParser(libFile).getLibPinInfo())
+
+    def test_values(self):
+        libFile = self.copyLib()
+        myLibertyParser = libertyParser.libertyParser(libFile, mmapValues=True)
+        valueRefList = [valueRef for cellGroupDic in getCellList(myLibertyParser.libDic) for valueRef in libertyParser.getValueRefList(cellGroupDic)]
+
+        self.assertTrue(valueRefList)
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+    def test_rename(self):
+        # The new liberty file is renamed to the liberty file, the old file is still mapped until update.
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        myLibertyParser = libertyParser.libertyParser(libFile, mmapValues=True, incremental=True)
+        libDic = libertyParser.libertyParser(libFile).libDic
+        valueStart = libString.index('"', libString.index('values (')) + 1
+        newLibFile = self.writeLib('new.lib', libString[:valueStart] + '9' + libString[valueStart:])
+        os.replace(newLibFile, libFile)
+
+        self.assertSameLibDic(myLibertyParser.libDic, libDic)
+        self.assertEqual(myLibertyParser.update()['changed'], ['DFFX1'])
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+
+if __name__ == '__main__':
+    unittest.main()
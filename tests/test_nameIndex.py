@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+import contextlib
+
+from libertyTest import libertyParser, libertyTestCase
+
+NAME_INDEX_LIB = '''library (nameIndex) {
+  cell (A) {
+    area : 1 ;
+    leakage_power () {
+      value : 0.1 ;
+    }
+    pin (Y) {
+      direction : output ;
+    }
+  }
+  cell (B) {
+    area : 2 ;
+    bus (D) {
+      pin (D[0]) {
+        direction : input ;
+      }
+    }
+  }
+  cell (A) {
+    area : 3 ;
+    leakage_power () {
+      value : 0.3 ;
+    }
+  }
+}
+'''
+
+
+class testNameIndex(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.myLibertyParser = libertyParser.libertyParser(self.writeLib('nameIndex.lib', NAME_INDEX_LIB))
+
+        self.output = output.getvalue()
+
+    def test_lookup(self):
+        self.assertEqual(self.myLibertyParser.getCellGroup('B')['area'], '2 ')
+        self.assertEqual(self.myLibertyParser.getPinGroup('A', 'Y')['direction'], 'output ')
+        self.assertEqual(self.myLibertyParser.getBusGroup('B', 'D')['type'], 'bus')
+        self.assertEqual(self.myLibertyParser.getBusPinGroup('B', 'D', 'D[0]')['direction'], 'input ')
+        self.assertIsNone(self.myLibertyParser.getCellGroup('C'))
+        self.assertIsNone(self.myLibertyParser.getPinGroup('B', 'Y'))
+
+    def test_duplicate_cell_name(self):
+        # All the cell groups are kept (liberty order) like scanning libDic, the lookups get the first one with a warning.
+        self.assertIn('cell "A" is defined more than once', self.output)
+        self.assertEqual(self.myLibertyParser.getCellList(), ['A', 'B', 'A'])
+        self.assertEqual(self.myLibertyParser.getCellArea(), {'A': '3 ', 'B': '2 '})
+        self.assertEqual(self.myLibertyParser.getCellArea(['A']), {'A': '3 '})
+        self.assertEqual(self.myLibertyParser.getCellLeakagePower(['A']), {'A': [{'value': '0.1 '}, {'value': '0.3 '}]})
+        self.assertEqual(self.myLibertyParser.getCellGroup('A')['area'], '1 ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+numpy = libertyParser.numpy
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed.')
+class testNumpyTable(libertyTestCase):
+    def test_decode(self):
+        numpy.testing.assert_array_equal(libertyParser.decodeTableIndex('("0.25, 0.5, 0.75")'), [0.25, 0.5, 0.75])
+        numpy.testing.assert_array_equal(libertyParser.decodeTableValues('("0.1, 0.2", \\\n "0.3, 0.4")'), [[0.1, 0.2], [0.3, 0.4]])
+        numpy.testing.assert_array_equal(libertyParser.decodeTableValues('("0.1, 0.2, 0.3, 0.4")', [2, 2]), [[0.1, 0.2], [0.3, 0.4]])
+        numpy.testing.assert_array_equal(libertyParser.decodeTableValues('("0.1, 0.2, 0.3")'), [0.1, 0.2, 0.3])
+
+    def test_numpy_table(self):
+        libFile = self.copyLib()
+        timingDic = libertyParser.libertyParser(libFile).getLibPinInfo(['INVX1'])['cell']['INVX1']['pin']['Y']['timing'][0]
+        numpyTimingDic = libertyParser.libertyParser(libFile, numpyTable=True).getLibPinInfo(['INVX1'])['cell']['INVX1']['pin']['Y']['timing'][0]
+        tableDic = timingDic['table_type']['cell_rise']
+        numpyTableDic = numpyTimingDic['table_type']['cell_rise']
+
+        self.assertIsInstance(numpyTableDic['index_1'], numpy.ndarray)
+        numpy.testing.assert_array_equal(numpyTableDic['index_1'], libertyParser.decodeTableIndex(tableDic['index_1']))
+        numpy.testing.assert_array_equal(numpyTableDic['index_2'], libertyParser.decodeTableIndex(tableDic['index_2']))
+        self.assertEqual(numpyTableDic['values'].shape, (len(numpyTableDic['index_1']), len(numpyTableDic['index_2'])))
+        numpy.testing.assert_array_equal(numpyTableDic['values'].reshape(-1), libertyParser.decodeTableValues(tableDic['values']).reshape(-1))
+
+
+if __name__ == '__main__':
+    unittest.main()
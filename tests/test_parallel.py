@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import os
+import gzip
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testParallel(libertyTestCase):
+    def test_parallel(self):
+        libFile = self.copyLib()
+
+        self.assertSameLibDic(libertyParser.libertyParser(libFile, jobs=2).libDic, libertyParser.libertyParser(libFile).libDic)
+
+    def test_compressed(self):
+        # Compressed liberty file is parsed on serial mode (no cell index is generated).
+        gzipLibFile = os.path.join(self.tempDir, 'example.lib.gz')
+
+        with gzip.open(gzipLibFile, 'wt') as GF:
+            GF.write(self.readLib())
+
+        self.assertSameLibDic(libertyParser.libertyParser(gzipLibFile, jobs=2).libDic, libertyParser.libertyParser(gzipLibFile).libDic)
+        self.assertFalse(os.path.exists(gzipLibFile + '.index'))
+
+
+if __name__ == '__main__':
+    unittest.main()
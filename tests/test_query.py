@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+QUOTED_LIB = '''library (quoted) {
+  time_unit : "1ns" ;
+  cell ("AND2") {
+    area : 2 ;
+    pin ("A") {
+      direction : input ;
+    }
+    pin (Y) {
+      direction : output ;
+    }
+  }
+  cell (INV) {
+    area : 1 ;
+    pin (A) {
+      direction : input ;
+    }
+  }
+}
+'''
+
+
+class testQuery(libertyTestCase):
+    def test_quoted_cell_name(self):
+        myLibertyParser = libertyParser.libertyParser(self.writeLib('quoted.lib', QUOTED_LIB))
+
+        for queryString in ('cell[name=AND2]', 'cell[name="AND2"]', 'cell[name=~"AND.*"]'):
+            self.assertEqual([cellGroupDic['name'] for cellGroupDic in myLibertyParser.query(queryString)], ['"AND2"'])
+
+        self.assertEqual([pinGroupDic['name'] for pinGroupDic in myLibertyParser.query('cell[name=AND2]/pin')], ['"A"', 'Y'])
+        self.assertEqual([pinGroupDic['name'] for pinGroupDic in myLibertyParser.query('cell[name=AND2]/pin[name=A]')], ['"A"'])
+        self.assertEqual(myLibertyParser.query('cell[name=INV]/pin[name=A]/@direction'), ['input '])
+        self.assertEqual(myLibertyParser.query('cell[name=NAND2]'), [])
+
+    def test_query_matches_scan(self):
+        myLibertyParser = libertyParser.libertyParser(self.copyLib())
+        pinList = []
+
+        for cellGroupDic in myLibertyParser.libDic['group']:
+            if (cellGroupDic['type'] == 'cell') and (cellGroupDic['name'] == 'INVX1'):
+                pinList = [groupDic for groupDic in cellGroupDic['group'] if groupDic['type'] == 'pin']
+
+        self.assertTrue(pinList)
+        self.assertEqual(myLibertyParser.query('cell[name=INVX1]/pin'), pinList)
+        self.assertEqual(myLibertyParser.query('cell[name=INVX1]/pin[name=Y]'), [pinGroupDic for pinGroupDic in pinList if pinGroupDic['name'] == 'Y'])
+
+
+    def test_filters(self):
+        myLibertyParser = libertyParser.libertyParser(self.writeLib('quoted.lib', QUOTED_LIB))
+
+        self.assertEqual([pinGroupDic['name'] for pinGroupDic in myLibertyParser.query('cell/pin[direction=input]')], ['"A"', 'A'])
+        self.assertEqual([pinGroupDic['name'] for pinGroupDic in myLibertyParser.query('cell/pin[direction!=input]')], ['Y'])
+        self.assertEqual([pinGroupDic['name'] for pinGroupDic in myLibertyParser.query('*/pin[direction]')], ['"A"', 'Y', 'A'])
+        self.assertEqual(myLibertyParser.query('cell/@area', withPath=True), [((('cell', '"AND2"'),), '2 '), ((('cell', 'INV'),), '1 ')])
+        self.assertEqual(myLibertyParser.queryBatch(['cell/@area', 'cell[name=INV]/pin/@direction']), [['2 ', '1 '], ['input ']])
+
+
+if __name__ == '__main__':
+    unittest.main()
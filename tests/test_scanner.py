@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+STATEMENT_LIB = '''library (statement) {
+  foo : 1 ;
+  bar : 2;
+  baz : "x" /* c */ ;
+  qux : 3 ; /* trailing */
+  multi : "a, \\
+    b" ;
+  /* comment
+     lines */ cell (A) { area : 4   ; pin (Y) {
+      direction : output ;
+      function : "A/*B" ;
+      }
+    index_1 ("1, 2") ;
+  }
+}
+'''
+
+
+class testScanner(libertyTestCase):
+    def test_attribute_values(self):
+        # Attribute values are kept as the line based parser, with the white spaces and comments before ";".
+        libDic = libertyParser.libertyParser(self.writeLib('statement.lib', STATEMENT_LIB)).libDic
+        cellDic = libDic['group'][0]
+        pinDic = cellDic['group'][0]
+
+        self.assertEqual([libDic[key] for key in ('foo', 'bar', 'baz', 'qux', 'multi')], ['1 ', '2', '"x" /* c */ ', '3 ', '"a,     b" '])
+        self.assertEqual((cellDic['name'], cellDic['area'], cellDic['index_1']), ('A', '4   ', '("1, 2")'))
+        self.assertEqual((pinDic['direction'], pinDic['function']), ('output ', '"A/*B" '))
+
+    def test_chunks(self):
+        # Statements can be split anywhere between the text chunks.
+        eventList = list(libertyParser.libertyTextEvents([STATEMENT_LIB]))
+
+        for chunkSize in (1, 2, 3, 7, 64):
+            chunkList = [STATEMENT_LIB[i:i + chunkSize] for i in range(0, len(STATEMENT_LIB), chunkSize)]
+            self.assertEqual(list(libertyParser.libertyTextEvents(chunkList)), eventList)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import threading
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testServer(libertyTestCase):
+    def test_client(self):
+        libFile = self.copyLib()
+        socketFile = os.path.join(self.tempDir, 'server.sock')
+        myLibertyServer = libertyParser.libertyServer(socketFile)
+        serverThread = threading.Thread(target=myLibertyServer.serve, daemon=True)
+        serverThread.start()
+
+        try:
+            for i in range(100):
+                if os.path.exists(socketFile):
+                    break
+
+                time.sleep(0.05)
+
+            with libertyParser.libertyClient(socketFile, libFile) as myLibertyClient:
+                myLibertyParser = libertyParser.libertyParser(libFile)
+
+                self.assertEqual(myLibertyClient.getCellList(), ['DFFX1', 'INVX1', 'NOR2X1'])
+                self.assertEqual(myLibertyClient.getCellArea(['INVX1']), {'INVX1': '0'})
+                self.assertEqual(myLibertyClient.getLibPinInfo(cellList=['INVX1']), myLibertyParser.getLibPinInfo(cellList=['INVX1']))
+
+            # Errors of the server are raised as libertyParserError on the client.
+            with libertyParser.libertyClient(socketFile, os.path.join(self.tempDir, 'missing.lib')) as myLibertyClient:
+                with self.assertRaises(libertyParser.libertyParserError):
+                    myLibertyClient.getCellList()
+        finally:
+            myLibertyServer.shutdown()
+            serverThread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
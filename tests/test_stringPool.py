@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase, getCellList
+
+
+class testStringPool(libertyTestCase):
+    def test_dedup(self):
+        libFile = self.copyLib()
+        libDic = libertyParser.libertyParser(libFile).libDic
+
+        for parserOptionDic in ({'dedup': True}, {'dedup': True, 'jobs': 2}):
+            with self.subTest(**parserOptionDic):
+                myLibertyParser = libertyParser.libertyParser(libFile, **parserOptionDic)
+                stringPoolDic = myLibertyParser.metrics['string_pool']
+
+                self.assertSameLibDic(myLibertyParser.libDic, libDic)
+                self.assertGreater(stringPoolDic['hits'], 0)
+                self.assertGreater(stringPoolDic['saved_bytes'], 0)
+
+                # The same attribute values are one string object (only on every worker on parallel mode).
+                if 'jobs' in parserOptionDic:
+                    continue
+
+                directionList = [pinGroupDic['direction'] for cellGroupDic in getCellList(myLibertyParser.libDic) for pinGroupDic in cellGroupDic['group'] if pinGroupDic['type'] == 'pin']
+                self.assertEqual(len(set(map(id, directionList))), len(set(directionList)))
+
+    def test_default(self):
+        self.assertNotIn('string_pool', libertyParser.libertyParser(self.copyLib()).metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
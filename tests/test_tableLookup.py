@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+numpy = libertyParser.numpy
+
+TEMPLATE_DIC = {
+                'delay': {'variable_1': 'input_net_transition ', 'variable_2': 'total_output_net_capacitance '},
+                'swapped': {'variable_1': 'total_output_net_capacitance ', 'variable_2': 'input_net_transition '},
+                'transition': {'variable_1': 'input_net_transition '},
+                'load': {'variable_1': 'total_output_net_capacitance '},
+               }
+
+
+def getValue(transition, load):
+    # Bilinear interpolation and linear extrapolation of a (bi)linear function are exact.
+    return 1 + 2 * transition + 3 * load + 4 * transition * load
+
+
+def getIndexString(indexList):
+    return '("' + ', '.join([str(index) for index in indexList]) + '")'
+
+
+def getValuesString(rowList):
+    return '(' + ', '.join(['"' + ', '.join([str(value) for value in row]) + '"' for row in rowList]) + ')'
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed.')
+class testTableLookup(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.transitionList = [0.1, 0.2, 0.4]
+        self.loadList = [0.01, 0.02, 0.04, 0.08]
+        self.transitionArray = numpy.array([0.15, 0.4, 0.05, 0.6, 0.3])
+        self.loadArray = numpy.array([0.03, 0.01, 0.005, 0.1, 0.05])
+
+    def getTable(self, templateName, index1List, index2List, valueFunction):
+        tableDic = {'template_name': templateName, 'index_1': getIndexString(index1List)}
+
+        if index2List is None:
+            tableDic['values'] = getValuesString([[valueFunction(index1) for index1 in index1List]])
+        else:
+            tableDic['index_2'] = getIndexString(index2List)
+            tableDic['values'] = getValuesString([[valueFunction(index1, index2) for index2 in index2List] for index1 in index1List])
+
+        return tableDic
+
+    def test_lookup(self):
+        # Interpolation and extrapolation, variable_1/variable_2 on both orders, 1-D tables.
+        tableList = [
+                     self.getTable('delay', self.transitionList, self.loadList, getValue),
+                     self.getTable('swapped', self.loadList, self.transitionList, lambda load, transition: getValue(transition, load)),
+                     self.getTable('transition', self.transitionList, None, lambda transition: getValue(transition, 0)),
+                     self.getTable('load', self.loadList, None, lambda load: getValue(0, load)),
+                    ]
+        myTableLookup = libertyParser.tableLookup(list(range(len(tableList))), tableList, TEMPLATE_DIC)
+        resultArray = myTableLookup.lookup(self.transitionArray, self.loadArray)
+
+        self.assertEqual(resultArray.shape, (4, 5))
+        numpy.testing.assert_allclose(resultArray[0], getValue(self.transitionArray, self.loadArray))
+        numpy.testing.assert_allclose(resultArray[1], getValue(self.transitionArray, self.loadArray))
+        numpy.testing.assert_allclose(resultArray[2], getValue(self.transitionArray, 0))
+        numpy.testing.assert_allclose(resultArray[3], getValue(0, self.loadArray))
+        numpy.testing.assert_allclose(myTableLookup.lookup(0.2, 0.02)[:, 0], [getValue(0.2, 0.02), getValue(0.2, 0.02), getValue(0.2, 0), getValue(0, 0.02)])
+
+    def test_repeated_index(self):
+        # Zero-width segments (repeated index points) do not divide by zero.
+        tableList = [self.getTable('delay', [0.1, 0.1, 0.4], [0.01, 0.02, 0.02], getValue)]
+        myTableLookup = libertyParser.tableLookup([0], tableList, TEMPLATE_DIC)
+
+        with numpy.errstate(all='raise'):
+            resultArray = myTableLookup.lookup([0.05, 0.1, 0.2, 0.5], [0.015, 0.03, 0.02, 0.005])
+
+        numpy.testing.assert_allclose(resultArray[0], [getValue(0.1, 0.015), getValue(0.1, 0.02), getValue(0.2, 0.02), getValue(0.5, 0.005)])
+
+
+if __name__ == '__main__':
+    unittest.main()
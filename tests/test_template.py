@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+TEMPLATE_LIB = '''library (template) {
+  lu_table_template (delay) {
+    variable_1 : input_net_transition ;
+    variable_2 : total_output_net_capacitance ;
+    index_1 ("0.1, 0.2") ;
+    index_2 ("0.01, 0.02") ;
+  }
+  power_lut_template (power) {
+    variable_1 : input_transition_time ;
+    index_1 ("0.1, 0.2") ;
+  }
+  cell (INV) {
+    pin (Y) {
+      direction : output ;
+      timing () {
+        related_pin : "A" ;
+        cell_rise (delay) {
+          index_2 ("0.01, 0.03") ;
+          values ("1, 2", "3, 4") ;
+        }
+      }
+      internal_power () {
+        related_pin : "A" ;
+        rise_power (power) {
+          values ("0.5, 0.6") ;
+        }
+      }
+    }
+  }
+}
+'''
+
+
+class testTemplate(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.libFile = self.writeLib('template.lib', TEMPLATE_LIB)
+
+    def getTables(self, myLibertyParser, withTemplate):
+        pinDic = myLibertyParser.getLibPinInfo(withTemplate=withTemplate)['cell']['INV']['pin']['Y']
+        return (pinDic['timing'][0]['table_type']['cell_rise'], pinDic['internal_power'][0]['table_type']['rise_power'])
+
+    def test_template_info(self):
+        templateDic = libertyParser.libertyParser(self.libFile).getTemplateInfo()
+
+        self.assertEqual(list(templateDic.keys()), ['delay', 'power'])
+        self.assertEqual(templateDic['delay']['type'], 'lu_table_template')
+        self.assertEqual(templateDic['delay']['index_1'], '("0.1, 0.2")')
+
+    def test_default_tables(self):
+        # The tables only have the keys on the liberty file by default (internal_power tables without template_name).
+        (timingTableDic, powerTableDic) = self.getTables(libertyParser.libertyParser(self.libFile), False)
+
+        self.assertEqual(dict(timingTableDic), {'template_name': 'delay', 'index_2': '("0.01, 0.03")', 'values': '("1, 2", "3, 4")'})
+        self.assertEqual(dict(powerTableDic), {'values': '("0.5, 0.6")'})
+
+    def test_with_template(self):
+        (timingTableDic, powerTableDic) = self.getTables(libertyParser.libertyParser(self.libFile), True)
+
+        self.assertEqual(dict(timingTableDic), {'template_name': 'delay', 'index_1': '("0.1, 0.2")', 'index_2': '("0.01, 0.03")', 'values': '("1, 2", "3, 4")'})
+        self.assertEqual(dict(powerTableDic), {'template_name': 'power', 'index_1': '("0.1, 0.2")', 'values': '("0.5, 0.6")'})
+
+    @unittest.skipIf(libertyParser.numpy is None, 'numpy is not installed.')
+    def test_numpy_axis(self):
+        # On numpyTable mode, the same indexes share one read-only array.
+        myLibertyParser = libertyParser.libertyParser(self.libFile, numpyTable=True)
+        (timingTableDic, powerTableDic) = self.getTables(myLibertyParser, True)
+
+        self.assertIs(timingTableDic['index_1'], powerTableDic['index_1'])
+        self.assertFalse(timingTableDic['index_1'].flags.writeable)
+        self.assertEqual(timingTableDic['values'].shape, (2, 2))
+        self.assertEqual(powerTableDic['values'].tolist(), [0.5, 0.6])
+
+
+if __name__ == '__main__':
+    unittest.main()
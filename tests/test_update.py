@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testUpdate(libertyTestCase):
+    def test_update(self):
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        newLibString = libString.replace('area : ', 'area : 12', 1)
+
+        for parserOptionDic in ({'incremental': True}, {'incremental': True, 'compact': True}, {'lazy': True}):
+            with self.subTest(**parserOptionDic):
+                self.rewriteLib(libFile, libString)
+                myLibertyParser = libertyParser.libertyParser(libFile, **parserOptionDic)
+                self.rewriteLib(libFile, newLibString)
+                updateDic = myLibertyParser.update()
+
+                self.assertEqual(updateDic['changed'], ['DFFX1'])
+                self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+    def test_added_removed(self):
+        libFile = self.copyLib()
+        libString = self.readLib(libFile)
+        myLibertyParser = libertyParser.libertyParser(libFile, incremental=True)
+        firstCellStart = libString.index('  cell (')
+        secondCellStart = libString.index('  cell (', firstCellStart + 1)
+
+        # Remove the first cell, then add it back on the end.
+        self.rewriteLib(libFile, libString[:firstCellStart] + libString[secondCellStart:])
+        self.assertEqual(myLibertyParser.update(), {'added': [], 'removed': ['DFFX1'], 'changed': []})
+        self.assertEqual(myLibertyParser.getCellList(), ['INVX1', 'NOR2X1'])
+
+        libEnd = libString.rindex('}')
+        self.rewriteLib(libFile, libString[:firstCellStart] + libString[secondCellStart:libEnd] + libString[firstCellStart:secondCellStart] + libString[libEnd:])
+        self.assertEqual(myLibertyParser.update(), {'added': ['DFFX1'], 'removed': [], 'changed': []})
+        self.assertSameLibDic(myLibertyParser.libDic, libertyParser.libertyParser(libFile).libDic)
+
+        # Not changed.
+        self.assertEqual(myLibertyParser.update(), {'added': [], 'removed': [], 'changed': []})
+
+
+if __name__ == '__main__':
+    unittest.main()
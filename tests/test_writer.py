@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+import os
+import io
+import unittest
+
+from libertyTest import libertyParser, libertyTestCase
+
+
+class testWriter(libertyTestCase):
+    def setUp(self):
+        libertyTestCase.setUp(self)
+        self.myLibertyParser = libertyParser.libertyParser(self.copyLib())
+
+    def test_restore_lib(self):
+        restoreLibFile = os.path.join(self.tempDir, 'restore.lib')
+        self.myLibertyParser.restoreLib(restoreLibFile)
+
+        self.assertSameLibDic(libertyParser.libertyParser(restoreLibFile).libDic, self.myLibertyParser.libDic)
+
+    def test_compressed_output(self):
+        stringIO = io.StringIO()
+
+        with libertyParser.libertyWriter(stringIO) as LW:
+            LW.writeGroup(self.myLibertyParser.libDic)
+
+        for extension in ('.gz', '.bz2', '.xz'):
+            with self.subTest(extension=extension):
+                outputFile = os.path.join(self.tempDir, 'restore.lib' + extension)
+
+                with libertyParser.libertyWriter(outputFile) as LW:
+                    LW.writeGroup(self.myLibertyParser.libDic)
+
+                with libertyParser.openLibFile(outputFile, 'r') as LF:
+                    self.assertEqual(LF.read(), stringIO.getvalue())
+
+                self.assertSameLibDic(libertyParser.libertyParser(outputFile).libDic, self.myLibertyParser.libDic)
+
+    def test_cell_list(self):
+        outputFile = os.path.join(self.tempDir, 'INVX1.lib')
+
+        with libertyParser.libertyWriter(outputFile) as LW:
+            LW.writeGroup(self.myLibertyParser.libDic, ['INVX1'])
+
+        self.assertEqual(libertyParser.libertyParser(outputFile).getCellList(), ['INVX1'])
+
+
+if __name__ == '__main__':
+    unittest.main()